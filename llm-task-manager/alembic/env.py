@@ -6,6 +6,7 @@ afin de rester cohérent avec la configuration FastAPI (prod / dev).
 """
 
 from logging.config import fileConfig
+from typing import Any, Optional
 
 from alembic import context
 from sqlalchemy import engine_from_config, pool
@@ -36,6 +37,17 @@ from app.models.domain import (  # noqa: F401,E402
 target_metadata = SQLModel.metadata
 
 
+def include_object(
+    obj: Any, name: Optional[str], type_: str, reflected: bool, compare_to: Any
+) -> bool:
+    """
+    Exclut de l'autogénération la table virtuelle FTS5 ``search_fts`` et ses
+    tables internes (SQLite) : créées par la migration de l'index de
+    recherche, absentes des modèles, elles seraient sinon supprimées.
+    """
+    return not (type_ == "table" and reflected and (name or "").startswith("search_fts"))
+
+
 def run_migrations_offline() -> None:
     """
     Run migrations in 'offline' mode (génère du SQL sans connexion).
@@ -46,6 +58,7 @@ def run_migrations_offline() -> None:
         target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
+        include_object=include_object,
     )
     with context.begin_transaction():
         context.run_migrations()
@@ -69,6 +82,7 @@ def run_migrations_online() -> None:
         context.configure(
             connection=connection,
             target_metadata=target_metadata,
+            include_object=include_object,
         )
         with context.begin_transaction():
             context.run_migrations()
@@ -0,0 +1,259 @@
+"""add full-text search index
+
+Revision ID: 05111701a67d
+Revises: 2d9199b81b11
+Create Date: 2026-10-16 21:10:00.000000
+
+Table ``search_entries`` + index plein texte (tsvector/GIN sur PostgreSQL,
+FTS5 sur SQLite) maintenu par triggers, puis indexation des données
+existantes. Cf. ``app.models.search_index``.
+
+Les DDL et la reconstruction sont figés ici, tels qu'à cette révision : la
+migration ne dépend pas du code applicatif, qui peut évoluer ensuite.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+
+# revision identifiers, used by Alembic.
+revision: str = '05111701a67d'
+down_revision: Union[str, None] = '2d9199b81b11'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (table source, entity_type, expression du corps à l'insertion, colonnes suivies)
+_INDEXED_TABLES = (
+    ("stories", "story", "''", ("title", "project_id")),
+    ("epics", "epic", "''", ("title", "project_id")),
+    ("documents", "document", "NEW.content", ("title", "content", "project_id")),
+)
+
+_DESCRIPTION_BODY = "NEW.description || ' ' || COALESCE(NEW.acceptance_criteria, '')"
+
+
+# ---------------------------------------------------------------------------
+# SQLite (FTS5)
+# ---------------------------------------------------------------------------
+
+
+def _sqlite_statements() -> list[str]:
+    statements = [
+        """
+        CREATE VIRTUAL TABLE IF NOT EXISTS search_fts USING fts5(
+            title, body,
+            content='search_entries', content_rowid='id',
+            tokenize='unicode61 remove_diacritics 2'
+        )
+        """,
+        # Synchronisation search_entries -> search_fts (external content)
+        """
+        CREATE TRIGGER IF NOT EXISTS search_entries_ai AFTER INSERT ON search_entries BEGIN
+            INSERT INTO search_fts (rowid, title, body) VALUES (NEW.id, NEW.title, NEW.body);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS search_entries_ad AFTER DELETE ON search_entries BEGIN
+            INSERT INTO search_fts (search_fts, rowid, title, body)
+            VALUES ('delete', OLD.id, OLD.title, OLD.body);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS search_entries_au AFTER UPDATE ON search_entries BEGIN
+            INSERT INTO search_fts (search_fts, rowid, title, body)
+            VALUES ('delete', OLD.id, OLD.title, OLD.body);
+            INSERT INTO search_fts (rowid, title, body) VALUES (NEW.id, NEW.title, NEW.body);
+        END
+        """,
+    ]
+
+    # Synchronisation tables sources -> search_entries
+    for table, entity_type, body, columns in _INDEXED_TABLES:
+        body_update = ", body = NEW.content" if "content" in columns else ""
+        statements += [
+            f"""
+            CREATE TRIGGER IF NOT EXISTS {table}_search_ai AFTER INSERT ON {table} BEGIN
+                INSERT INTO search_entries (entity_type, entity_id, project_id, title, body)
+                VALUES ('{entity_type}', NEW.id, NEW.project_id, NEW.title, {body});
+            END
+            """,
+            f"""
+            CREATE TRIGGER IF NOT EXISTS {table}_search_au
+            AFTER UPDATE OF {", ".join(columns)} ON {table} BEGIN
+                UPDATE search_entries
+                SET project_id = NEW.project_id, title = NEW.title{body_update}
+                WHERE entity_id = NEW.id;
+            END
+            """,
+            f"""
+            CREATE TRIGGER IF NOT EXISTS {table}_search_ad AFTER DELETE ON {table} BEGIN
+                DELETE FROM search_entries WHERE entity_id = OLD.id;
+            END
+            """,
+        ]
+
+    statements += [
+        f"""
+        CREATE TRIGGER IF NOT EXISTS story_descriptions_search_ai
+        AFTER INSERT ON story_descriptions BEGIN
+            UPDATE search_entries SET body = {_DESCRIPTION_BODY} WHERE entity_id = NEW.story_id;
+        END
+        """,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS story_descriptions_search_au
+        AFTER UPDATE OF description, acceptance_criteria ON story_descriptions BEGIN
+            UPDATE search_entries SET body = {_DESCRIPTION_BODY} WHERE entity_id = NEW.story_id;
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS story_descriptions_search_ad
+        AFTER DELETE ON story_descriptions BEGIN
+            UPDATE search_entries SET body = '' WHERE entity_id = OLD.story_id;
+        END
+        """,
+    ]
+    return statements
+
+
+# ---------------------------------------------------------------------------
+# PostgreSQL (tsvector + GIN)
+# ---------------------------------------------------------------------------
+
+
+def _postgresql_statements() -> list[str]:
+    statements = [
+        """
+        ALTER TABLE search_entries ADD COLUMN IF NOT EXISTS tsv tsvector
+        GENERATED ALWAYS AS (
+            setweight(to_tsvector('simple', coalesce(title, '')), 'A')
+            || setweight(to_tsvector('simple', coalesce(body, '')), 'B')
+        ) STORED
+        """,
+        "CREATE INDEX IF NOT EXISTS ix_search_entries_tsv ON search_entries USING GIN (tsv)",
+    ]
+
+    for table, entity_type, body, columns in _INDEXED_TABLES:
+        body_update = ", body = EXCLUDED.body" if "content" in columns else ""
+        statements += [
+            f"""
+            CREATE OR REPLACE FUNCTION {table}_search_sync() RETURNS trigger AS $$
+            BEGIN
+                IF TG_OP = 'DELETE' THEN
+                    DELETE FROM search_entries WHERE entity_id = OLD.id;
+                    RETURN OLD;
+                END IF;
+                INSERT INTO search_entries (entity_type, entity_id, project_id, title, body)
+                VALUES ('{entity_type}', NEW.id, NEW.project_id, NEW.title, {body})
+                ON CONFLICT (entity_id) DO UPDATE
+                SET project_id = EXCLUDED.project_id, title = EXCLUDED.title{body_update};
+                RETURN NEW;
+            END
+            $$ LANGUAGE plpgsql
+            """,
+            f"DROP TRIGGER IF EXISTS {table}_search_sync ON {table}",
+            f"""
+            CREATE TRIGGER {table}_search_sync
+            AFTER INSERT OR DELETE OR UPDATE OF {", ".join(columns)} ON {table}
+            FOR EACH ROW EXECUTE FUNCTION {table}_search_sync()
+            """,
+        ]
+
+    statements += [
+        f"""
+        CREATE OR REPLACE FUNCTION story_descriptions_search_sync() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'DELETE' THEN
+                UPDATE search_entries SET body = '' WHERE entity_id = OLD.story_id;
+                RETURN OLD;
+            END IF;
+            UPDATE search_entries SET body = {_DESCRIPTION_BODY} WHERE entity_id = NEW.story_id;
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql
+        """,
+        "DROP TRIGGER IF EXISTS story_descriptions_search_sync ON story_descriptions",
+        """
+        CREATE TRIGGER story_descriptions_search_sync
+        AFTER INSERT OR DELETE OR UPDATE OF description, acceptance_criteria
+        ON story_descriptions
+        FOR EACH ROW EXECUTE FUNCTION story_descriptions_search_sync()
+        """,
+    ]
+    return statements
+
+
+def _install(connection: Connection) -> None:
+    if connection.dialect.name == "sqlite":
+        statements = _sqlite_statements()
+    elif connection.dialect.name == "postgresql":
+        statements = _postgresql_statements()
+    else:
+        return
+    for statement in statements:
+        connection.execute(text(statement))
+
+
+def _rebuild(connection: Connection) -> None:
+    connection.execute(text("DELETE FROM search_entries"))
+    if connection.dialect.name == "sqlite":
+        connection.execute(text("INSERT INTO search_fts (search_fts) VALUES ('delete-all')"))
+    connection.execute(
+        text(
+            """
+            INSERT INTO search_entries (entity_type, entity_id, project_id, title, body)
+            SELECT 'story', s.id, s.project_id, s.title,
+                   COALESCE(d.description || ' ' || COALESCE(d.acceptance_criteria, ''), '')
+            FROM stories s LEFT JOIN story_descriptions d ON d.story_id = s.id
+            UNION ALL
+            SELECT 'epic', e.id, e.project_id, e.title, '' FROM epics e
+            UNION ALL
+            SELECT 'document', doc.id, doc.project_id, doc.title, doc.content FROM documents doc
+            """
+        )
+    )
+
+
+def _uninstall(connection: Connection) -> None:
+    if connection.dialect.name == "sqlite":
+        triggers = ["search_entries_ai", "search_entries_ad", "search_entries_au"]
+        for table in [t for t, *_ in _INDEXED_TABLES] + ["story_descriptions"]:
+            triggers += [f"{table}_search_ai", f"{table}_search_au", f"{table}_search_ad"]
+        for trigger in triggers:
+            connection.execute(text(f"DROP TRIGGER IF EXISTS {trigger}"))
+        connection.execute(text("DROP TABLE IF EXISTS search_fts"))
+    elif connection.dialect.name == "postgresql":
+        for table, *_ in _INDEXED_TABLES:
+            connection.execute(text(f"DROP FUNCTION IF EXISTS {table}_search_sync() CASCADE"))
+        connection.execute(
+            text("DROP FUNCTION IF EXISTS story_descriptions_search_sync() CASCADE")
+        )
+
+
+
+def upgrade() -> None:
+    op.create_table('search_entries',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('entity_type', sqlmodel.sql.sqltypes.AutoString(length=20), nullable=False),
+    sa.Column('entity_id', sa.Uuid(), nullable=False),
+    sa.Column('project_id', sa.Uuid(), nullable=False),
+    sa.Column('title', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+    sa.Column('body', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('entity_id')
+    )
+    op.create_index(op.f('ix_search_entries_project_id'), 'search_entries', ['project_id'], unique=False)
+
+    connection = op.get_bind()
+    _install(connection)
+    _rebuild(connection)
+
+
+def downgrade() -> None:
+    _uninstall(op.get_bind())
+    op.drop_index(op.f('ix_search_entries_project_id'), table_name='search_entries')
+    op.drop_table('search_entries')
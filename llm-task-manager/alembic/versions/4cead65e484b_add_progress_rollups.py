@@ -0,0 +1,58 @@
+"""add progress rollups
+
+Revision ID: 4cead65e484b
+Revises: 05111701a67d
+Create Date: 2026-10-16 22:40:00.000000
+
+Table ``progress_rollups`` (stories et story points par statut, pour
+chaque epic et chaque sprint), puis calcul initial depuis les données
+existantes. Cf. ``app.services.rollups``.
+
+Le calcul initial est figé ici en SQL, tel qu'à cette révision : la
+migration ne dépend pas du code des services, qui peut évoluer ensuite.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4cead65e484b'
+down_revision: Union[str, None] = '05111701a67d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Stories par statut de chaque epic, et stories actives de chaque sprint
+_BACKFILL = """
+INSERT INTO progress_rollups (scope_type, scope_id, status, story_count, story_points)
+SELECT 'epic', s.epic_id, s.status, COUNT(*), COALESCE(SUM(s.story_points), 0)
+FROM stories s
+WHERE s.epic_id IS NOT NULL
+GROUP BY s.epic_id, s.status
+UNION ALL
+SELECT 'sprint', h.sprint_id, s.status, COUNT(*), COALESCE(SUM(s.story_points), 0)
+FROM story_sprint_history h JOIN stories s ON s.id = h.story_id
+WHERE h.is_active
+GROUP BY h.sprint_id, s.status
+"""
+
+
+def upgrade() -> None:
+    op.create_table('progress_rollups',
+    sa.Column('scope_type', sqlmodel.sql.sqltypes.AutoString(length=10), nullable=False),
+    sa.Column('scope_id', sa.Uuid(), nullable=False),
+    sa.Column('status', postgresql.ENUM('BACKLOG', 'TODO', 'IN_PROGRESS', 'IN_REVIEW', 'DONE', name='story_status', create_type=False), nullable=False),
+    sa.Column('story_count', sa.Integer(), nullable=False),
+    sa.Column('story_points', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('scope_type', 'scope_id', 'status')
+    )
+
+    op.execute(sa.text(_BACKFILL))
+
+
+def downgrade() -> None:
+    op.drop_table('progress_rollups')
@@ -0,0 +1,79 @@
+"""unique active sprint link per story
+
+Revision ID: 69ff2dbde3c1
+Revises: 4cead65e484b
+Create Date: 2026-10-17 09:15:00.000000
+
+Index unique partiel ``story_sprint_history(story_id) WHERE is_active`` :
+une story n'est active que dans un seul sprint, garanti par la base. Les
+doublons actifs éventuels sont d'abord désactivés (seul le lien le plus
+récent est conservé), puis les rollups recalculés.
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '69ff2dbde3c1'
+down_revision: Union[str, None] = '4cead65e484b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Seul le lien actif le plus récent de chaque story est conservé
+_DEACTIVATE_DUPLICATES = """
+UPDATE story_sprint_history
+SET is_active = FALSE, removed_at = CURRENT_TIMESTAMP
+WHERE is_active AND EXISTS (
+    SELECT 1 FROM story_sprint_history AS newer
+    WHERE newer.story_id = story_sprint_history.story_id
+      AND newer.is_active
+      AND (
+          newer.added_at > story_sprint_history.added_at
+          OR (newer.added_at = story_sprint_history.added_at
+              AND newer.id > story_sprint_history.id)
+      )
+)
+"""
+
+# Recalcul complet des rollups (stories par statut de chaque epic, et
+# stories actives de chaque sprint)
+_REBUILD_ROLLUPS = (
+    "DELETE FROM progress_rollups",
+    """
+    INSERT INTO progress_rollups (scope_type, scope_id, status, story_count, story_points)
+    SELECT 'epic', s.epic_id, s.status, COUNT(*), COALESCE(SUM(s.story_points), 0)
+    FROM stories s
+    WHERE s.epic_id IS NOT NULL
+    GROUP BY s.epic_id, s.status
+    UNION ALL
+    SELECT 'sprint', h.sprint_id, s.status, COUNT(*), COALESCE(SUM(s.story_points), 0)
+    FROM story_sprint_history h JOIN stories s ON s.id = h.story_id
+    WHERE h.is_active
+    GROUP BY h.sprint_id, s.status
+    """,
+)
+
+
+def upgrade() -> None:
+    connection = op.get_bind()
+    result = connection.execute(sa.text(_DEACTIVATE_DUPLICATES))
+    # Hors ligne (``--sql``), le nombre de lignes est inconnu : toujours reconstruire
+    if context.is_offline_mode() or result.rowcount:
+        for statement in _REBUILD_ROLLUPS:
+            connection.execute(sa.text(statement))
+
+    op.create_index(
+        'uq_story_sprint_history_active',
+        'story_sprint_history',
+        ['story_id'],
+        unique=True,
+        postgresql_where=sa.text('is_active'),
+        sqlite_where=sa.text('is_active'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('uq_story_sprint_history_active', table_name='story_sprint_history')
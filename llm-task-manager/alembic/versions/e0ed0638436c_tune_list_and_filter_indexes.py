@@ -0,0 +1,67 @@
+"""tune list and filter indexes
+
+Revision ID: e0ed0638436c
+Revises: 69ff2dbde3c1
+Create Date: 2026-10-17 11:30:00.000000
+
+Supprime les index redondants (``id`` déjà indexé par la clé primaire,
+``is_active`` seul, peu sélectif) et crée des index composites alignés sur
+les requêtes réellement exécutées :
+- ``stories`` filtrées par statut / priorité / assignee, triées par
+  ``(created_at, id) DESC`` (pagination par curseur) ;
+- ``comments`` d'une cible, triés par ``(created_at, id)`` ;
+- ``story_sprint_history`` : stories actives d'un sprint.
+Plans d'exécution avant / après : ``python -m benchmarks.query_plans``.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e0ed0638436c'
+down_revision: Union[str, None] = '69ff2dbde3c1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+_PRIMARY_KEY_INDEXES = (
+    'projects',
+    'epics',
+    'stories',
+    'sprints',
+    'story_sprint_history',
+    'story_descriptions',
+    'comments',
+    'documents',
+)
+
+
+def upgrade() -> None:
+    for table in _PRIMARY_KEY_INDEXES:
+        op.drop_index(op.f(f'ix_{table}_id'), table_name=table)
+    op.drop_index(op.f('ix_story_sprint_history_is_active'), table_name='story_sprint_history')
+    op.drop_index(op.f('ix_story_sprint_history_sprint_id'), table_name='story_sprint_history')
+    op.drop_index(op.f('ix_comments_target_id'), table_name='comments')
+
+    op.create_index('ix_stories_created_at', 'stories', ['created_at', 'id'], unique=False)
+    op.create_index('ix_stories_status_created_at', 'stories', ['status', 'created_at', 'id'], unique=False)
+    op.create_index('ix_stories_priority_created_at', 'stories', ['priority', 'created_at', 'id'], unique=False)
+    op.create_index('ix_stories_assignee_created_at', 'stories', ['assignee', 'created_at', 'id'], unique=False)
+    op.create_index('ix_comments_target_created_at', 'comments', ['target_id', 'target_type', 'created_at', 'id'], unique=False)
+    op.create_index('ix_story_sprint_history_sprint_active', 'story_sprint_history', ['sprint_id', 'is_active', 'story_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_story_sprint_history_sprint_active', table_name='story_sprint_history')
+    op.drop_index('ix_comments_target_created_at', table_name='comments')
+    op.drop_index('ix_stories_assignee_created_at', table_name='stories')
+    op.drop_index('ix_stories_priority_created_at', table_name='stories')
+    op.drop_index('ix_stories_status_created_at', table_name='stories')
+    op.drop_index('ix_stories_created_at', table_name='stories')
+
+    op.create_index(op.f('ix_comments_target_id'), 'comments', ['target_id'], unique=False)
+    op.create_index(op.f('ix_story_sprint_history_sprint_id'), 'story_sprint_history', ['sprint_id'], unique=False)
+    op.create_index(op.f('ix_story_sprint_history_is_active'), 'story_sprint_history', ['is_active'], unique=False)
+    for table in _PRIMARY_KEY_INDEXES:
+        op.create_index(op.f(f'ix_{table}_id'), table, ['id'], unique=False)
@@ -8,11 +8,21 @@ Ce module exposera les routers FastAPI pour les entités :
 - sprints
 - commentaires
 - documents
+- recherche unifiée
 """
 
 from fastapi import APIRouter
 
-from app.api import comments, documents, epics, projects, sprints, stories, story_descriptions
+from app.api import (
+    comments,
+    documents,
+    epics,
+    projects,
+    search,
+    sprints,
+    stories,
+    story_descriptions,
+)
 
 router = APIRouter()
 
@@ -24,4 +34,5 @@ router.include_router(story_descriptions.router)
 router.include_router(sprints.router)
 router.include_router(comments.router)
 router.include_router(documents.router)
+router.include_router(search.router)
 
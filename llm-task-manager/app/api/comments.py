@@ -6,15 +6,20 @@ Endpoints (cf. ARCHITECTURE.md) :
 - GET  /v1/comments
 """
 
-from typing import List, Optional
+from typing import Optional
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlmodel import Session, select
 
-from app.db import get_db_session
+from app.api.conditional import not_modified, page_etag
+from app.api.serialization import page_response, resolve_fields
+from app.db import get_db_session, save
 from app.models import Comment
 from app.models import schemas as sch
 from app.models.domain import CommentTargetType
+from app.services import DomainError
+from app.services import projection
+from app.services.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, paginate
 
 
 router = APIRouter(prefix="/comments", tags=["comments"])
@@ -35,28 +40,37 @@ def add_comment(
         target_id=payload.target_id,
         content=payload.content,
     )
-    db.add(comment)
-    db.commit()
-    db.refresh(comment)
+    save(db, comment)
     return sch.CommentOut.model_validate(comment)
 
 
 @router.get(
     "",
-    response_model=List[sch.CommentOut],
+    response_model=sch.Page[sch.CommentOut],
 )
 def list_comments(
+    request: Request,
+    response: Response,
     project_id: Optional[str] = Query(default=None),
     target_type: Optional[CommentTargetType] = Query(default=None),
     target_id: Optional[str] = Query(default=None),
+    cursor: Optional[str] = Query(default=None),
+    limit: int = Query(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    view: sch.ResponseView = Query(default=sch.ResponseView.FULL),
+    fields: Optional[str] = Query(
+        default=None, description="Champs à renvoyer, séparés par des virgules (prioritaire sur view)."
+    ),
     db: Session = Depends(get_db_session),
-) -> list[sch.CommentOut]:
+) -> Response:
     """
     Liste les commentaires, avec filtres optionnels :
     - project_id
     - target_type (epic/story)
     - target_id
+
+    Les résultats sont paginés par curseur (``cursor`` / ``limit``).
     """
+    out_fields = resolve_fields(sch.CommentOut, view, fields)
     stmt = select(Comment)
     if project_id:
         stmt = stmt.where(Comment.project_id == project_id)
@@ -65,8 +79,16 @@ def list_comments(
     if target_id:
         stmt = stmt.where(Comment.target_id == target_id)
 
-    stmt = stmt.order_by(Comment.created_at.desc())
-    results = db.exec(stmt).all()
-    return [sch.CommentOut.model_validate(c) for c in results]
+    try:
+        page = paginate(db, projection.load_fields(stmt, Comment, out_fields), Comment, cursor, limit)
+    except DomainError as exc:
+        raise HTTPException(
+            status_code=exc.http_status,
+            detail={"code": exc.code, "message": exc.message},
+        ) from exc
+    unchanged = not_modified(request, response, page_etag(request, page, version_column=None))
+    if unchanged is not None:
+        return unchanged
+    return page_response(page, sch.CommentOut, response, fields=out_fields)
 
 
@@ -0,0 +1,76 @@
+"""
+Requêtes GET conditionnelles (``ETag`` / ``If-None-Match``).
+
+- Entité : l'ETag dérive de ``(type, id, updated_at)`` ; il est calculé à
+  partir du schéma de sortie, donc sans requête si l'entité est en cache.
+- Liste : l'ETag dérive des lignes de la page renvoyée (``id`` et
+  ``updated_at``), du curseur suivant et des paramètres de requête. Il est
+  calculé après la requête de page (keyset, bornée par ``limit``) mais avant
+  toute sérialisation : une ``304`` ne coûte ni encodage ni transfert, et
+  aucune requête d'agrégat ne parcourt l'ensemble filtré.
+
+Les ETags sont forts (pas de préfixe ``W/``) : ``updated_at`` est rafraîchi
+à chaque ``UPDATE`` (``onupdate`` sur les modèles).
+"""
+
+import hashlib
+from datetime import datetime
+from typing import Any, Optional
+
+from fastapi import Request, Response, status
+
+from app.services.pagination import Page
+
+
+def _digest(*parts: Any) -> str:
+    raw = "|".join(str(part) for part in parts)
+    return '"' + hashlib.sha256(raw.encode()).hexdigest()[:32] + '"'
+
+
+def entity_etag(kind: str, entity_id: Any, updated_at: datetime) -> str:
+    """ETag d'une entité à partir de sa date de dernière modification."""
+    return _digest(kind, entity_id, updated_at.isoformat())
+
+
+def page_etag(
+    request: Request,
+    page: Page[Any],
+    version_column: Optional[str] = "updated_at",
+) -> str:
+    """
+    ETag d'une page de liste : ``id`` et ``<version_column>`` de chaque ligne
+    (``None`` pour une entité non modifiable, ex. commentaire), curseur
+    suivant et paramètres de requête.
+
+    Toute modification, insertion ou suppression visible dans la page change
+    ses lignes, donc l'ETag ; les lignes hors de la page n'affectent pas la
+    représentation renvoyée.
+    """
+    rows = [
+        (obj.id, getattr(obj, version_column) if version_column else None)
+        for obj in page.items
+    ]
+    return _digest(
+        request.url.path, sorted(request.query_params.multi_items()), page.next_cursor, *rows
+    )
+
+
+def _matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+def not_modified(request: Request, response: Response, etag: str) -> Optional[Response]:
+    """
+    Positionne l'en-tête ``ETag`` et renvoie une réponse ``304`` si le client
+    possède déjà cette version (``If-None-Match``), ``None`` sinon.
+    """
+    response.headers["ETag"] = etag
+    if _matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    return None
+
+
+__all__ = ["entity_etag", "page_etag", "not_modified"]
@@ -12,12 +12,21 @@ Endpoints (cf. ARCHITECTURE.md) :
 from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlmodel import Session, select
 
-from app.db import get_db_session
+from app.api.conditional import entity_etag, not_modified, page_etag
+from app.api.serialization import model_response, page_response, resolve_fields
+from app.db import get_db_session, save
 from app.models import Document, DocumentTemplate
 from app.models import schemas as sch
+from app.models.domain import SearchEntityType
+from app.services import DomainError
+from app.services import projection
+from app.services import search as search_service
+from app.services.cache import entity_cache
+from app.services.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, paginate
+from app.services.search import DEFAULT_SEARCH_LIMIT, MAX_SEARCH_LIMIT
 
 
 router = APIRouter(prefix="/documents", tags=["documents"])
@@ -44,24 +53,48 @@ def create_document(
         content=content,
         template_key=payload.template_key,
     )
-    db.add(doc)
-    db.commit()
-    db.refresh(doc)
+    save(db, doc)
     return sch.DocumentOut.model_validate(doc)
 
 
+@router.get(
+    "/search",
+    response_model=List[sch.SearchHit],
+)
+def search_documents(
+    q: str = Query(..., min_length=1),
+    project_id: Optional[UUID] = Query(default=None),
+    limit: int = Query(default=DEFAULT_SEARCH_LIMIT, ge=1, le=MAX_SEARCH_LIMIT),
+    db: Session = Depends(get_db_session),
+) -> Response:
+    """
+    Recherche plein texte de documents (titre, contenu), classée par pertinence, avec extrait.
+
+    Déclarée avant ``/{document_id}`` pour ne pas être capturée par cette route.
+    """
+    hits = search_service.search(
+        db, q, entity_types=[SearchEntityType.DOCUMENT], project_id=project_id, limit=limit,
+    )
+    return model_response(hits)
+
+
 @router.get(
     "/{document_id}",
     response_model=sch.DocumentOut,
 )
 def get_document(
     document_id: UUID,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db_session),
-) -> sch.DocumentOut:
-    doc = db.get(Document, document_id)
+) -> sch.DocumentOut | Response:
+    doc = entity_cache.read_through(
+        "document", document_id, sch.DocumentOut, lambda: db.get(Document, document_id)
+    )
     if not doc:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Document not found")
-    return sch.DocumentOut.model_validate(doc)
+    etag = entity_etag("document", doc.id, doc.updated_at)
+    return not_modified(request, response, etag) or doc
 
 
 @router.patch(
@@ -81,45 +114,43 @@ def update_document(
     for field, value in update_data.items():
         setattr(doc, field, value)
 
-    db.add(doc)
-    db.commit()
-    db.refresh(doc)
+    save(db, doc)
     return sch.DocumentOut.model_validate(doc)
 
 
 @router.get(
     "",
-    response_model=List[sch.DocumentOut],
+    response_model=sch.Page[sch.DocumentOut],
 )
 def list_documents(
+    request: Request,
+    response: Response,
     project_id: Optional[UUID] = Query(default=None),
     template_key: Optional[str] = Query(default=None),
+    cursor: Optional[str] = Query(default=None),
+    limit: int = Query(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    view: sch.ResponseView = Query(default=sch.ResponseView.FULL),
+    fields: Optional[str] = Query(
+        default=None, description="Champs à renvoyer, séparés par des virgules (prioritaire sur view)."
+    ),
     db: Session = Depends(get_db_session),
-) -> list[sch.DocumentOut]:
-    """Liste les documents, avec filtres par projet et template."""
+) -> Response:
+    """Liste les documents, avec filtres par projet et template, paginés par curseur."""
+    out_fields = resolve_fields(sch.DocumentOut, view, fields)
     stmt = select(Document)
     if project_id:
         stmt = stmt.where(Document.project_id == project_id)
     if template_key:
         stmt = stmt.where(Document.template_key == template_key)
-    stmt = stmt.order_by(Document.created_at.desc())
-    results = db.exec(stmt).all()
-    return [sch.DocumentOut.model_validate(d) for d in results]
-
-
-@router.get(
-    "/search",
-    response_model=List[sch.DocumentOut],
-)
-def search_documents(
-    q: str = Query(..., min_length=1),
-    db: Session = Depends(get_db_session),
-) -> list[sch.DocumentOut]:
-    """Recherche de documents par mot-clé dans le titre."""
-    stmt = select(Document).where(Document.title.ilike(f"%{q}%")).order_by(
-        Document.created_at.desc()
-    )
-    results = db.exec(stmt).all()
-    return [sch.DocumentOut.model_validate(d) for d in results]
-
+    try:
+        page = paginate(db, projection.load_fields(stmt, Document, out_fields), Document, cursor, limit)
+    except DomainError as exc:
+        raise HTTPException(
+            status_code=exc.http_status,
+            detail={"code": exc.code, "message": exc.message},
+        ) from exc
+    unchanged = not_modified(request, response, page_etag(request, page))
+    if unchanged is not None:
+        return unchanged
+    return page_response(page, sch.DocumentOut, response, fields=out_fields)
 
@@ -7,17 +7,28 @@ Endpoints (cf. ARCHITECTURE.md) :
 - PATCH /v1/epics/{epic_id}
 - GET  /v1/epics
 - GET  /v1/epics/search
+- GET  /v1/epics/{epic_id}/progress
 """
 
 from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlmodel import Session, select
 
-from app.db import get_db_session
+from app.api.conditional import entity_etag, not_modified, page_etag
+from app.api.serialization import model_response, page_response, resolve_fields
+from app.db import get_db_session, save
 from app.models import Epic
 from app.models import schemas as sch
+from app.models.domain import RollupScope, SearchEntityType
+from app.services import DomainError
+from app.services import projection
+from app.services import rollups as rollup_service
+from app.services import search as search_service
+from app.services.cache import entity_cache
+from app.services.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, paginate
+from app.services.search import DEFAULT_SEARCH_LIMIT, MAX_SEARCH_LIMIT
 
 
 router = APIRouter(prefix="/epics", tags=["epics"])
@@ -37,24 +48,46 @@ def create_epic(
         title=payload.title,
         status=payload.status,
     )
-    db.add(epic)
-    db.commit()
-    db.refresh(epic)
+    save(db, epic)
     return sch.EpicOut.model_validate(epic)
 
 
+@router.get(
+    "/search",
+    response_model=List[sch.SearchHit],
+)
+def search_epics(
+    q: str = Query(..., min_length=1),
+    project_id: Optional[UUID] = Query(default=None),
+    limit: int = Query(default=DEFAULT_SEARCH_LIMIT, ge=1, le=MAX_SEARCH_LIMIT),
+    db: Session = Depends(get_db_session),
+) -> Response:
+    """
+    Recherche plein texte d'epics (titre), classée par pertinence, avec extrait.
+
+    Déclarée avant ``/{epic_id}`` pour ne pas être capturée par cette route.
+    """
+    hits = search_service.search(
+        db, q, entity_types=[SearchEntityType.EPIC], project_id=project_id, limit=limit,
+    )
+    return model_response(hits)
+
+
 @router.get(
     "/{epic_id}",
     response_model=sch.EpicOut,
 )
 def get_epic(
     epic_id: UUID,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db_session),
-) -> sch.EpicOut:
-    epic = db.get(Epic, epic_id)
+) -> sch.EpicOut | Response:
+    epic = entity_cache.read_through("epic", epic_id, sch.EpicOut, lambda: db.get(Epic, epic_id))
     if not epic:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Epic not found")
-    return sch.EpicOut.model_validate(epic)
+    etag = entity_etag("epic", epic.id, epic.updated_at)
+    return not_modified(request, response, etag) or epic
 
 
 @router.patch(
@@ -74,40 +107,57 @@ def update_epic(
     for field, value in update_data.items():
         setattr(epic, field, value)
 
-    db.add(epic)
-    db.commit()
-    db.refresh(epic)
+    save(db, epic)
     return sch.EpicOut.model_validate(epic)
 
 
 @router.get(
     "",
-    response_model=List[sch.EpicOut],
+    response_model=sch.Page[sch.EpicOut],
 )
 def list_epics(
+    request: Request,
+    response: Response,
     project_id: Optional[UUID] = Query(default=None),
+    cursor: Optional[str] = Query(default=None),
+    limit: int = Query(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    view: sch.ResponseView = Query(default=sch.ResponseView.FULL),
+    fields: Optional[str] = Query(
+        default=None, description="Champs à renvoyer, séparés par des virgules (prioritaire sur view)."
+    ),
     db: Session = Depends(get_db_session),
-) -> list[sch.EpicOut]:
-    """Liste les epics, éventuellement filtrés par projet."""
+) -> Response:
+    """Liste les epics, éventuellement filtrés par projet, paginés par curseur."""
+    out_fields = resolve_fields(sch.EpicOut, view, fields)
     stmt = select(Epic)
     if project_id:
         stmt = stmt.where(Epic.project_id == project_id)
-    stmt = stmt.order_by(Epic.created_at.desc())
-    results = db.exec(stmt).all()
-    return [sch.EpicOut.model_validate(e) for e in results]
+    try:
+        page = paginate(db, projection.load_fields(stmt, Epic, out_fields), Epic, cursor, limit)
+    except DomainError as exc:
+        raise HTTPException(
+            status_code=exc.http_status,
+            detail={"code": exc.code, "message": exc.message},
+        ) from exc
+    unchanged = not_modified(request, response, page_etag(request, page))
+    if unchanged is not None:
+        return unchanged
+    return page_response(page, sch.EpicOut, response, fields=out_fields)
 
 
 @router.get(
-    "/search",
-    response_model=List[sch.EpicOut],
+    "/{epic_id}/progress",
+    response_model=sch.ProgressOut,
 )
-def search_epics(
-    q: str = Query(..., min_length=1),
+def get_epic_progress(
+    epic_id: UUID,
     db: Session = Depends(get_db_session),
-) -> list[sch.EpicOut]:
-    """Recherche d'epics par mot-clé dans le titre."""
-    stmt = select(Epic).where(Epic.title.ilike(f"%{q}%")).order_by(Epic.created_at.desc())
-    results = db.exec(stmt).all()
-    return [sch.EpicOut.model_validate(e) for e in results]
-
-
+) -> sch.ProgressOut:
+    """Progression du epic (stories et points par statut), lue depuis les rollups."""
+    try:
+        return rollup_service.get_progress(db, RollupScope.EPIC, epic_id)
+    except DomainError as exc:
+        raise HTTPException(
+            status_code=exc.http_status,
+            detail={"code": exc.code, "message": exc.message},
+        ) from exc
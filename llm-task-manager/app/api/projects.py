@@ -4,16 +4,26 @@ Routes REST pour les projets.
 Endpoints (cf. ARCHITECTURE.md) :
 - POST /v1/projects
 - GET  /v1/projects
+- GET  /v1/projects/{project_id}/summary
+- GET  /v1/projects/{project_id}/snapshot
 """
 
-from typing import List
+from typing import Optional
+from uuid import UUID
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlmodel import Session, select
 
-from app.db import get_db_session
+from app.api.conditional import not_modified, page_etag
+from app.api.serialization import model_response, page_response, resolve_fields
+from app.db import get_db_session, save
 from app.models import Project
 from app.models import schemas as sch
+from app.services import DomainError
+from app.services import projection
+from app.services import projects as project_service
+from app.services.cache import entity_cache
+from app.services.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, paginate
 
 
 router = APIRouter(prefix="/projects", tags=["projects"])
@@ -30,21 +40,86 @@ def create_project(
 ) -> sch.ProjectOut:
     """Crée un nouveau projet."""
     project = Project(name=payload.name, description=payload.description)
-    db.add(project)
-    db.commit()
-    db.refresh(project)
+    save(db, project)
     return sch.ProjectOut.model_validate(project)
 
 
 @router.get(
     "",
-    response_model=List[sch.ProjectOut],
+    response_model=sch.Page[sch.ProjectOut],
 )
 def list_projects(
+    request: Request,
+    response: Response,
+    cursor: Optional[str] = Query(default=None),
+    limit: int = Query(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    view: sch.ResponseView = Query(default=sch.ResponseView.FULL),
+    fields: Optional[str] = Query(
+        default=None, description="Champs à renvoyer, séparés par des virgules (prioritaire sur view)."
+    ),
     db: Session = Depends(get_db_session),
-) -> list[sch.ProjectOut]:
-    """Liste tous les projets."""
-    results = db.exec(select(Project).order_by(Project.created_at.desc())).all()
-    return [sch.ProjectOut.model_validate(p) for p in results]
+) -> Response:
+    """Liste les projets, paginés par curseur."""
+    out_fields = resolve_fields(sch.ProjectOut, view, fields)
+    stmt = projection.load_fields(select(Project), Project, out_fields)
+    try:
+        page = paginate(db, stmt, Project, cursor, limit)
+    except DomainError as exc:
+        raise HTTPException(
+            status_code=exc.http_status,
+            detail={"code": exc.code, "message": exc.message},
+        ) from exc
+    unchanged = not_modified(request, response, page_etag(request, page))
+    if unchanged is not None:
+        return unchanged
+    return page_response(page, sch.ProjectOut, response, fields=out_fields)
 
 
+@router.get(
+    "/{project_id}/summary",
+    response_model=sch.ProjectSummary,
+)
+def get_project_summary(
+    project_id: UUID,
+    db: Session = Depends(get_db_session),
+) -> sch.ProjectSummary:
+    """
+    Tableau de bord du projet : nombre de stories et story points par statut,
+    priorité, assignee, epic et sprint actif (agrégés en SQL).
+    """
+    try:
+        return project_service.project_summary(db, project_id)
+    except DomainError as exc:
+        raise HTTPException(
+            status_code=exc.http_status,
+            detail={"code": exc.code, "message": exc.message},
+        ) from exc
+
+
+@router.get(
+    "/{project_id}/snapshot",
+    response_model=sch.ProjectSnapshot,
+)
+def get_project_snapshot(
+    project_id: UUID,
+    db: Session = Depends(get_db_session),
+) -> Response:
+    """
+    Instantané du projet pour amorcer le contexte d'un LLM : epics → stories
+    (statut, points), sprint actif et ses stories, derniers commentaires.
+    Calculé en un nombre fixe de requêtes, en cache jusqu'à la prochaine
+    écriture sur le projet.
+    """
+    try:
+        snapshot = entity_cache.read_through(
+            "project_snapshot",
+            project_id,
+            sch.ProjectSnapshot,
+            lambda: project_service.project_snapshot(db, project_id),
+        )
+    except DomainError as exc:
+        raise HTTPException(
+            status_code=exc.http_status,
+            detail={"code": exc.code, "message": exc.message},
+        ) from exc
+    return model_response(snapshot)
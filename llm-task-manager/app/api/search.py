@@ -0,0 +1,54 @@
+"""
+Route REST de recherche unifiée.
+
+Endpoint :
+- GET /v1/search
+
+Une seule requête sur l'index plein texte couvre stories, epics et documents ;
+les résultats sont fusionnés, classés par pertinence et typés
+(``entity_type``), avec un plafond par type.
+"""
+
+from typing import List, Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Query, Response
+from sqlmodel import Session
+
+from app.api.serialization import model_response
+from app.db import get_db_session
+from app.models import schemas as sch
+from app.models.domain import SearchEntityType
+from app.services import search as search_service
+from app.services.search import DEFAULT_PER_TYPE_LIMIT, DEFAULT_SEARCH_LIMIT, MAX_SEARCH_LIMIT
+
+
+router = APIRouter(prefix="/search", tags=["search"])
+
+
+@router.get(
+    "",
+    response_model=List[sch.SearchHit],
+)
+def search(
+    q: str = Query(..., min_length=1),
+    project_id: Optional[UUID] = Query(default=None),
+    types: Optional[List[SearchEntityType]] = Query(default=None),
+    per_type_limit: int = Query(default=DEFAULT_PER_TYPE_LIMIT, ge=1, le=MAX_SEARCH_LIMIT),
+    limit: int = Query(default=DEFAULT_SEARCH_LIMIT, ge=1, le=MAX_SEARCH_LIMIT),
+    db: Session = Depends(get_db_session),
+) -> Response:
+    """
+    Recherche plein texte sur toutes les entités, avec filtres optionnels :
+    - project_id
+    - types (story, epic, document ; répétable)
+    """
+    hits = search_service.search(
+        db,
+        q,
+        entity_types=types,
+        project_id=project_id,
+        limit=limit,
+        per_type_limit=per_type_limit,
+    )
+    return model_response(hits)
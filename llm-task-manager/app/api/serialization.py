@@ -0,0 +1,87 @@
+"""
+Sérialisation JSON directe des réponses volumineuses (listes, recherche).
+
+Avec ``response_model``, FastAPI revalide l'objet renvoyé par la route
+(``model_dump`` puis validation du dict obtenu), le convertit via
+``jsonable_encoder`` et l'encode avec ``json.dumps`` : pour une page de
+plusieurs centaines de stories, c'est ce chemin qui domine le CPU.
+
+Une route qui renvoie directement une ``Response`` court-circuite tout
+cela. ``ModelResponse`` encode son contenu (modèles Pydantic, listes,
+dicts) avec ``pydantic_core.to_json``, en Rust, sans passer par des dicts
+intermédiaires. Les objets ORM ne sont validés qu'une fois, vers le
+schéma de sortie (``sch.validate_many``). Le ``response_model`` reste
+déclaré sur la route pour le schéma OpenAPI.
+
+Mesure : ``python -m benchmarks.serialization``.
+"""
+
+from collections.abc import Sequence
+from typing import Any, Optional
+
+import pydantic_core
+from fastapi import HTTPException, Response
+
+from app.models import schemas as sch
+from app.services import DomainError, projection
+from app.services.pagination import Page
+
+
+class ModelResponse(Response):
+    """Réponse JSON encodée par pydantic-core (modèles acceptés tels quels)."""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return pydantic_core.to_json(content)
+
+
+def model_response(
+    content: Any,
+    response: Optional[Response] = None,
+    status_code: int = 200,
+) -> ModelResponse:
+    """
+    Construit la réponse finale. Les en-têtes déjà posés sur la ``response``
+    injectée par FastAPI (ex. ``ETag``) sont repris : ils ne sont appliqués
+    automatiquement que lorsque FastAPI construit lui-même la réponse.
+    """
+    headers = None
+    if response is not None:
+        headers = {k: v for k, v in response.headers.items() if k != "content-length"}
+    return ModelResponse(content, status_code=status_code, headers=headers)
+
+
+def page_response(
+    page: Page[Any],
+    out_model: type[sch.ORMBaseModel],
+    response: Optional[Response] = None,
+    fields: Optional[Sequence[str]] = None,
+) -> ModelResponse:
+    """
+    Réponse ``{items, next_cursor}`` d'une ``Page`` d'objets ORM, restreinte
+    à ``fields`` le cas échéant (cf. ``app.services.projection``).
+    """
+    if fields is None:
+        items = sch.validate_many(out_model, page.items)
+    else:
+        items = projection.dump_fields(page.items, fields)
+    return model_response({"items": items, "next_cursor": page.next_cursor}, response)
+
+
+def resolve_fields(
+    out_model: type[sch.ORMBaseModel],
+    view: sch.ResponseView,
+    fields: Optional[str],
+) -> Optional[tuple[str, ...]]:
+    """``projection.resolve_fields`` pour une route (``fields`` séparés par des virgules)."""
+    try:
+        return projection.resolve_fields(out_model, view, fields.split(",") if fields else None)
+    except DomainError as exc:
+        raise HTTPException(
+            status_code=exc.http_status,
+            detail={"code": exc.code, "message": exc.message},
+        ) from exc
+
+
+__all__ = ["ModelResponse", "model_response", "page_response", "resolve_fields"]
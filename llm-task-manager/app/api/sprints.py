@@ -7,24 +7,31 @@ Endpoints (cf. ARCHITECTURE.md) :
 - POST   /v1/sprints/{sprint_id}/close
 - POST   /v1/sprints/{sprint_id}/stories/{story_id}
 - DELETE /v1/sprints/{sprint_id}/stories/{story_id}
+- POST   /v1/sprints/{sprint_id}/stories:batch
 - GET    /v1/sprints
+- GET    /v1/sprints/{sprint_id}/progress
 
 Les règles métier avancées (ex: clôture seulement si toutes les stories sont `done`)
 seront implémentées à l'étape Service Layer.
 """
 
-from typing import List, Optional
+from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlmodel import Session, select
 
-from app.db import get_db_session
+from app.api.conditional import not_modified, page_etag
+from app.api.serialization import page_response, resolve_fields
+from app.db import get_db_session, save
 from app.models import Sprint
 from app.models import schemas as sch
-from app.models.domain import SprintStatus
+from app.models.domain import RollupScope, SprintStatus
 from app.services import DomainError
+from app.services import projection
+from app.services import rollups as rollup_service
 from app.services import sprints as sprint_service
+from app.services.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, paginate
 
 
 router = APIRouter(prefix="/sprints", tags=["sprints"])
@@ -46,9 +53,7 @@ def create_sprint(
         start_date=payload.start_date,
         end_date=payload.end_date,
     )
-    db.add(sprint)
-    db.commit()
-    db.refresh(sprint)
+    save(db, sprint)
     return sch.SprintOut.model_validate(sprint)
 
 
@@ -124,23 +129,82 @@ def remove_story_from_sprint(
         ) from exc
 
 
+@router.post(
+    "/{sprint_id}/stories:batch",
+    response_model=sch.SprintStoriesBatchResult,
+)
+def update_sprint_stories(
+    sprint_id: UUID,
+    payload: sch.SprintStoriesBatch,
+    db: Session = Depends(get_db_session),
+) -> sch.SprintStoriesBatchResult:
+    """
+    Ajoute et retire des stories du sprint en une seule transaction.
+
+    Les stories refusées (inconnues, ou retirées sans être actives dans ce
+    sprint) sont renvoyées dans ``rejected`` sans bloquer les autres.
+    """
+    try:
+        return sprint_service.update_sprint_stories(
+            db, sprint_id, add=payload.add, remove=payload.remove
+        )
+    except DomainError as exc:
+        raise HTTPException(
+            status_code=exc.http_status,
+            detail={"code": exc.code, "message": exc.message},
+        ) from exc
+
+
 @router.get(
     "",
-    response_model=List[sch.SprintOut],
+    response_model=sch.Page[sch.SprintOut],
 )
 def list_sprints(
+    request: Request,
+    response: Response,
     project_id: Optional[UUID] = Query(default=None),
     status_filter: Optional[SprintStatus] = Query(default=None, alias="status"),
+    cursor: Optional[str] = Query(default=None),
+    limit: int = Query(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    view: sch.ResponseView = Query(default=sch.ResponseView.FULL),
+    fields: Optional[str] = Query(
+        default=None, description="Champs à renvoyer, séparés par des virgules (prioritaire sur view)."
+    ),
     db: Session = Depends(get_db_session),
-) -> list[sch.SprintOut]:
-    """Liste les sprints, avec filtres par projet et statut."""
+) -> Response:
+    """Liste les sprints, avec filtres par projet et statut, paginés par curseur."""
+    out_fields = resolve_fields(sch.SprintOut, view, fields)
     stmt = select(Sprint)
     if project_id:
         stmt = stmt.where(Sprint.project_id == project_id)
     if status_filter:
         stmt = stmt.where(Sprint.status == status_filter)
-    stmt = stmt.order_by(Sprint.created_at.desc())
-    results = db.exec(stmt).all()
-    return [sch.SprintOut.model_validate(s) for s in results]
+    try:
+        page = paginate(db, projection.load_fields(stmt, Sprint, out_fields), Sprint, cursor, limit)
+    except DomainError as exc:
+        raise HTTPException(
+            status_code=exc.http_status,
+            detail={"code": exc.code, "message": exc.message},
+        ) from exc
+    unchanged = not_modified(request, response, page_etag(request, page))
+    if unchanged is not None:
+        return unchanged
+    return page_response(page, sch.SprintOut, response, fields=out_fields)
 
 
+@router.get(
+    "/{sprint_id}/progress",
+    response_model=sch.ProgressOut,
+)
+def get_sprint_progress(
+    sprint_id: UUID,
+    db: Session = Depends(get_db_session),
+) -> sch.ProgressOut:
+    """Progression du sprint (stories et points par statut), lue depuis les rollups."""
+    try:
+        return rollup_service.get_progress(db, RollupScope.SPRINT, sprint_id)
+    except DomainError as exc:
+        raise HTTPException(
+            status_code=exc.http_status,
+            detail={"code": exc.code, "message": exc.message},
+        ) from exc
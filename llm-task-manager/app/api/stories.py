@@ -3,6 +3,8 @@ Routes REST pour les stories.
 
 Endpoints (cf. ARCHITECTURE.md) :
 - POST /v1/stories
+- POST /v1/stories:batch
+- POST /v1/stories:transition
 - GET  /v1/stories/{story_id}
 - PATCH /v1/stories/{story_id}
 - GET  /v1/stories
@@ -12,15 +14,22 @@ Endpoints (cf. ARCHITECTURE.md) :
 from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlmodel import Session, select
 
+from app.api.conditional import entity_etag, not_modified, page_etag
+from app.api.serialization import model_response, page_response, resolve_fields
 from app.db import get_db_session
 from app.models import Story
 from app.models import schemas as sch
-from app.models.domain import StoryPriority, StoryStatus
+from app.models.domain import SearchEntityType, StoryPriority, StoryStatus
 from app.services import DomainError
+from app.services import projection
+from app.services import search as search_service
 from app.services import stories as story_service
+from app.services.cache import entity_cache
+from app.services.search import DEFAULT_SEARCH_LIMIT, MAX_SEARCH_LIMIT
+from app.services.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, paginate
 
 
 router = APIRouter(prefix="/stories", tags=["stories"])
@@ -45,18 +54,94 @@ def create_story(
     return sch.StoryOut.model_validate(story)
 
 
+@router.post(
+    ":batch",
+    response_model=sch.StoryBatchCreateResult,
+)
+def create_stories(
+    payload: sch.StoryBatchCreate,
+    db: Session = Depends(get_db_session),
+) -> sch.StoryBatchCreateResult:
+    """
+    Crée plusieurs stories en une requête et une transaction.
+
+    Les éléments invalides sont rapportés dans ``errors`` (par position) ;
+    les autres sont créés.
+    """
+    try:
+        return story_service.create_stories(db, payload.items)
+    except DomainError as exc:
+        raise HTTPException(
+            status_code=exc.http_status,
+            detail={"code": exc.code, "message": exc.message},
+        ) from exc
+
+
+@router.post(
+    ":transition",
+    response_model=sch.StoryBulkTransitionResult,
+)
+def transition_stories(
+    payload: sch.StoryBulkTransition,
+    db: Session = Depends(get_db_session),
+) -> sch.StoryBulkTransitionResult:
+    """
+    Change le statut d'un ensemble de stories (``story_ids`` ou ``filter``).
+
+    Le workflow est vérifié pour chaque story ; les transitions refusées
+    sont renvoyées dans ``rejected`` avec leur raison, les autres sont
+    appliquées en une seule mise à jour.
+    """
+    try:
+        return story_service.transition_stories(
+            db, payload.status, story_ids=payload.story_ids, story_filter=payload.filter,
+        )
+    except DomainError as exc:
+        raise HTTPException(
+            status_code=exc.http_status,
+            detail={"code": exc.code, "message": exc.message},
+        ) from exc
+
+
+@router.get(
+    "/search",
+    response_model=List[sch.SearchHit],
+)
+def search_stories(
+    q: str = Query(..., min_length=1),
+    project_id: Optional[UUID] = Query(default=None),
+    limit: int = Query(default=DEFAULT_SEARCH_LIMIT, ge=1, le=MAX_SEARCH_LIMIT),
+    db: Session = Depends(get_db_session),
+) -> Response:
+    """
+    Recherche plein texte de stories (titre, description, critères d'acceptation),
+    classée par pertinence, avec extrait.
+
+    Déclarée avant ``/{story_id}`` pour ne pas être capturée par cette route.
+    """
+    hits = search_service.search(
+        db, q, entity_types=[SearchEntityType.STORY], project_id=project_id, limit=limit,
+    )
+    return model_response(hits)
+
+
 @router.get(
     "/{story_id}",
     response_model=sch.StoryOut,
 )
 def get_story(
     story_id: UUID,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db_session),
-) -> sch.StoryOut:
-    story = db.get(Story, story_id)
+) -> sch.StoryOut | Response:
+    story = entity_cache.read_through(
+        "story", story_id, sch.StoryOut, lambda: db.get(Story, story_id)
+    )
     if not story:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Story not found")
-    return sch.StoryOut.model_validate(story)
+    etag = entity_etag("story", story.id, story.updated_at)
+    return not_modified(request, response, etag) or story
 
 
 @router.patch(
@@ -80,24 +165,36 @@ def update_story(
 
 @router.get(
     "",
-    response_model=List[sch.StoryOut],
+    response_model=sch.Page[sch.StoryOut],
 )
 def list_stories(
+    request: Request,
+    response: Response,
     status_filter: Optional[StoryStatus] = Query(default=None, alias="status"),
     priority_filter: Optional[StoryPriority] = Query(default=None, alias="priority"),
     assignee: Optional[str] = Query(default=None),
     sprint_id: Optional[UUID] = Query(default=None),
+    cursor: Optional[str] = Query(default=None),
+    limit: int = Query(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    view: sch.ResponseView = Query(default=sch.ResponseView.FULL),
+    fields: Optional[str] = Query(
+        default=None, description="Champs à renvoyer, séparés par des virgules (prioritaire sur view)."
+    ),
     db: Session = Depends(get_db_session),
-) -> list[sch.StoryOut]:
+) -> Response:
     """
     Liste les stories avec filtres :
     - status
     - priority
     - assignee
     - sprint_id (via StorySprintHistory.is_active)
+
+    Les résultats sont paginés par curseur (``cursor`` / ``limit``) ;
+    ``view=compact`` ou ``fields`` restreignent les champs renvoyés.
     """
     from app.models import StorySprintHistory  # import local pour éviter cycles
 
+    out_fields = resolve_fields(sch.StoryOut, view, fields)
     stmt = select(Story)
 
     if status_filter:
@@ -115,22 +212,15 @@ def list_stories(
             )
         )
 
-    stmt = stmt.order_by(Story.created_at.desc())
-    results = db.exec(stmt).all()
-    return [sch.StoryOut.model_validate(s) for s in results]
-
-
-@router.get(
-    "/search",
-    response_model=List[sch.StoryOut],
-)
-def search_stories(
-    q: str = Query(..., min_length=1),
-    db: Session = Depends(get_db_session),
-) -> list[sch.StoryOut]:
-    """Recherche de stories par mot-clé dans le titre."""
-    stmt = select(Story).where(Story.title.ilike(f"%{q}%")).order_by(Story.created_at.desc())
-    results = db.exec(stmt).all()
-    return [sch.StoryOut.model_validate(s) for s in results]
-
+    try:
+        page = paginate(db, projection.load_fields(stmt, Story, out_fields), Story, cursor, limit)
+    except DomainError as exc:
+        raise HTTPException(
+            status_code=exc.http_status,
+            detail={"code": exc.code, "message": exc.message},
+        ) from exc
+    unchanged = not_modified(request, response, page_etag(request, page))
+    if unchanged is not None:
+        return unchanged
+    return page_response(page, sch.StoryOut, response, fields=out_fields)
 
@@ -13,9 +13,10 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlmodel import Session, select
 
-from app.db import get_db_session
+from app.db import get_db_session, save
 from app.models import Story, StoryDescription
 from app.models import schemas as sch
+from app.services.cache import entity_cache
 
 
 router = APIRouter(prefix="/story-descriptions", tags=["story-descriptions"])
@@ -52,9 +53,7 @@ def create_story_description(
         description=payload.description,
         acceptance_criteria=payload.acceptance_criteria,
     )
-    db.add(desc)
-    db.commit()
-    db.refresh(desc)
+    save(db, desc)
     return sch.StoryDescriptionOut.model_validate(desc)
 
 
@@ -66,15 +65,20 @@ def get_story_description(
     story_id: UUID,
     db: Session = Depends(get_db_session),
 ) -> sch.StoryDescriptionOut:
-    desc = db.exec(
-        select(StoryDescription).where(StoryDescription.story_id == story_id)
-    ).first()
+    desc = entity_cache.read_through(
+        "story_description",
+        story_id,
+        sch.StoryDescriptionOut,
+        lambda: db.exec(
+            select(StoryDescription).where(StoryDescription.story_id == story_id)
+        ).first(),
+    )
     if not desc:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="No description found for this story",
         )
-    return sch.StoryDescriptionOut.model_validate(desc)
+    return desc
 
 
 @router.patch(
@@ -99,9 +103,7 @@ def update_story_description(
     for field, value in update_data.items():
         setattr(desc, field, value)
 
-    db.add(desc)
-    db.commit()
-    db.refresh(desc)
+    save(db, desc)
     return sch.StoryDescriptionOut.model_validate(desc)
 
 
@@ -3,12 +3,38 @@ Package `app.db` : configuration et accès base de données.
 
 - `config.get_database_url` : résolution de l'URL de connexion
 - `config.is_sqlite` : détection du backend SQLite (dev local)
+- `config.get_async_database_url` : URL du moteur asynchrone
 - `session.engine` : moteur SQLModel / SQLAlchemy
+- `session.async_engine` : moteur asynchrone (tools MCP)
 - `session.get_db_session` : dépendence FastAPI pour obtenir une session
+- `session.async_session` : fabrique de sessions asynchrones
+- `readiness.check` / `readiness.warm_up` : sonde ``/ready`` et préchauffage des connexions
+- `instrumentation.track` : comptage des requêtes SQL d'une requête HTTP / d'un tool MCP
+- `writes.save` / `writes.save_async` : commit sans ``refresh`` (pas de relecture après écriture)
 """
 
-from .config import get_database_url, is_sqlite  # noqa: F401
-from .session import engine, get_db_session, init_db  # noqa: F401
+from .config import get_async_database_url, get_database_url, is_sqlite  # noqa: F401
+from .writes import save, save_async  # noqa: F401  (avant ``session`` : importé par les services)
+from .session import (  # noqa: F401
+    async_engine,
+    async_session,
+    engine,
+    get_async_db_session,
+    get_db_session,
+    init_db,
+)
 
-__all__ = ["engine", "get_db_session", "init_db", "get_database_url", "is_sqlite"]
+__all__ = [
+    "engine",
+    "async_engine",
+    "get_db_session",
+    "get_async_db_session",
+    "async_session",
+    "init_db",
+    "save",
+    "save_async",
+    "get_database_url",
+    "get_async_database_url",
+    "is_sqlite",
+]
 
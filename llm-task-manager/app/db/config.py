@@ -73,6 +73,27 @@ def get_database_url() -> str:
     return "sqlite:///./llm_task_manager.db"
 
 
+@lru_cache(maxsize=1)
+def get_async_database_url() -> str:
+    """
+    Retourne l'URL de connexion du moteur asynchrone.
+
+    Dérivée de ``get_database_url`` en remplaçant le driver :
+    - ``sqlite://``             → ``sqlite+aiosqlite://``
+    - ``postgresql://`` / ``postgresql+psycopg2://`` → ``postgresql+psycopg://``
+      (psycopg 3 expose le même dialecte en mode async)
+    - un driver déjà asynchrone (``+psycopg``, ``+asyncpg``, ``+aiosqlite``)
+      est conservé tel quel.
+    """
+    url = get_database_url()
+    scheme, sep, rest = url.partition("://")
+    if scheme == "sqlite":
+        return f"sqlite+aiosqlite{sep}{rest}"
+    if scheme in ("postgresql", "postgres", "postgresql+psycopg2"):
+        return f"postgresql+psycopg{sep}{rest}"
+    return url
+
+
 def is_sqlite() -> bool:
     """Retourne True si la DB courante est SQLite (dev local)."""
     return get_database_url().startswith("sqlite")
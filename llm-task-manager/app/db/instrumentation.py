@@ -0,0 +1,138 @@
+"""
+Instrumentation des requêtes SQL par requête HTTP et par tool MCP.
+
+Des listeners ``before_cursor_execute`` / ``after_cursor_execute`` posés sur
+les moteurs (cf. ``install``) comptent les instructions exécutées et leur
+durée cumulée dans le ``QueryStats`` de l'unité de travail courante, ouverte
+par ``track`` (middleware HTTP, décorateur des tools MCP). Le suivi passe par
+une ``ContextVar`` : il suit la requête dans le threadpool FastAPI comme
+dans ``AsyncSession.run_sync``.
+
+Une même lecture SQL (texte paramétré identique) exécutée au moins
+``N_PLUS_ONE_THRESHOLD`` fois dans une unité de travail est signalée comme
+N+1 probable. Les écritures répétées ne le sont pas : un batch insère
+légitimement une ligne par élément ; les lectures verrouillantes
+(``SELECT ... FOR UPDATE``) non plus, chaque opération reprenant ses verrous.
+"""
+
+import logging
+import time
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Final, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+logger = logging.getLogger(__name__)
+
+N_PLUS_ONE_THRESHOLD: Final[int] = 3
+
+_current: ContextVar[Optional["QueryStats"]] = ContextVar("query_stats", default=None)
+
+
+@dataclass
+class QueryStats:
+    """Instructions SQL exécutées pendant une unité de travail."""
+
+    label: str
+    count: int = 0
+    total_ms: float = 0.0
+    statements: Counter[str] = field(default_factory=Counter)
+    locking: set[str] = field(default_factory=set)
+
+    def repeated(self) -> dict[str, int]:
+        """Lectures répétées au moins ``N_PLUS_ONE_THRESHOLD`` fois (N+1 probables)."""
+        return {
+            sql: n
+            for sql, n in self.statements.items()
+            if n >= N_PLUS_ONE_THRESHOLD and _is_read(sql) and sql not in self.locking
+        }
+
+    def headers(self) -> dict[str, str]:
+        headers = {
+            "X-DB-Query-Count": str(self.count),
+            "X-DB-Time-Ms": f"{self.total_ms:.2f}",
+        }
+        repeated = self.repeated()
+        if repeated:
+            headers["X-DB-Repeated-Statements"] = str(len(repeated))
+        return headers
+
+
+def _is_read(statement: str) -> bool:
+    keyword = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else ""
+    return keyword in ("SELECT", "WITH")
+
+
+def current_stats() -> Optional[QueryStats]:
+    """``QueryStats`` de l'unité de travail en cours, le cas échéant."""
+    return _current.get()
+
+
+@contextmanager
+def track(label: str) -> Iterator[QueryStats]:
+    """
+    Ouvre une unité de travail et journalise son bilan à la sortie.
+
+    Imbriqué dans une unité déjà ouverte (tool appelant un autre tool), le
+    suivi est mis en commun avec l'unité englobante.
+    """
+    outer = _current.get()
+    if outer is not None:
+        yield outer
+        return
+
+    stats = QueryStats(label=label)
+    token = _current.set(stats)
+    try:
+        yield stats
+    finally:
+        _current.reset(token)
+        _log(stats)
+
+
+def _log(stats: QueryStats) -> None:
+    logger.info("%s: %d queries, %.2f ms", stats.label, stats.count, stats.total_ms)
+    for sql, n in stats.repeated().items():
+        logger.warning("%s: possible N+1, statement executed %d times: %s", stats.label, n, sql)
+
+
+def _before_cursor_execute(conn: Any, cursor: Any, statement: str, *args: Any) -> None:
+    if _current.get() is not None:
+        conn.info["query_started_at"] = time.perf_counter()
+
+
+def _takes_row_lock(context: Any) -> bool:
+    # ``FOR UPDATE`` n'apparaît pas dans le SQL sous SQLite : lu sur la requête compilée
+    compiled_statement = getattr(getattr(context, "compiled", None), "statement", None)
+    return getattr(compiled_statement, "_for_update_arg", None) is not None
+
+
+def _after_cursor_execute(
+    conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+) -> None:
+    stats = _current.get()
+    if stats is None:
+        return
+    started = conn.info.pop("query_started_at", None)
+    if started is not None:
+        stats.total_ms += (time.perf_counter() - started) * 1000
+    stats.count += 1
+    stats.statements[statement] += 1
+    if _takes_row_lock(context):
+        stats.locking.add(statement)
+
+
+def install(engine: Engine) -> None:
+    """Pose les listeners sur ``engine`` (moteur synchrone ou ``AsyncEngine.sync_engine``)."""
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+__all__ = ["N_PLUS_ONE_THRESHOLD", "QueryStats", "current_stats", "track", "install"]
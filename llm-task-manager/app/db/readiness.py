@@ -0,0 +1,155 @@
+"""
+Sonde de disponibilité de la base (``GET /ready``) et préchauffage au démarrage.
+
+``/health`` ne dit que « le processus répond ». ``/ready`` vérifie que
+l'instance peut réellement servir : sur chaque moteur (synchrone pour REST,
+asynchrone pour MCP), une connexion est empruntée au pool et un
+``SELECT 1`` exécuté, le tout borné par ``READY_TIMEOUT_SECONDS``. Un pool
+déjà saturé est signalé immédiatement, sans attendre ``pool_timeout`` : Cloud
+Run peut alors cesser de router du trafic vers l'instance.
+
+Emprunt borné :
+- moteur asynchrone : l'attente de connexion est annulée au délai ;
+- moteur synchrone : l'emprunt bloque un thread, qu'on ne peut pas
+  interrompre ; il reste borné par ``pool_timeout``. Tant qu'un ping
+  synchrone n'est pas terminé, les sondes suivantes répondent
+  « indisponible » sans nouvel emprunt : au plus un thread bloqué et un
+  emprunt en attente par moteur, même si ``/ready`` est appelée en boucle
+  sur un pool saturé.
+
+Variables d'env :
+- READY_TIMEOUT_SECONDS (défaut 2)
+"""
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Optional, Union
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.services import metrics
+
+
+logger = logging.getLogger(__name__)
+
+
+# Moteurs synchrones dont un ping tourne encore dans un thread
+_pinging: set[int] = set()
+_pinging_lock = threading.Lock()
+
+
+def _timeout_from_env() -> float:
+    return float(os.getenv("READY_TIMEOUT_SECONDS", "2"))
+
+
+def _pool(engine: Union[Engine, AsyncEngine]) -> Any:
+    return engine.sync_engine.pool if isinstance(engine, AsyncEngine) else engine.pool
+
+
+@dataclass
+class Readiness:
+    """Résultat de la sonde : ``ready`` et détails renvoyés tels quels au client."""
+
+    ready: bool
+    reason: Optional[str] = None
+    latency_ms: Optional[float] = None
+    pools: dict[str, Any] = field(default_factory=dict)
+
+    def as_dict(self) -> dict[str, Any]:
+        body: dict[str, Any] = {"status": "ready" if self.ready else "unavailable"}
+        if self.reason:
+            body["reason"] = self.reason
+        body["db_latency_ms"] = self.latency_ms
+        body["pools"] = self.pools
+        return body
+
+
+def ping(engine: Engine) -> float:
+    """Emprunte une connexion, exécute ``SELECT 1`` et renvoie la durée (ms)."""
+    started = time.perf_counter()
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+    return round((time.perf_counter() - started) * 1000, 2)
+
+
+async def ping_async(engine: AsyncEngine) -> float:
+    """Pendant asynchrone de ``ping``."""
+    started = time.perf_counter()
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+    return round((time.perf_counter() - started) * 1000, 2)
+
+
+class _PingPending(Exception):
+    """Un ping précédent sur ce moteur n'est pas terminé."""
+
+
+def _ping_once(engine: Engine) -> float:
+    """``ping``, sauf si un ping précédent sur ``engine`` tourne encore."""
+    with _pinging_lock:
+        if id(engine) in _pinging:
+            raise _PingPending
+        _pinging.add(id(engine))
+    try:
+        return ping(engine)
+    finally:
+        with _pinging_lock:
+            _pinging.discard(id(engine))
+
+
+async def check(
+    engines: dict[str, Union[Engine, AsyncEngine]],
+    timeout: Optional[float] = None,
+) -> Readiness:
+    """
+    Vérifie la base via chacun des ``engines`` (pings concurrents) et
+    rapporte l'état de leurs pools ; ``latency_ms`` est celle du ping le
+    plus lent. Au-delà de ``timeout``, la sonde répond « indisponible ».
+    """
+    timeout = _timeout_from_env() if timeout is None else timeout
+    stats = {name: metrics.pool_stats(_pool(engine)) for name, engine in engines.items()}
+
+    exhausted = [
+        name for name, s in stats.items() if s is not None and s["checked_out"] >= s["capacity"]
+    ]
+    if exhausted:
+        return Readiness(False, reason=f"pool_exhausted: {', '.join(exhausted)}", pools=stats)
+
+    pings = [
+        ping_async(engine) if isinstance(engine, AsyncEngine) else asyncio.to_thread(_ping_once, engine)
+        for engine in engines.values()
+    ]
+    try:
+        latencies = await asyncio.wait_for(asyncio.gather(*pings), timeout)
+    except asyncio.TimeoutError:
+        return Readiness(False, reason=f"timeout after {timeout:g}s", pools=stats)
+    except _PingPending:
+        return Readiness(False, reason="previous check still pending", pools=stats)
+    except Exception as exc:  # noqa: BLE001 - toute erreur DB rend l'instance indisponible
+        logger.warning("Readiness check failed: %s", exc)
+        return Readiness(False, reason=f"error: {type(exc).__name__}", pools=stats)
+    return Readiness(True, latency_ms=max(latencies, default=None), pools=stats)
+
+
+async def warm_up(engine: Engine, async_engine: AsyncEngine) -> None:
+    """
+    Ouvre une première connexion sur chaque moteur au démarrage, pour que la
+    première requête ne paie pas l'établissement de connexion (TLS, auth).
+    Un échec est journalisé sans bloquer le démarrage : ``/ready`` le signale.
+    """
+    try:
+        sync_ms = await asyncio.to_thread(ping, engine)
+        async_ms = await ping_async(async_engine)
+    except Exception as exc:  # noqa: BLE001
+        logger.warning("Database warm-up failed: %s", exc)
+        return
+    logger.info("Database warm-up: sync %.2f ms, async %.2f ms", sync_ms, async_ms)
+
+
+__all__ = ["Readiness", "ping", "ping_async", "check", "warm_up"]
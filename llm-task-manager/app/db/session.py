@@ -4,21 +4,44 @@ Création du moteur SQLModel et gestion des sessions DB.
 Cette couche est utilisée par :
 - les services applicatifs
 - les routes FastAPI (via dépendence ``get_db_session``)
+- les tools MCP (via le moteur asynchrone ``async_engine``)
+
+Deux moteurs coexistent sur la même base :
+- ``engine`` (synchrone) : routes REST, exécutées dans le threadpool FastAPI
+- ``async_engine`` (asyncio : psycopg async / aiosqlite) : tools MCP, qui
+  tournent sur la boucle d'évènements FastMCP et ne doivent pas la bloquer
 
 Configuration du pool de connexions (cf. ARCHITECTURE.md) :
 - SQLite  : ``StaticPool`` (dev local, pas de pooling)
 - PostgreSQL : ``pool_size=5``, ``max_overflow=5``, ``pool_timeout=30``
   Adaptée à Cloud Run (scaling → limiter les connexions simultanées).
+  Surchargeable par ``DB_POOL_SIZE`` / ``DB_MAX_OVERFLOW`` /
+  ``DB_POOL_TIMEOUT`` (dimensionnement à partir de ``benchmarks.load``).
 """
 
-from collections.abc import Generator
+import os
+from collections.abc import AsyncGenerator, Generator
 
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 from sqlmodel import Session, SQLModel, create_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.db.config import get_database_url, is_sqlite
+from app.db import instrumentation
+from app.db.config import get_async_database_url, get_database_url, is_sqlite
+from app.services import metrics
 
 
 DATABASE_URL = get_database_url()
+ASYNC_DATABASE_URL = get_async_database_url()
+
+
+def _pool_options() -> dict[str, int]:
+    """Dimensionnement du pool PostgreSQL, identique pour les deux moteurs."""
+    return {
+        "pool_size": int(os.getenv("DB_POOL_SIZE", "5")),
+        "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", "5")),
+        "pool_timeout": int(os.getenv("DB_POOL_TIMEOUT", "30")),
+    }
 
 
 def _create_engine():
@@ -42,14 +65,36 @@ def _create_engine():
         DATABASE_URL,
         echo=False,
         pool_pre_ping=True,         # Vérifie la connexion avant usage
-        pool_size=5,                 # Connexions maintenues dans le pool
-        max_overflow=5,              # Connexions supplémentaires temporaires
-        pool_timeout=30,             # Timeout d'attente d'une connexion
         pool_recycle=1800,           # Recycle les connexions après 30 min
+        **_pool_options(),           # pool_size, max_overflow, pool_timeout
+    )
+
+
+def _create_async_engine() -> AsyncEngine:
+    """
+    Crée le moteur asynchrone, avec le même dimensionnement de pool que
+    le moteur synchrone (les deux pools s'additionnent par instance).
+    """
+    if is_sqlite():
+        return create_async_engine(ASYNC_DATABASE_URL, echo=False)
+
+    return create_async_engine(
+        ASYNC_DATABASE_URL,
+        echo=False,
+        pool_pre_ping=True,
+        pool_recycle=1800,
+        **_pool_options(),
     )
 
 
 engine = _create_engine()
+async_engine = _create_async_engine()
+
+# Comptage des requêtes SQL par requête HTTP / tool MCP, saturation des pools
+instrumentation.install(engine)
+instrumentation.install(async_engine.sync_engine)
+metrics.watch_pool(engine, "sync")
+metrics.watch_pool(async_engine.sync_engine, "async")
 
 
 def init_db() -> None:
@@ -80,5 +125,30 @@ def get_db_session() -> Generator[Session, None, None]:
         yield session
 
 
-__all__ = ["engine", "init_db", "get_db_session"]
+def async_session() -> AsyncSession:
+    """
+    Fabrique une session asynchrone sur ``async_engine``.
+
+    ``expire_on_commit=False`` : après ``commit()``, les attributs restent
+    lisibles sans déclencher de chargement implicite (interdit en asyncio).
+    """
+    return AsyncSession(async_engine, expire_on_commit=False)
+
+
+async def get_async_db_session() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dépendence FastAPI asynchrone, pendant de ``get_db_session``.
+    """
+    async with async_session() as session:
+        yield session
+
+
+__all__ = [
+    "engine",
+    "async_engine",
+    "init_db",
+    "get_db_session",
+    "async_session",
+    "get_async_db_session",
+]
 
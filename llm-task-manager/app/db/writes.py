@@ -0,0 +1,44 @@
+"""
+Écritures sans relecture : ``save`` / ``save_async``.
+
+Le motif ``commit()`` puis ``refresh(obj)`` ajoute un ``SELECT`` après
+chaque ``INSERT`` / ``UPDATE``, soit deux allers-retours par mutation
+(coûteux vers Cloud SQL). Or toutes les valeurs générées sont calculées
+côté client et reportées sur l'objet au flush :
+
+- ``id`` : ``uuid4`` (``default_factory``)
+- ``created_at`` / ``updated_at`` : ``datetime.utcnow`` (``default`` /
+  ``onupdate`` Python, cf. ``app.models.domain``)
+
+L'objet est donc complet après le flush ; il suffit qu'il ne soit pas
+expiré par le commit. Une mutation coûte ainsi une instruction plus le
+``COMMIT``.
+
+Contrainte : aucune colonne ne doit être générée côté serveur
+(``server_default``, trigger modifiant la ligne). Le cas échéant, la
+déclarer avec ``eager_defaults`` pour qu'elle soit lue par ``RETURNING``
+dans la même instruction, plutôt que de revenir à ``refresh``.
+"""
+
+from sqlmodel import Session, SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+
+def save(db: Session, *objs: SQLModel) -> None:
+    """Persiste ``objs`` et valide la transaction, sans expirer ni relire les objets."""
+    db.add_all(objs)
+    expire_on_commit = db.expire_on_commit
+    db.expire_on_commit = False
+    try:
+        db.commit()
+    finally:
+        db.expire_on_commit = expire_on_commit
+
+
+async def save_async(db: AsyncSession, *objs: SQLModel) -> None:
+    """Pendant asynchrone de ``save`` (sessions créées avec ``expire_on_commit=False``)."""
+    db.add_all(objs)
+    await db.commit()
+
+
+__all__ = ["save", "save_async"]
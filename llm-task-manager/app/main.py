@@ -1,22 +1,34 @@
+import time
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, Response
+from fastapi.exception_handlers import http_exception_handler
+from fastapi.responses import JSONResponse, PlainTextResponse
+from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from app.api import router as api_router
+from app.db import instrumentation
+from app.mcp.http import PATH as MCP_PATH
+from app.mcp.http import McpHttpApp
+from app.services import metrics
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
-    Lifespan handler : initialise le schéma DB au démarrage.
+    Lifespan handler : initialise le schéma DB au démarrage, préchauffe les
+    connexions (cf. ``app.db.readiness.warm_up``), puis démarre le transport
+    MCP HTTP (cf. ``app.mcp.http``).
 
     En production, les migrations Alembic gèrent le schéma.
     Ce fallback garantit que les tables existent en dev local / SQLite.
     """
-    from app.db import init_db
+    from app.db import async_engine, engine, init_db, readiness
 
     init_db()
-    yield
+    await readiness.warm_up(engine, async_engine)
+    async with app.state.mcp_http.run():
+        yield
 
 
 def create_app() -> FastAPI:
@@ -30,6 +42,36 @@ def create_app() -> FastAPI:
         lifespan=lifespan,
     )
 
+    @app.middleware("http")
+    async def instrument(request: Request, call_next) -> Response:
+        """
+        Compte les requêtes SQL émises pour la requête HTTP : en-têtes
+        ``X-DB-Query-Count`` / ``X-DB-Time-Ms`` (et ``X-DB-Repeated-Statements``
+        si un N+1 est probable), bilan journalisé. Alimente l'histogramme de
+        latence ``http_request_duration_seconds`` (label ``route`` = gabarit
+        de chemin, pour garder une cardinalité bornée).
+        """
+        started = time.perf_counter()
+        status = "500"
+        try:
+            with instrumentation.track(f"{request.method} {request.url.path}") as stats:
+                response = await call_next(request)
+            status = str(response.status_code)
+        finally:
+            route = getattr(request.scope.get("route"), "path", "unmatched")
+            metrics.HTTP_REQUEST_DURATION.observe(
+                time.perf_counter() - started, request.method, route, status
+            )
+        response.headers.update(stats.headers())
+        return response
+
+    @app.exception_handler(StarletteHTTPException)
+    async def count_domain_errors(request: Request, exc: StarletteHTTPException) -> Response:
+        """Compte les ``DomainError`` converties en HTTPException par les routers."""
+        if isinstance(exc.detail, dict) and "code" in exc.detail:
+            metrics.DOMAIN_ERRORS.inc(exc.detail["code"])
+        return await http_exception_handler(request, exc)
+
     @app.get("/health", tags=["health"])
     async def health() -> dict:
         """
@@ -37,9 +79,50 @@ def create_app() -> FastAPI:
         """
         return {"status": "ok"}
 
+    @app.get("/ready", tags=["health"])
+    async def ready() -> JSONResponse:
+        """
+        Sonde de disponibilité (readiness) : emprunt d'une connexion et
+        ``SELECT 1`` bornés dans le temps, état des pools. 503 si le pool est
+        saturé ou la base lente / injoignable.
+        """
+        from app.db import async_engine, engine, readiness
+
+        result = await readiness.check({"sync": engine, "async": async_engine})
+        return JSONResponse(result.as_dict(), status_code=200 if result.ready else 503)
+
+    @app.get("/metrics", tags=["health"], response_class=PlainTextResponse)
+    async def prometheus_metrics() -> PlainTextResponse:
+        """
+        Métriques au format texte Prometheus : latences par route et par tool
+        MCP, erreurs métier par code, état des pools de connexions, hits et
+        misses du cache d'entités.
+        """
+        from app.db import async_engine, engine
+        from app.services.cache import entity_cache
+
+        body = metrics.render(
+            {"sync": engine.pool, "async": async_engine.sync_engine.pool},
+            cache=entity_cache.stats()["by_kind"],
+        )
+        return PlainTextResponse(body, media_type="text/plain; version=0.0.4")
+
+    @app.get("/cache/stats", tags=["health"])
+    async def cache_stats() -> dict:
+        """
+        Statistiques du cache d'entités (hits / misses par type).
+        """
+        from app.services.cache import entity_cache
+
+        return entity_cache.stats()
+
     # Point d'extension : inclure les routers métier
     app.include_router(api_router, prefix="/v1")
 
+    # Tools MCP en streamable HTTP : même processus, même pool, même cache
+    app.state.mcp_http = McpHttpApp()
+    app.add_route(MCP_PATH, app.state.mcp_http, include_in_schema=False)
+
     return app
 
 
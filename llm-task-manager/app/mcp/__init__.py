@@ -4,7 +4,9 @@ Couche MCP : définition des tools exposés au LLM.
 Les tools sont implémentés dans `server.py` via le SDK Python MCP
 et réutilisent la même logique métier que les routes REST.
 
-Lancement recommandé : ``python -m app.mcp`` (utilise __main__.py).
+Lancement recommandé en local : ``python -m app.mcp`` (stdio, utilise
+__main__.py) ; en service, transport streamable HTTP monté sur ``/mcp`` par
+``app.main.create_app()`` (cf. ``http.py``).
 """
 
 
@@ -0,0 +1,108 @@
+"""
+Transport MCP streamable HTTP, monté dans l'application FastAPI.
+
+En stdio (``python -m app.mcp``), chaque client LLM lance son propre
+processus Python, avec son moteur, son pool de connexions et son cache
+d'entités. Monté sur ``/mcp`` par ``create_app()``, le serveur MCP partage
+ceux du service REST : un seul processus, un seul pool, un seul cache (et
+une invalidation commune). Les réponses sont renvoyées en JSON ; ``GET``
+ouvre le flux SSE de la session.
+
+Chaque lifespan de l'application hôte démarre son propre gestionnaire de
+sessions du SDK (``StreamableHTTPSessionManager``) ; les réglages du
+serveur ``FastMCP`` partagé avec le transport stdio ne sont pas modifiés.
+
+Variables d'env :
+- MCP_MAX_SESSIONS : nombre de sessions MCP ouvertes simultanément ; au-delà,
+  l'ouverture d'une session est refusée (503) (défaut : 100)
+- MCP_MAX_CONCURRENCY : nombre d'appels MCP (``POST``) traités
+  simultanément, toutes sessions confondues ; les suivants attendent leur
+  tour sans emprunter de connexion (défaut : 10, taille par défaut du pool
+  asynchrone). Les flux SSE (``GET``) n'empruntent pas de connexion et n'y
+  sont pas soumis.
+- MCP_ALLOWED_HOSTS : en-têtes ``Host`` acceptés, séparés par des virgules
+  (``host`` ou ``host:*``), protection contre le DNS rebinding ; à défaut,
+  réglage du SDK (localhost uniquement)
+"""
+
+import os
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Final, Optional
+
+import anyio
+from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
+from mcp.server.transport_security import TransportSecuritySettings
+from starlette.types import Receive, Scope, Send
+
+from app.mcp.server import server
+
+
+PATH: Final[str] = "/mcp"
+
+
+def _max_sessions() -> int:
+    return int(os.getenv("MCP_MAX_SESSIONS", "100"))
+
+
+def _max_concurrency() -> int:
+    return int(os.getenv("MCP_MAX_CONCURRENCY", "10"))
+
+
+def _transport_security() -> Optional[TransportSecuritySettings]:
+    raw = os.getenv("MCP_ALLOWED_HOSTS")
+    hosts = [host.strip() for host in raw.split(",") if host.strip()] if raw else []
+    if not hosts:
+        return server.settings.transport_security
+    return TransportSecuritySettings(enable_dns_rebinding_protection=True, allowed_hosts=hosts)
+
+
+def _session_manager() -> StreamableHTTPSessionManager:
+    return StreamableHTTPSessionManager(
+        app=server._mcp_server,
+        json_response=server.settings.json_response,
+        security_settings=_transport_security(),
+        max_request_body_size=server.settings.max_request_body_size,
+        session_idle_timeout=server.settings.session_idle_timeout,
+        max_sessions=_max_sessions(),
+    )
+
+
+class McpHttpApp:
+    """
+    Application ASGI du transport streamable HTTP.
+
+    Le gestionnaire de sessions et la limite de concurrence vivent le temps
+    du lifespan de l'application hôte (cf. ``run``) : le SDK n'autorise qu'un
+    ``run()`` par gestionnaire, et les tests ouvrent plusieurs lifespans sur
+    la même application.
+    """
+
+    def __init__(self) -> None:
+        self._manager: Optional[StreamableHTTPSessionManager] = None
+        self._limit: Optional[anyio.Semaphore] = None
+
+    @asynccontextmanager
+    async def run(self) -> AsyncIterator[None]:
+        """Démarre un gestionnaire de sessions MCP (à ouvrir dans le lifespan)."""
+        manager = _session_manager()
+        async with manager.run():
+            self._manager, self._limit = manager, anyio.Semaphore(_max_concurrency())
+            try:
+                yield
+            finally:
+                self._manager = self._limit = None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        manager, limit = self._manager, self._limit
+        if manager is None or limit is None:
+            raise RuntimeError("MCP HTTP transport is not running (application lifespan not started).")
+        if scope["method"] != "POST":
+            # Flux SSE (``GET``) et fermeture de session (``DELETE``) : hors limite
+            await manager.handle_request(scope, receive, send)
+            return
+        async with limit:
+            await manager.handle_request(scope, receive, send)
+
+
+__all__ = ["PATH", "McpHttpApp"]
@@ -8,17 +8,26 @@ et documents directement depuis une conversation (cf. ARCHITECTURE.md).
 Usage (local, via transport stdio) :
 
     python -m app.mcp
+
+En service, les mêmes tools sont exposés en streamable HTTP sur ``/mcp`` de
+l'application FastAPI (cf. ``app.mcp.http``).
 """
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+import functools
+import time
+from collections.abc import Awaitable, Callable, Sequence
+from typing import Any, Dict, List, Optional, TypeVar
 from uuid import UUID
 
 from mcp.server.fastmcp import FastMCP
-from sqlmodel import Session, select
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncConnection
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.db import engine
+from app.db import async_engine, async_session, instrumentation, save_async
 from app.models import (
     Comment,
     CommentTargetType,
@@ -33,18 +42,98 @@ from app.models import (
     StoryStatus,
     schemas as sch,
 )
-from app.models.domain import SprintStatus
+from app.models.domain import RollupScope, SearchEntityType, SprintStatus
 from app.services import DomainError
+from app.services import batch as batch_service
+from app.services import metrics
+from app.services import projection
+from app.services import projects as project_service
+from app.services import rollups as rollup_service
+from app.services import search as search_service
 from app.services import sprints as sprint_service
 from app.services import stories as story_service
+from app.services.cache import entity_cache
+from app.services.pagination import DEFAULT_PAGE_SIZE, Page, paginate_async
+from app.services.search import DEFAULT_PER_TYPE_LIMIT, DEFAULT_SEARCH_LIMIT
 
 
 server = FastMCP("llm-task-manager", json_response=True)
 
+ToolFn = TypeVar("ToolFn", bound=Callable[..., Awaitable[Any]])
+
+
+def _session() -> AsyncSession:
+    """
+    Crée une session asynchrone éphémère.
+
+    Les E/S base de données sont attendues (``await``) afin de ne pas bloquer
+    la boucle d'évènements FastMCP : des appels de tools concurrents se
+    recouvrent. Les services métier synchrones sont exécutés via
+    ``AsyncSession.run_sync``.
+    """
+    return async_session()
+
+
+def _connect() -> AsyncConnection:
+    """
+    Ouvre une connexion asynchrone hors session, pour les traitements qui
+    pilotent eux-mêmes leur transaction (cf. ``execute_batch``).
+    """
+    return async_engine.connect()
+
+
+def _page_out(page: Page, out_model: Any, fields: Optional[Sequence[str]] = None) -> Dict[str, Any]:
+    """
+    Sérialise une ``Page`` d'objets ORM au format ``{items, next_cursor}``
+    (validation et ``model_dump`` de toutes les lignes en un appel chacun),
+    restreinte à ``fields`` le cas échéant.
+    """
+    if fields is None:
+        items = sch.dump_many(out_model, page.items)
+    else:
+        items = projection.dump_fields(page.items, fields)
+    return {"items": items, "next_cursor": page.next_cursor}
 
-def _session() -> Session:
-    """Crée une session SQLModel éphémère."""
-    return Session(engine)
+
+def _fields(out_model: Any, view: str, fields: Optional[List[str]]) -> Optional[tuple[str, ...]]:
+    """Champs à renvoyer selon ``view`` / ``fields`` (cf. ``app.services.projection``)."""
+    try:
+        return projection.resolve_fields(out_model, view, fields)
+    except DomainError as exc:
+        _handle_domain_error(exc)
+    return None  # pragma: no cover - _handle_domain_error lève toujours
+
+
+async def _progress(scope_type: RollupScope, scope_id: str) -> Dict[str, Any]:
+    """Lit la progression d'un epic ou d'un sprint depuis les rollups."""
+    async with _session() as db:
+        try:
+            progress = await db.run_sync(rollup_service.get_progress, scope_type, UUID(scope_id))
+        except DomainError as exc:
+            _handle_domain_error(exc)
+        return progress.model_dump()
+
+
+async def _search(
+    q: str,
+    entity_types: Optional[List[SearchEntityType]],
+    project_id: Optional[str],
+    limit: int,
+    per_type_limit: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """Exécute une recherche plein texte et sérialise les résultats."""
+    async with _session() as db:
+        hits = await db.run_sync(
+            lambda sync_db: search_service.search(
+                sync_db,
+                q,
+                entity_types=entity_types,
+                project_id=UUID(project_id) if project_id else None,
+                limit=limit,
+                per_type_limit=per_type_limit,
+            )
+        )
+        return [hit.model_dump() for hit in hits]
 
 
 def _handle_domain_error(exc: DomainError) -> None:
@@ -53,32 +142,112 @@ def _handle_domain_error(exc: DomainError) -> None:
 
     Le client MCP affichera le message au LLM.
     """
+    metrics.DOMAIN_ERRORS.inc(exc.code)
     raise RuntimeError(f"{exc.code}: {exc.message}")  # pragma: no cover - glue
 
 
+def _tool() -> Callable[[ToolFn], ToolFn]:
+    """
+    ``server.tool()`` avec comptage des requêtes SQL de chaque appel
+    (nombre, durée, N+1 probables ; journalisés, cf. ``app.db.instrumentation``)
+    et histogramme de durée ``mcp_tool_duration_seconds``.
+    """
+    def decorator(fn: ToolFn) -> ToolFn:
+        @functools.wraps(fn)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            started = time.perf_counter()
+            outcome = "error"
+            try:
+                with instrumentation.track(f"mcp:{fn.__name__}"):
+                    result = await fn(*args, **kwargs)
+                outcome = "ok"
+                return result
+            finally:
+                metrics.MCP_TOOL_DURATION.observe(time.perf_counter() - started, fn.__name__, outcome)
+
+        server.tool()(wrapper)
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
 # ---------------------------------------------------------------------------
 # Projects
 # ---------------------------------------------------------------------------
 
 
-@server.tool()
+@_tool()
 async def create_project(name: str, description: Optional[str] = None) -> Dict[str, Any]:
     """Crée un nouveau projet."""
     payload = sch.ProjectCreate(name=name, description=description)
-    with _session() as db:
+    async with _session() as db:
         project = Project(name=payload.name, description=payload.description)
-        db.add(project)
-        db.commit()
-        db.refresh(project)
+        await save_async(db, project)
         return sch.ProjectOut.model_validate(project).model_dump()
 
 
-@server.tool()
-async def list_projects() -> List[Dict[str, Any]]:
-    """Liste tous les projets disponibles."""
-    with _session() as db:
-        results = db.exec(select(Project).order_by(Project.created_at.desc())).all()
-        return [sch.ProjectOut.model_validate(p).model_dump() for p in results]
+@_tool()
+async def list_projects(
+    cursor: Optional[str] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+    view: str = sch.ResponseView.FULL.value,
+    fields: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """
+    Liste les projets disponibles, paginés par curseur.
+
+    Renvoie ``{items, next_cursor}`` ; passer ``next_cursor`` en ``cursor``
+    pour obtenir la page suivante.
+
+    ``view="compact"`` (champs essentiels) ou ``fields`` (liste de champs)
+    réduisent la réponse.
+    """
+    out_fields = _fields(sch.ProjectOut, view, fields)
+    async with _session() as db:
+        stmt = projection.load_fields(select(Project), Project, out_fields)
+        try:
+            page = await paginate_async(db, stmt, Project, cursor, limit)
+        except DomainError as exc:
+            _handle_domain_error(exc)
+        return _page_out(page, sch.ProjectOut, out_fields)
+
+
+@_tool()
+async def get_project_summary(project_id: str) -> Dict[str, Any]:
+    """
+    Tableau de bord d'un projet : nombre de stories et story points par statut,
+    priorité, assignee, epic et sprint actif.
+
+    Préférer ce tool à ``list_stories`` pour obtenir des totaux.
+    """
+    async with _session() as db:
+        try:
+            summary = await db.run_sync(project_service.project_summary, UUID(project_id))
+        except DomainError as exc:
+            _handle_domain_error(exc)
+        return summary.model_dump()
+
+
+@_tool()
+async def get_project_snapshot(project_id: str) -> Dict[str, Any]:
+    """
+    Instantané d'un projet, à appeler en début de conversation à la place de
+    ``list_epics`` / ``list_sprints`` / ``list_stories`` : epics avec leurs
+    stories non terminées (statut, points, assignee, sprint), totaux par
+    epic, sprint actif (ids de ses stories, points faits / prévus) et
+    derniers commentaires.
+    """
+    async def load() -> sch.ProjectSnapshot:
+        async with _session() as db:
+            return await db.run_sync(project_service.project_snapshot, UUID(project_id))
+
+    try:
+        snapshot = await entity_cache.read_through_async(
+            "project_snapshot", UUID(project_id), sch.ProjectSnapshot, load
+        )
+    except DomainError as exc:
+        _handle_domain_error(exc)
+    return snapshot.model_dump()
 
 
 # ---------------------------------------------------------------------------
@@ -86,29 +255,40 @@ async def list_projects() -> List[Dict[str, Any]]:
 # ---------------------------------------------------------------------------
 
 
-@server.tool()
+@_tool()
 async def create_epic(project_id: str, title: str) -> Dict[str, Any]:
     """Crée un epic dans un projet donné."""
     payload = sch.EpicCreate(project_id=UUID(project_id), title=title)
-    with _session() as db:
+    async with _session() as db:
         epic = Epic(project_id=payload.project_id, title=payload.title, status=payload.status)
-        db.add(epic)
-        db.commit()
-        db.refresh(epic)
+        await save_async(db, epic)
         return sch.EpicOut.model_validate(epic).model_dump()
 
 
-@server.tool()
-async def get_epic(epic_id: str) -> Dict[str, Any]:
-    """Récupère un epic par son identifiant."""
-    with _session() as db:
-        epic = db.get(Epic, UUID(epic_id))
-        if not epic:
-            raise RuntimeError("EPIC_NOT_FOUND: Epic not found")
-        return sch.EpicOut.model_validate(epic).model_dump()
+@_tool()
+async def get_epic(
+    epic_id: str,
+    view: str = sch.ResponseView.FULL.value,
+    fields: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """
+    Récupère un epic par son identifiant.
+
+    ``view="compact"`` ou ``fields`` (liste de champs) réduisent la réponse.
+    """
+    out_fields = _fields(sch.EpicOut, view, fields)
 
+    async def load() -> Optional[Epic]:
+        async with _session() as db:
+            return await db.get(Epic, UUID(epic_id))
 
-@server.tool()
+    epic = await entity_cache.read_through_async("epic", UUID(epic_id), sch.EpicOut, load)
+    if not epic:
+        raise RuntimeError("EPIC_NOT_FOUND: Epic not found")
+    return projection.dump(epic, out_fields)
+
+
+@_tool()
 async def update_epic(epic_id: str, title: Optional[str] = None, status: Optional[str] = None) -> Dict[str, Any]:
     """
     Met à jour un epic (titre et/ou statut).
@@ -122,8 +302,8 @@ async def update_epic(epic_id: str, title: Optional[str] = None, status: Optiona
         data["status"] = status
 
     payload = sch.EpicUpdate(**data)
-    with _session() as db:
-        epic = db.get(Epic, UUID(epic_id))
+    async with _session() as db:
+        epic = await db.get(Epic, UUID(epic_id))
         if not epic:
             raise RuntimeError("EPIC_NOT_FOUND: Epic not found")
 
@@ -131,31 +311,54 @@ async def update_epic(epic_id: str, title: Optional[str] = None, status: Optiona
         for field, value in update_data.items():
             setattr(epic, field, value)
 
-        db.add(epic)
-        db.commit()
-        db.refresh(epic)
+        await save_async(db, epic)
         return sch.EpicOut.model_validate(epic).model_dump()
 
 
-@server.tool()
-async def list_epics(project_id: Optional[str] = None) -> List[Dict[str, Any]]:
-    """Liste les epics, optionnellement filtrés par projet."""
-    with _session() as db:
+@_tool()
+async def list_epics(
+    project_id: Optional[str] = None,
+    cursor: Optional[str] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+    view: str = sch.ResponseView.FULL.value,
+    fields: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """
+    Liste les epics, optionnellement filtrés par projet, paginés par curseur.
+
+    ``view="compact"`` (champs essentiels) ou ``fields`` (liste de champs)
+    réduisent la réponse.
+    """
+    out_fields = _fields(sch.EpicOut, view, fields)
+    async with _session() as db:
         stmt = select(Epic)
         if project_id:
             stmt = stmt.where(Epic.project_id == UUID(project_id))
-        stmt = stmt.order_by(Epic.created_at.desc())
-        results = db.exec(stmt).all()
-        return [sch.EpicOut.model_validate(e).model_dump() for e in results]
+        stmt = projection.load_fields(stmt, Epic, out_fields)
+        try:
+            page = await paginate_async(db, stmt, Epic, cursor, limit)
+        except DomainError as exc:
+            _handle_domain_error(exc)
+        return _page_out(page, sch.EpicOut, out_fields)
 
 
-@server.tool()
-async def search_epics(q: str) -> List[Dict[str, Any]]:
-    """Recherche d'epics par mot-clé dans le titre."""
-    with _session() as db:
-        stmt = select(Epic).where(Epic.title.ilike(f"%{q}%")).order_by(Epic.created_at.desc())
-        results = db.exec(stmt).all()
-        return [sch.EpicOut.model_validate(e).model_dump() for e in results]
+@_tool()
+async def search_epics(
+    q: str,
+    project_id: Optional[str] = None,
+    limit: int = DEFAULT_SEARCH_LIMIT,
+) -> List[Dict[str, Any]]:
+    """Recherche plein texte d'epics (titre), classée par pertinence, avec extrait."""
+    return await _search(q, [SearchEntityType.EPIC], project_id, limit)
+
+
+@_tool()
+async def get_epic_progress(epic_id: str) -> Dict[str, Any]:
+    """
+    Progression d'un epic : nombre de stories et story points par statut,
+    dont ``done_count`` / ``done_points``. Lecture directe, sans recalcul.
+    """
+    return await _progress(RollupScope.EPIC, epic_id)
 
 
 # ---------------------------------------------------------------------------
@@ -163,7 +366,7 @@ async def search_epics(q: str) -> List[Dict[str, Any]]:
 # ---------------------------------------------------------------------------
 
 
-@server.tool()
+@_tool()
 async def create_story(
     project_id: str,
     title: str,
@@ -189,25 +392,72 @@ async def create_story(
         story_points=story_points,
         assignee=assignee,
     )
-    with _session() as db:
+    async with _session() as db:
         try:
-            story = story_service.create_story(db, payload)
+            story = await db.run_sync(story_service.create_story, payload)
         except DomainError as exc:
             _handle_domain_error(exc)
         return sch.StoryOut.model_validate(story).model_dump()
 
 
-@server.tool()
-async def get_story(story_id: str) -> Dict[str, Any]:
-    """Récupère une story par son identifiant."""
-    with _session() as db:
-        story = db.get(Story, UUID(story_id))
-        if not story:
-            raise RuntimeError("STORY_NOT_FOUND: Story not found")
-        return sch.StoryOut.model_validate(story).model_dump()
+@_tool()
+async def create_stories(stories: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Crée plusieurs stories en un seul appel et une seule transaction.
 
+    Chaque élément prend les mêmes champs que ``create_story`` (project_id,
+    title, epic_id, status, priority, story_points, assignee). Renvoie
+    ``{created, errors}`` : les stories créées dans l'ordre, et pour chaque
+    élément rejeté son ``index``, un ``code`` et un ``message``.
+    """
+    errors: List[sch.BatchItemError] = []
+    payloads: List[sch.StoryCreate] = []
+    positions: List[int] = []
+    for index, item in enumerate(stories):
+        try:
+            payloads.append(sch.StoryCreate.model_validate(item))
+        except ValidationError as exc:
+            errors.append(sch.BatchItemError(index=index, code="VALIDATION_ERROR", message=str(exc)))
+            continue
+        positions.append(index)
+
+    result = sch.StoryBatchCreateResult(created=[], errors=[])
+    if payloads:
+        async with _session() as db:
+            try:
+                result = await db.run_sync(story_service.create_stories, payloads)
+            except DomainError as exc:
+                _handle_domain_error(exc)
+    for error in result.errors:
+        error.index = positions[error.index]
+    result.errors = sorted(errors + result.errors, key=lambda e: e.index)
+    return result.model_dump()
+
+
+@_tool()
+async def get_story(
+    story_id: str,
+    view: str = sch.ResponseView.FULL.value,
+    fields: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """
+    Récupère une story par son identifiant.
 
-@server.tool()
+    ``view="compact"`` ou ``fields`` (liste de champs) réduisent la réponse.
+    """
+    out_fields = _fields(sch.StoryOut, view, fields)
+
+    async def load() -> Optional[Story]:
+        async with _session() as db:
+            return await db.get(Story, UUID(story_id))
+
+    story = await entity_cache.read_through_async("story", UUID(story_id), sch.StoryOut, load)
+    if not story:
+        raise RuntimeError("STORY_NOT_FOUND: Story not found")
+    return projection.dump(story, out_fields)
+
+
+@_tool()
 async def update_story(
     story_id: str,
     title: Optional[str] = None,
@@ -233,31 +483,89 @@ async def update_story(
         data["assignee"] = assignee
 
     payload = sch.StoryUpdate(**data)
-    with _session() as db:
+    async with _session() as db:
         try:
-            story = story_service.update_story(db, UUID(story_id), payload)
+            story = await db.run_sync(story_service.update_story, UUID(story_id), payload)
         except DomainError as exc:
             _handle_domain_error(exc)
         return sch.StoryOut.model_validate(story).model_dump()
 
 
-@server.tool()
+@_tool()
+async def transition_stories(
+    status: str,
+    story_ids: Optional[List[str]] = None,
+    project_id: Optional[str] = None,
+    epic_id: Optional[str] = None,
+    sprint_id: Optional[str] = None,
+    from_status: Optional[str] = None,
+    priority: Optional[str] = None,
+    assignee: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Fait passer plusieurs stories au statut ``status`` en un seul appel.
+
+    Sélection : soit ``story_ids``, soit des filtres (project_id, epic_id,
+    sprint_id, from_status = statut actuel, priority, assignee). Exemple :
+    toutes les stories ``in_review`` d'un sprint vers ``done`` :
+    ``status="done", sprint_id=..., from_status="in_review"``.
+
+    Renvoie ``{updated, unchanged, rejected}`` ; chaque story refusée
+    (transition interdite par le workflow, story inconnue) porte un ``code``
+    et un ``message``.
+    """
+    story_filter = None
+    if story_ids is None:
+        story_filter = sch.StoryFilter(
+            project_id=UUID(project_id) if project_id else None,
+            epic_id=UUID(epic_id) if epic_id else None,
+            sprint_id=UUID(sprint_id) if sprint_id else None,
+            status=StoryStatus(from_status) if from_status else None,
+            priority=StoryPriority(priority) if priority else None,
+            assignee=assignee,
+        )
+    async with _session() as db:
+        try:
+            result = await db.run_sync(
+                lambda sync_db: story_service.transition_stories(
+                    sync_db,
+                    StoryStatus(status),
+                    story_ids=[UUID(s) for s in story_ids] if story_ids is not None else None,
+                    story_filter=story_filter,
+                )
+            )
+        except DomainError as exc:
+            _handle_domain_error(exc)
+        return result.model_dump()
+
+
+@_tool()
 async def list_stories(
     status: Optional[str] = None,
     priority: Optional[str] = None,
     assignee: Optional[str] = None,
     sprint_id: Optional[str] = None,
-) -> List[Dict[str, Any]]:
+    cursor: Optional[str] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+    view: str = sch.ResponseView.FULL.value,
+    fields: Optional[List[str]] = None,
+) -> Dict[str, Any]:
     """
     Liste les stories avec filtres optionnels :
     - status
     - priority
     - assignee
     - sprint_id
+
+    Paginé par curseur : renvoie ``{items, next_cursor}``.
+
+    ``view="compact"`` (champs essentiels) ou ``fields`` (liste de champs)
+    réduisent la réponse.
     """
     from app.models import StorySprintHistory  # import local pour éviter cycles
 
-    with _session() as db:
+    out_fields = _fields(sch.StoryOut, view, fields)
+    async with _session() as db:
         stmt = select(Story)
         if status:
             stmt = stmt.where(Story.status == StoryStatus(status))
@@ -273,18 +581,25 @@ async def list_stories(
                     StorySprintHistory.is_active.is_(True),
                 )
             )
-        stmt = stmt.order_by(Story.created_at.desc())
-        results = db.exec(stmt).all()
-        return [sch.StoryOut.model_validate(s).model_dump() for s in results]
+        stmt = projection.load_fields(stmt, Story, out_fields)
+        try:
+            page = await paginate_async(db, stmt, Story, cursor, limit)
+        except DomainError as exc:
+            _handle_domain_error(exc)
+        return _page_out(page, sch.StoryOut, out_fields)
 
 
-@server.tool()
-async def search_stories(q: str) -> List[Dict[str, Any]]:
-    """Recherche de stories par mot-clé dans le titre."""
-    with _session() as db:
-        stmt = select(Story).where(Story.title.ilike(f"%{q}%")).order_by(Story.created_at.desc())
-        results = db.exec(stmt).all()
-        return [sch.StoryOut.model_validate(s).model_dump() for s in results]
+@_tool()
+async def search_stories(
+    q: str,
+    project_id: Optional[str] = None,
+    limit: int = DEFAULT_SEARCH_LIMIT,
+) -> List[Dict[str, Any]]:
+    """
+    Recherche plein texte de stories (titre, description, critères d'acceptation),
+    classée par pertinence, avec extrait.
+    """
+    return await _search(q, [SearchEntityType.STORY], project_id, limit)
 
 
 # ---------------------------------------------------------------------------
@@ -292,7 +607,7 @@ async def search_stories(q: str) -> List[Dict[str, Any]]:
 # ---------------------------------------------------------------------------
 
 
-@server.tool()
+@_tool()
 async def create_story_description(
     story_id: str,
     description: str,
@@ -307,13 +622,15 @@ async def create_story_description(
         description=description,
         acceptance_criteria=acceptance_criteria,
     )
-    with _session() as db:
-        story = db.get(Story, payload.story_id)
+    async with _session() as db:
+        story = await db.get(Story, payload.story_id)
         if not story:
             raise RuntimeError("STORY_NOT_FOUND: Story not found")
 
-        existing = db.exec(
-            select(StoryDescription).where(StoryDescription.story_id == payload.story_id)
+        existing = (
+            await db.exec(
+                select(StoryDescription).where(StoryDescription.story_id == payload.story_id)
+            )
         ).first()
         if existing:
             raise RuntimeError(
@@ -325,25 +642,40 @@ async def create_story_description(
             description=payload.description,
             acceptance_criteria=payload.acceptance_criteria,
         )
-        db.add(desc)
-        db.commit()
-        db.refresh(desc)
+        await save_async(db, desc)
         return sch.StoryDescriptionOut.model_validate(desc).model_dump()
 
 
-@server.tool()
-async def get_story_description(story_id: str) -> Dict[str, Any]:
-    """Récupère la description d'une story par l'identifiant de la story."""
-    with _session() as db:
-        desc = db.exec(
-            select(StoryDescription).where(StoryDescription.story_id == UUID(story_id))
-        ).first()
-        if not desc:
-            raise RuntimeError("DESCRIPTION_NOT_FOUND: No description found for this story")
-        return sch.StoryDescriptionOut.model_validate(desc).model_dump()
+@_tool()
+async def get_story_description(
+    story_id: str,
+    view: str = sch.ResponseView.FULL.value,
+    fields: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """
+    Récupère la description d'une story par l'identifiant de la story.
+
+    ``view="compact"`` ou ``fields`` (liste de champs) réduisent la réponse.
+    """
+    out_fields = _fields(sch.StoryDescriptionOut, view, fields)
 
+    async def load() -> Optional[StoryDescription]:
+        async with _session() as db:
+            return (
+                await db.exec(
+                    select(StoryDescription).where(StoryDescription.story_id == UUID(story_id))
+                )
+            ).first()
+
+    desc = await entity_cache.read_through_async(
+        "story_description", UUID(story_id), sch.StoryDescriptionOut, load
+    )
+    if not desc:
+        raise RuntimeError("DESCRIPTION_NOT_FOUND: No description found for this story")
+    return projection.dump(desc, out_fields)
 
-@server.tool()
+
+@_tool()
 async def update_story_description(
     story_id: str,
     description: Optional[str] = None,
@@ -357,9 +689,11 @@ async def update_story_description(
         data["acceptance_criteria"] = acceptance_criteria
 
     payload = sch.StoryDescriptionUpdate(**data)
-    with _session() as db:
-        desc = db.exec(
-            select(StoryDescription).where(StoryDescription.story_id == UUID(story_id))
+    async with _session() as db:
+        desc = (
+            await db.exec(
+                select(StoryDescription).where(StoryDescription.story_id == UUID(story_id))
+            )
         ).first()
         if not desc:
             raise RuntimeError("DESCRIPTION_NOT_FOUND: No description found for this story")
@@ -368,23 +702,23 @@ async def update_story_description(
         for field, value in update_data.items():
             setattr(desc, field, value)
 
-        db.add(desc)
-        db.commit()
-        db.refresh(desc)
+        await save_async(db, desc)
         return sch.StoryDescriptionOut.model_validate(desc).model_dump()
 
 
-@server.tool()
+@_tool()
 async def delete_story_description(story_id: str) -> Dict[str, str]:
     """Supprime la description d'une story."""
-    with _session() as db:
-        desc = db.exec(
-            select(StoryDescription).where(StoryDescription.story_id == UUID(story_id))
+    async with _session() as db:
+        desc = (
+            await db.exec(
+                select(StoryDescription).where(StoryDescription.story_id == UUID(story_id))
+            )
         ).first()
         if not desc:
             raise RuntimeError("DESCRIPTION_NOT_FOUND: No description found for this story")
-        db.delete(desc)
-        db.commit()
+        await db.delete(desc)
+        await db.commit()
         return {"status": "deleted", "story_id": story_id}
 
 
@@ -393,7 +727,7 @@ async def delete_story_description(story_id: str) -> Dict[str, str]:
 # ---------------------------------------------------------------------------
 
 
-@server.tool()
+@_tool()
 async def create_sprint(
     project_id: str,
     name: str,
@@ -412,7 +746,7 @@ async def create_sprint(
         start_date=start_date,  # Pydantic gère la conversion date
         end_date=end_date,
     )
-    with _session() as db:
+    async with _session() as db:
         sprint = Sprint(
             project_id=payload.project_id,
             name=payload.name,
@@ -420,83 +754,130 @@ async def create_sprint(
             start_date=payload.start_date,
             end_date=payload.end_date,
         )
-        db.add(sprint)
-        db.commit()
-        db.refresh(sprint)
+        await save_async(db, sprint)
         return sch.SprintOut.model_validate(sprint).model_dump()
 
 
-@server.tool()
+@_tool()
 async def start_sprint(sprint_id: str) -> Dict[str, Any]:
     """Démarre un sprint (passe le statut à ACTIVE)."""
-    with _session() as db:
+    async with _session() as db:
         try:
-            sprint = sprint_service.start_sprint(db, UUID(sprint_id))
+            sprint = await db.run_sync(sprint_service.start_sprint, UUID(sprint_id))
         except DomainError as exc:
             _handle_domain_error(exc)
         return sch.SprintOut.model_validate(sprint).model_dump()
 
 
-@server.tool()
+@_tool()
 async def close_sprint(sprint_id: str) -> Dict[str, Any]:
     """
     Clôture un sprint, uniquement si toutes les stories associées sont en `done`.
     """
-    with _session() as db:
+    async with _session() as db:
         try:
-            sprint = sprint_service.close_sprint(db, UUID(sprint_id))
+            sprint = await db.run_sync(sprint_service.close_sprint, UUID(sprint_id))
         except DomainError as exc:
             _handle_domain_error(exc)
         return sch.SprintOut.model_validate(sprint).model_dump()
 
 
-@server.tool()
+@_tool()
 async def list_sprints(
     project_id: Optional[str] = None,
     status: Optional[str] = None,
-) -> List[Dict[str, Any]]:
-    """Liste les sprints avec filtres optionnels par projet et statut."""
-    with _session() as db:
+    cursor: Optional[str] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+    view: str = sch.ResponseView.FULL.value,
+    fields: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """
+    Liste les sprints avec filtres optionnels par projet et statut, paginés par curseur.
+
+    ``view="compact"`` (champs essentiels) ou ``fields`` (liste de champs)
+    réduisent la réponse.
+    """
+    out_fields = _fields(sch.SprintOut, view, fields)
+    async with _session() as db:
         stmt = select(Sprint)
         if project_id:
             stmt = stmt.where(Sprint.project_id == UUID(project_id))
         if status:
             stmt = stmt.where(Sprint.status == SprintStatus(status))
-        stmt = stmt.order_by(Sprint.created_at.desc())
-        results = db.exec(stmt).all()
-        return [sch.SprintOut.model_validate(s).model_dump() for s in results]
+        stmt = projection.load_fields(stmt, Sprint, out_fields)
+        try:
+            page = await paginate_async(db, stmt, Sprint, cursor, limit)
+        except DomainError as exc:
+            _handle_domain_error(exc)
+        return _page_out(page, sch.SprintOut, out_fields)
+
+
+@_tool()
+async def get_sprint_progress(sprint_id: str) -> Dict[str, Any]:
+    """
+    Charge d'un sprint : nombre de stories actives et story points par statut,
+    dont ``done_count`` / ``done_points``. Lecture directe, sans recalcul.
+    """
+    return await _progress(RollupScope.SPRINT, sprint_id)
 
 
-@server.tool()
+@_tool()
 async def add_story_to_sprint(sprint_id: str, story_id: str) -> Dict[str, Any]:
     """Ajoute une story à un sprint (en tant que story active)."""
-    with _session() as db:
+    async with _session() as db:
         try:
-            sprint_service.add_story_to_sprint(db, UUID(sprint_id), UUID(story_id))
-            db_sprint = db.get(Sprint, UUID(sprint_id))
+            db_sprint = await db.run_sync(sprint_service.add_story_to_sprint, UUID(sprint_id), UUID(story_id))
         except DomainError as exc:
             _handle_domain_error(exc)
         return sch.SprintOut.model_validate(db_sprint).model_dump()
 
 
-@server.tool()
+@_tool()
 async def remove_story_from_sprint(sprint_id: str, story_id: str) -> Dict[str, Any]:
     """Retire une story du sprint (désactive le lien actif)."""
-    with _session() as db:
+    async with _session() as db:
         try:
-            sprint_service.remove_story_from_sprint(db, UUID(sprint_id), UUID(story_id))
-            db_sprint = db.get(Sprint, UUID(sprint_id))
+            db_sprint = await db.run_sync(sprint_service.remove_story_from_sprint, UUID(sprint_id), UUID(story_id))
         except DomainError as exc:
             _handle_domain_error(exc)
         return sch.SprintOut.model_validate(db_sprint).model_dump()
 
 
+@_tool()
+async def update_sprint_stories(
+    sprint_id: str,
+    add: Optional[List[str]] = None,
+    remove: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """
+    Planifie un sprint en un seul appel : ajoute les stories ``add`` (en les
+    retirant de leur sprint actif éventuel) et retire les stories ``remove``.
+
+    Renvoie ``{added, removed, unchanged, rejected}`` ; chaque story refusée
+    (inconnue, ou non active dans ce sprint pour un retrait) porte un
+    ``code`` et un ``message``.
+    """
+    async with _session() as db:
+        try:
+            result = await db.run_sync(
+                lambda sync_db: sprint_service.update_sprint_stories(
+                    sync_db,
+                    UUID(sprint_id),
+                    add=[UUID(s) for s in add or []],
+                    remove=[UUID(s) for s in remove or []],
+                )
+            )
+        except DomainError as exc:
+            _handle_domain_error(exc)
+        return result.model_dump()
+
+
 # ---------------------------------------------------------------------------
 # Comments
 # ---------------------------------------------------------------------------
 
 
-@server.tool()
+@_tool()
 async def add_comment(
     project_id: str,
     target_type: str,
@@ -510,27 +891,35 @@ async def add_comment(
         target_id=UUID(target_id),
         content=content,
     )
-    with _session() as db:
+    async with _session() as db:
         comment = Comment(
             project_id=payload.project_id,
             target_type=payload.target_type,
             target_id=payload.target_id,
             content=payload.content,
         )
-        db.add(comment)
-        db.commit()
-        db.refresh(comment)
+        await save_async(db, comment)
         return sch.CommentOut.model_validate(comment).model_dump()
 
 
-@server.tool()
+@_tool()
 async def list_comments(
     project_id: Optional[str] = None,
     target_type: Optional[str] = None,
     target_id: Optional[str] = None,
-) -> List[Dict[str, Any]]:
-    """Liste les commentaires, éventuellement filtrés par projet et cible."""
-    with _session() as db:
+    cursor: Optional[str] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+    view: str = sch.ResponseView.FULL.value,
+    fields: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """
+    Liste les commentaires, éventuellement filtrés par projet et cible, paginés par curseur.
+
+    ``view="compact"`` (champs essentiels) ou ``fields`` (liste de champs)
+    réduisent la réponse.
+    """
+    out_fields = _fields(sch.CommentOut, view, fields)
+    async with _session() as db:
         stmt = select(Comment)
         if project_id:
             stmt = stmt.where(Comment.project_id == UUID(project_id))
@@ -539,9 +928,12 @@ async def list_comments(
         if target_id:
             stmt = stmt.where(Comment.target_id == UUID(target_id))
 
-        stmt = stmt.order_by(Comment.created_at.desc())
-        results = db.exec(stmt).all()
-        return [sch.CommentOut.model_validate(c).model_dump() for c in results]
+        stmt = projection.load_fields(stmt, Comment, out_fields)
+        try:
+            page = await paginate_async(db, stmt, Comment, cursor, limit)
+        except DomainError as exc:
+            _handle_domain_error(exc)
+        return _page_out(page, sch.CommentOut, out_fields)
 
 
 # ---------------------------------------------------------------------------
@@ -549,7 +941,7 @@ async def list_comments(
 # ---------------------------------------------------------------------------
 
 
-@server.tool()
+@_tool()
 async def create_document(
     project_id: str,
     title: str,
@@ -566,10 +958,10 @@ async def create_document(
         content=content or "",
         template_key=template_key,
     )
-    with _session() as db:
+    async with _session() as db:
         effective_content = payload.content
         if not effective_content and payload.template_key:
-            tmpl = db.get(DocumentTemplate, payload.template_key)
+            tmpl = await db.get(DocumentTemplate, payload.template_key)
             effective_content = tmpl.content if tmpl else ""
 
         doc = Document(
@@ -578,23 +970,36 @@ async def create_document(
             content=effective_content,
             template_key=payload.template_key,
         )
-        db.add(doc)
-        db.commit()
-        db.refresh(doc)
+        await save_async(db, doc)
         return sch.DocumentOut.model_validate(doc).model_dump()
 
 
-@server.tool()
-async def get_document(document_id: str) -> Dict[str, Any]:
-    """Récupère un document par son identifiant."""
-    with _session() as db:
-        doc = db.get(Document, UUID(document_id))
-        if not doc:
-            raise RuntimeError("DOCUMENT_NOT_FOUND: Document not found")
-        return sch.DocumentOut.model_validate(doc).model_dump()
+@_tool()
+async def get_document(
+    document_id: str,
+    view: str = sch.ResponseView.FULL.value,
+    fields: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """
+    Récupère un document par son identifiant.
+
+    ``view="compact"`` ou ``fields`` (liste de champs) réduisent la réponse.
+    """
+    out_fields = _fields(sch.DocumentOut, view, fields)
 
+    async def load() -> Optional[Document]:
+        async with _session() as db:
+            return await db.get(Document, UUID(document_id))
 
-@server.tool()
+    doc = await entity_cache.read_through_async(
+        "document", UUID(document_id), sch.DocumentOut, load
+    )
+    if not doc:
+        raise RuntimeError("DOCUMENT_NOT_FOUND: Document not found")
+    return projection.dump(doc, out_fields)
+
+
+@_tool()
 async def update_document(
     document_id: str,
     title: Optional[str] = None,
@@ -611,8 +1016,8 @@ async def update_document(
         data["template_key"] = template_key
 
     payload = sch.DocumentUpdate(**data)
-    with _session() as db:
-        doc = db.get(Document, UUID(document_id))
+    async with _session() as db:
+        doc = await db.get(Document, UUID(document_id))
         if not doc:
             raise RuntimeError("DOCUMENT_NOT_FOUND: Document not found")
 
@@ -620,38 +1025,112 @@ async def update_document(
         for field, value in update_data.items():
             setattr(doc, field, value)
 
-        db.add(doc)
-        db.commit()
-        db.refresh(doc)
+        await save_async(db, doc)
         return sch.DocumentOut.model_validate(doc).model_dump()
 
 
-@server.tool()
+@_tool()
 async def list_documents(
     project_id: Optional[str] = None,
     template_key: Optional[str] = None,
-) -> List[Dict[str, Any]]:
-    """Liste les documents, filtrables par projet et template."""
-    with _session() as db:
+    cursor: Optional[str] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+    view: str = sch.ResponseView.FULL.value,
+    fields: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """
+    Liste les documents, filtrables par projet et template, paginés par curseur.
+
+    ``view="compact"`` (champs essentiels) ou ``fields`` (liste de champs)
+    réduisent la réponse.
+    """
+    out_fields = _fields(sch.DocumentOut, view, fields)
+    async with _session() as db:
         stmt = select(Document)
         if project_id:
             stmt = stmt.where(Document.project_id == UUID(project_id))
         if template_key:
             stmt = stmt.where(Document.template_key == template_key)
-        stmt = stmt.order_by(Document.created_at.desc())
-        results = db.exec(stmt).all()
-        return [sch.DocumentOut.model_validate(d).model_dump() for d in results]
+        stmt = projection.load_fields(stmt, Document, out_fields)
+        try:
+            page = await paginate_async(db, stmt, Document, cursor, limit)
+        except DomainError as exc:
+            _handle_domain_error(exc)
+        return _page_out(page, sch.DocumentOut, out_fields)
 
 
-@server.tool()
-async def search_documents(q: str) -> List[Dict[str, Any]]:
-    """Recherche de documents par mot-clé dans le titre."""
-    with _session() as db:
-        stmt = select(Document).where(Document.title.ilike(f"%{q}%")).order_by(
-            Document.created_at.desc()
-        )
-        results = db.exec(stmt).all()
-        return [sch.DocumentOut.model_validate(d).model_dump() for d in results]
+@_tool()
+async def search_documents(
+    q: str,
+    project_id: Optional[str] = None,
+    limit: int = DEFAULT_SEARCH_LIMIT,
+) -> List[Dict[str, Any]]:
+    """Recherche plein texte de documents (titre, contenu), classée par pertinence, avec extrait."""
+    return await _search(q, [SearchEntityType.DOCUMENT], project_id, limit)
+
+
+# ---------------------------------------------------------------------------
+# Batch multi-opérations
+# ---------------------------------------------------------------------------
+
+
+@_tool()
+async def execute_batch(operations: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Exécute plusieurs opérations dans l'ordre, en une seule transaction (tout
+    ou rien). À préférer à une série d'appels, par exemple pour planifier un
+    sprint complet.
+
+    Chaque opération est ``{"op", "args", "ref"}`` : ``op`` parmi
+    create_project, create_epic, create_story, update_story,
+    create_story_description, create_sprint, start_sprint,
+    add_story_to_sprint, add_comment ; ``args`` les arguments du tool du même
+    nom ; ``ref`` (optionnel) un nom pour l'entité créée. Un argument ``*_id``
+    valant ``"$<ref>"`` (ou ``"$<position>"``, ex. ``"$0"``) reçoit l'id créé
+    par une opération précédente.
+
+    Renvoie ``{committed, results}`` ; chaque résultat porte ``status`` (ok,
+    error, rolled_back, skipped), ``result`` et, en erreur, ``code`` et
+    ``message``. À la première erreur, rien n'est écrit.
+    """
+    try:
+        ops = [sch.BatchOperation.model_validate(item) for item in operations]
+    except ValidationError as exc:
+        raise RuntimeError(f"VALIDATION_ERROR: {exc}") from None
+    async with _connect() as conn:
+        try:
+            result = await conn.run_sync(batch_service.execute_batch, ops)
+        except DomainError as exc:
+            _handle_domain_error(exc)
+    for entry in result.results:
+        if entry.status == "error":
+            metrics.DOMAIN_ERRORS.inc(entry.code)
+    return result.model_dump()
+
+
+# ---------------------------------------------------------------------------
+# Recherche unifiée
+# ---------------------------------------------------------------------------
+
+
+@_tool()
+async def search(
+    q: str,
+    project_id: Optional[str] = None,
+    types: Optional[List[str]] = None,
+    per_type_limit: int = DEFAULT_PER_TYPE_LIMIT,
+    limit: int = DEFAULT_SEARCH_LIMIT,
+) -> List[Dict[str, Any]]:
+    """
+    Recherche plein texte sur stories, epics et documents en un seul appel.
+
+    - types : sous-ensemble de story, epic, document (tous par défaut)
+    - per_type_limit : nombre maximal de résultats par type
+    Renvoie une liste fusionnée, classée par pertinence ; chaque résultat
+    porte son ``entity_type``, son ``id`` et un extrait.
+    """
+    entity_types = [SearchEntityType(t) for t in types] if types else None
+    return await _search(q, entity_types, project_id, limit, per_type_limit)
 
 
 # ---------------------------------------------------------------------------
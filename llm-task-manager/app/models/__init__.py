@@ -3,6 +3,7 @@ Package `app.models` : expose les modèles de domaine et les schémas Pydantic.
 
 - `domain`  : modèles ORM (SQLModel) mappés sur la base PostgreSQL
 - `schemas` : modèles Pydantic (v2) pour les payloads d'entrée/sortie
+- `search_index` : DDL de l'index plein texte (attachés à ``SQLModel.metadata``)
 """
 
 from .domain import (  # noqa: F401
@@ -12,7 +13,11 @@ from .domain import (  # noqa: F401
     DocumentTemplate,
     Epic,
     EpicStatus,
+    ProgressRollup,
     Project,
+    RollupScope,
+    SearchEntityType,
+    SearchEntry,
     Sprint,
     SprintStatus,
     Story,
@@ -21,7 +26,7 @@ from .domain import (  # noqa: F401
     StorySprintHistory,
     StoryStatus,
 )
-from . import schemas  # noqa: F401
+from . import schemas, search_index  # noqa: F401
 
 __all__ = [
     # ORM/domain
@@ -34,13 +39,18 @@ __all__ = [
     "Comment",
     "DocumentTemplate",
     "Document",
+    "SearchEntry",
+    "ProgressRollup",
     "EpicStatus",
     "StoryStatus",
     "StoryPriority",
     "SprintStatus",
     "CommentTargetType",
+    "SearchEntityType",
+    "RollupScope",
     # Schemas module
     "schemas",
+    "search_index",
 ]
 
 
@@ -10,7 +10,7 @@ from enum import Enum
 from typing import TYPE_CHECKING, List, Optional
 from uuid import UUID, uuid4
 
-from sqlalchemy import CheckConstraint, Column, Enum as SAEnum, SmallInteger
+from sqlalchemy import CheckConstraint, Column, Enum as SAEnum, Index, SmallInteger, text
 from sqlmodel import Field, Relationship, SQLModel
 
 if TYPE_CHECKING:
@@ -55,6 +55,17 @@ class CommentTargetType(str, Enum):
     STORY = "story"
 
 
+class SearchEntityType(str, Enum):
+    STORY = "story"
+    EPIC = "epic"
+    DOCUMENT = "document"
+
+
+class RollupScope(str, Enum):
+    EPIC = "epic"
+    SPRINT = "sprint"
+
+
 # ---------------------------------------------------------------------------
 # Modèles principaux
 # ---------------------------------------------------------------------------
@@ -65,11 +76,14 @@ class Project(SQLModel, table=True):
 
     __tablename__ = "projects"
 
-    id: UUID = Field(default_factory=uuid4, primary_key=True, index=True)
+    id: UUID = Field(default_factory=uuid4, primary_key=True)
     name: str = Field(index=True, max_length=255)
     description: Optional[str] = Field(default=None)
     created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    updated_at: datetime = Field(
+        default_factory=datetime.utcnow,
+        sa_column_kwargs={"onupdate": datetime.utcnow},
+    )
 
     epics: List["Epic"] = Relationship(back_populates="project")
     stories: List["Story"] = Relationship(back_populates="project")
@@ -83,7 +97,7 @@ class Epic(SQLModel, table=True):
 
     __tablename__ = "epics"
 
-    id: UUID = Field(default_factory=uuid4, primary_key=True, index=True)
+    id: UUID = Field(default_factory=uuid4, primary_key=True)
     project_id: UUID = Field(foreign_key="projects.id", index=True)
     title: str = Field(max_length=255)
     status: EpicStatus = Field(
@@ -91,7 +105,10 @@ class Epic(SQLModel, table=True):
         sa_column=Column(SAEnum(EpicStatus, name="epic_status")),
     )
     created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    updated_at: datetime = Field(
+        default_factory=datetime.utcnow,
+        sa_column_kwargs={"onupdate": datetime.utcnow},
+    )
 
     project: Project = Relationship(back_populates="epics")
     stories: List["Story"] = Relationship(back_populates="epic")
@@ -106,9 +123,15 @@ class Story(SQLModel, table=True):
             "story_points IN (0, 1, 2, 3, 5, 8, 13)",
             name="story_points_fibonacci_check",
         ),
+        # Listes paginées ``ORDER BY created_at DESC, id DESC``, sans filtre
+        # ou filtrées par statut / priorité / assignee : pas de tri en mémoire
+        Index("ix_stories_created_at", "created_at", "id"),
+        Index("ix_stories_status_created_at", "status", "created_at", "id"),
+        Index("ix_stories_priority_created_at", "priority", "created_at", "id"),
+        Index("ix_stories_assignee_created_at", "assignee", "created_at", "id"),
     )
 
-    id: UUID = Field(default_factory=uuid4, primary_key=True, index=True)
+    id: UUID = Field(default_factory=uuid4, primary_key=True)
     project_id: UUID = Field(foreign_key="projects.id", index=True)
     epic_id: Optional[UUID] = Field(default=None, foreign_key="epics.id", index=True)
 
@@ -130,7 +153,10 @@ class Story(SQLModel, table=True):
 
     assignee: Optional[str] = Field(default=None, max_length=255)
     created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    updated_at: datetime = Field(
+        default_factory=datetime.utcnow,
+        sa_column_kwargs={"onupdate": datetime.utcnow},
+    )
 
     project: Project = Relationship(back_populates="stories")
     epic: Optional[Epic] = Relationship(back_populates="stories")
@@ -151,7 +177,7 @@ class Sprint(SQLModel, table=True):
 
     __tablename__ = "sprints"
 
-    id: UUID = Field(default_factory=uuid4, primary_key=True, index=True)
+    id: UUID = Field(default_factory=uuid4, primary_key=True)
     project_id: UUID = Field(foreign_key="projects.id", index=True)
 
     name: str = Field(max_length=255)
@@ -164,7 +190,10 @@ class Sprint(SQLModel, table=True):
     end_date: Optional[date] = Field(default=None)
 
     created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    updated_at: datetime = Field(
+        default_factory=datetime.utcnow,
+        sa_column_kwargs={"onupdate": datetime.utcnow},
+    )
 
     project: Project = Relationship(back_populates="sprints")
     story_history: List["StorySprintHistory"] = Relationship(
@@ -178,16 +207,28 @@ class StorySprintHistory(SQLModel, table=True):
     Historique many-to-many entre Story et Sprint.
 
     Une story peut passer dans plusieurs sprints successifs,
-    mais ne peut être active que dans un seul sprint à la fois.
+    mais ne peut être active que dans un seul sprint à la fois : règle
+    garantie par l'index unique partiel ``uq_story_sprint_history_active``.
     """
 
     __tablename__ = "story_sprint_history"
+    __table_args__ = (
+        Index(
+            "uq_story_sprint_history_active",
+            "story_id",
+            unique=True,
+            postgresql_where=text("is_active"),
+            sqlite_where=text("is_active"),
+        ),
+        # Stories actives d'un sprint (liste, clôture, rollups) sans lire la table
+        Index("ix_story_sprint_history_sprint_active", "sprint_id", "is_active", "story_id"),
+    )
 
-    id: UUID = Field(default_factory=uuid4, primary_key=True, index=True)
+    id: UUID = Field(default_factory=uuid4, primary_key=True)
     story_id: UUID = Field(foreign_key="stories.id", index=True)
-    sprint_id: UUID = Field(foreign_key="sprints.id", index=True)
+    sprint_id: UUID = Field(foreign_key="sprints.id")
 
-    is_active: bool = Field(default=True, index=True)
+    is_active: bool = Field(default=True)
     added_at: datetime = Field(default_factory=datetime.utcnow)
     removed_at: Optional[datetime] = Field(default=None)
 
@@ -200,14 +241,17 @@ class StoryDescription(SQLModel, table=True):
 
     __tablename__ = "story_descriptions"
 
-    id: UUID = Field(default_factory=uuid4, primary_key=True, index=True)
+    id: UUID = Field(default_factory=uuid4, primary_key=True)
     story_id: UUID = Field(foreign_key="stories.id", index=True, unique=True)
 
     description: str = Field(default="")
     acceptance_criteria: Optional[str] = Field(default=None)
 
     created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    updated_at: datetime = Field(
+        default_factory=datetime.utcnow,
+        sa_column_kwargs={"onupdate": datetime.utcnow},
+    )
 
     story: Story = Relationship(back_populates="story_description")
 
@@ -216,14 +260,18 @@ class Comment(SQLModel, table=True):
     """Commentaire sur un epic ou une story."""
 
     __tablename__ = "comments"
+    __table_args__ = (
+        # Fil de commentaires d'une cible, paginé par ``(created_at, id)``
+        Index("ix_comments_target_created_at", "target_id", "target_type", "created_at", "id"),
+    )
 
-    id: UUID = Field(default_factory=uuid4, primary_key=True, index=True)
+    id: UUID = Field(default_factory=uuid4, primary_key=True)
     project_id: UUID = Field(foreign_key="projects.id", index=True)
 
     target_type: CommentTargetType = Field(
         sa_column=Column(SAEnum(CommentTargetType, name="comment_target_type")),
     )
-    target_id: UUID = Field(index=True)
+    target_id: UUID
 
     content: str = Field(max_length=2000)
     created_at: datetime = Field(default_factory=datetime.utcnow)
@@ -250,7 +298,7 @@ class Document(SQLModel, table=True):
 
     __tablename__ = "documents"
 
-    id: UUID = Field(default_factory=uuid4, primary_key=True, index=True)
+    id: UUID = Field(default_factory=uuid4, primary_key=True)
     project_id: UUID = Field(foreign_key="projects.id", index=True)
 
     title: str = Field(max_length=255)
@@ -263,12 +311,57 @@ class Document(SQLModel, table=True):
     )
 
     created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    updated_at: datetime = Field(
+        default_factory=datetime.utcnow,
+        sa_column_kwargs={"onupdate": datetime.utcnow},
+    )
 
     project: Project = Relationship(back_populates="documents")
     template: Optional[DocumentTemplate] = Relationship(back_populates="documents")
 
 
+class SearchEntry(SQLModel, table=True):
+    """
+    Entrée de l'index de recherche plein texte (stories, epics, documents).
+
+    Projection dénormalisée maintenue exclusivement par des triggers SQL
+    (cf. ``app.models.search_index``) : ne jamais l'écrire depuis l'application.
+    Pour une story, ``body`` contient la description et les critères
+    d'acceptation ; pour un document, son contenu.
+    """
+
+    __tablename__ = "search_entries"
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    entity_type: str = Field(max_length=20)
+    entity_id: UUID = Field(unique=True)
+    project_id: UUID = Field(index=True)
+    title: str = Field(default="")
+    body: str = Field(default="")
+
+
+class ProgressRollup(SQLModel, table=True):
+    """
+    Compteurs de progression d'un epic ou d'un sprint, par statut de story.
+
+    Une ligne par ``(scope_type, scope_id, status)`` : nombre de stories et
+    somme des story points. Pour un sprint, seules les stories actives
+    (``StorySprintHistory.is_active``) sont comptées. Maintenue
+    incrémentalement par les services (cf. ``app.services.rollups``), dans la
+    transaction de l'écriture ; ``rebuild_rollups`` la recalcule entièrement.
+    """
+
+    __tablename__ = "progress_rollups"
+
+    scope_type: str = Field(primary_key=True, max_length=10)
+    scope_id: UUID = Field(primary_key=True)
+    status: StoryStatus = Field(
+        sa_column=Column(SAEnum(StoryStatus, name="story_status"), primary_key=True),
+    )
+    story_count: int = Field(default=0)
+    story_points: int = Field(default=0)
+
+
 __all__ = [
     "Project",
     "Epic",
@@ -279,10 +372,14 @@ __all__ = [
     "Comment",
     "DocumentTemplate",
     "Document",
+    "SearchEntry",
+    "ProgressRollup",
     "EpicStatus",
     "StoryStatus",
     "StoryPriority",
     "SprintStatus",
     "CommentTargetType",
+    "SearchEntityType",
+    "RollupScope",
 ]
 
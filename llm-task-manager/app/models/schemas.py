@@ -9,14 +9,18 @@ Ils sont séparés des modèles ORM (`domain.py`) afin de :
 from __future__ import annotations
 
 from datetime import date, datetime
-from typing import Optional
+from enum import Enum
+from functools import lru_cache
+from typing import Any, Generic, Iterable, List, Optional, TypeVar
 from uuid import UUID
 
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, TypeAdapter
 
 from app.models.domain import (
     CommentTargetType,
     EpicStatus,
+    RollupScope,
+    SearchEntityType,
     SprintStatus,
     StoryPriority,
     StoryStatus,
@@ -34,6 +38,50 @@ class ORMBaseModel(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+T = TypeVar("T")
+
+
+class Page(BaseModel, Generic[T]):
+    """
+    Page de résultats d'une liste paginée par curseur.
+
+    ``next_cursor`` est à renvoyer tel quel (paramètre ``cursor``) pour obtenir
+    la page suivante ; il vaut ``None`` sur la dernière page.
+    """
+
+    items: List[T]
+    next_cursor: Optional[str] = None
+
+
+class ResponseView(str, Enum):
+    """
+    Vue d'une réponse de liste / lecture : tous les champs (``full``) ou les
+    seuls champs utiles à un LLM (``compact``, cf. ``app.services.projection``).
+    """
+
+    FULL = "full"
+    COMPACT = "compact"
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(model: type[BaseModel]) -> TypeAdapter[Any]:
+    return TypeAdapter(List[model])  # type: ignore[valid-type]
+
+
+def validate_many(model: type[ORMBaseModel], objs: Iterable[Any]) -> list[Any]:
+    """
+    Valide des objets ORM vers ``model`` en un seul appel pydantic-core,
+    plutôt qu'un ``model_validate`` par ligne.
+    """
+    return _list_adapter(model).validate_python(list(objs), from_attributes=True)
+
+
+def dump_many(model: type[ORMBaseModel], objs: Iterable[Any]) -> list[dict[str, Any]]:
+    """``validate_many`` suivi de ``model_dump`` de toutes les lignes, en un appel chacun."""
+    adapter = _list_adapter(model)
+    return adapter.dump_python(adapter.validate_python(list(objs), from_attributes=True))
+
+
 # ---------------------------------------------------------------------------
 # Project
 # ---------------------------------------------------------------------------
@@ -134,6 +182,59 @@ class StoryOut(ORMBaseModel):
     updated_at: datetime
 
 
+class BatchItemError(BaseModel):
+    """Erreur sur un élément d'une opération par lot."""
+
+    index: int = Field(..., description="Position de l'élément dans la requête (à partir de 0).")
+    code: str
+    message: str
+
+
+class StoryBatchCreate(BaseModel):
+    items: List[StoryCreate] = Field(..., min_length=1)
+
+
+class StoryBatchCreateResult(BaseModel):
+    """Stories créées (dans l'ordre de la requête) et éléments rejetés."""
+
+    created: List[StoryOut]
+    errors: List[BatchItemError]
+
+
+class StoryFilter(BaseModel):
+    """Sélection de stories par critères (combinés par ET)."""
+
+    project_id: Optional[UUID] = None
+    epic_id: Optional[UUID] = None
+    sprint_id: Optional[UUID] = Field(default=None, description="Stories actives dans ce sprint.")
+    status: Optional[StoryStatus] = None
+    priority: Optional[StoryPriority] = None
+    assignee: Optional[str] = None
+
+
+class StoryBulkTransition(BaseModel):
+    """Transition de statut d'un ensemble de stories (``story_ids`` ou ``filter``)."""
+
+    status: StoryStatus = Field(..., description="Statut cible.")
+    story_ids: Optional[List[UUID]] = None
+    filter: Optional[StoryFilter] = None
+
+
+class StoryTransitionRejection(BaseModel):
+    id: UUID
+    status: Optional[StoryStatus] = Field(
+        default=None, description="Statut actuel (None si la story n'existe pas)."
+    )
+    code: str
+    message: str
+
+
+class StoryBulkTransitionResult(BaseModel):
+    updated: List[UUID]
+    unchanged: List[UUID] = Field(..., description="Stories déjà dans le statut cible.")
+    rejected: List[StoryTransitionRejection]
+
+
 # ---------------------------------------------------------------------------
 # StoryDescription
 # ---------------------------------------------------------------------------
@@ -198,6 +299,26 @@ class SprintOut(ORMBaseModel):
     updated_at: datetime
 
 
+class SprintStoriesBatch(BaseModel):
+    """Stories à ajouter au sprint (``add``) et à en retirer (``remove``)."""
+
+    add: List[UUID] = Field(default_factory=list)
+    remove: List[UUID] = Field(default_factory=list)
+
+
+class SprintStoryRejection(BaseModel):
+    id: UUID
+    code: str
+    message: str
+
+
+class SprintStoriesBatchResult(BaseModel):
+    added: List[UUID]
+    removed: List[UUID]
+    unchanged: List[UUID] = Field(..., description="Stories déjà actives dans ce sprint.")
+    rejected: List[SprintStoryRejection]
+
+
 # ---------------------------------------------------------------------------
 # Comment
 # ---------------------------------------------------------------------------
@@ -260,7 +381,172 @@ class DocumentOut(ORMBaseModel):
     updated_at: datetime
 
 
+# ---------------------------------------------------------------------------
+# Recherche plein texte
+# ---------------------------------------------------------------------------
+
+
+class SearchHit(BaseModel):
+    """Résultat de recherche plein texte, classé par pertinence décroissante."""
+
+    entity_type: SearchEntityType
+    id: UUID
+    project_id: UUID
+    title: str
+    snippet: str = Field(..., description="Extrait du texte, termes trouvés entre [crochets].")
+    rank: float = Field(..., description="Score de pertinence (plus élevé = plus pertinent).")
+
+
+# ---------------------------------------------------------------------------
+# Tableau de bord projet
+# ---------------------------------------------------------------------------
+
+
+class SummaryBucket(BaseModel):
+    """Nombre de stories et somme des story points pour une valeur de regroupement."""
+
+    key: Optional[str] = Field(
+        default=None,
+        description="Valeur regroupée (statut, priorité, assignee, id d'epic ou de sprint) ; "
+        "None = non renseigné.",
+    )
+    label: Optional[str] = Field(default=None, description="Titre de l'epic ou nom du sprint.")
+    count: int
+    points: int
+
+
+class ProjectSummary(BaseModel):
+    """Agrégats des stories d'un projet, calculés en SQL (GROUP BY)."""
+
+    project_id: UUID
+    story_count: int
+    story_points: int
+    by_status: List[SummaryBucket]
+    by_priority: List[SummaryBucket]
+    by_assignee: List[SummaryBucket]
+    by_epic: List[SummaryBucket]
+    by_sprint: List[SummaryBucket] = Field(
+        ..., description="Sprint actif de chaque story (lien is_active) ; None = hors sprint."
+    )
+
+
+class ProgressOut(BaseModel):
+    """Progression d'un epic ou d'un sprint (lue depuis la table de rollup)."""
+
+    scope_type: RollupScope
+    scope_id: UUID
+    story_count: int
+    story_points: int
+    done_count: int
+    done_points: int
+    by_status: List[SummaryBucket]
+
+
+# ---------------------------------------------------------------------------
+# Instantané de projet (amorçage du contexte d'un LLM)
+# ---------------------------------------------------------------------------
+
+
+class SnapshotStory(BaseModel):
+    id: UUID
+    title: str
+    status: StoryStatus
+    priority: StoryPriority
+    story_points: int
+    assignee: Optional[str] = None
+    sprint_id: Optional[UUID] = Field(default=None, description="Sprint actif de la story.")
+
+
+class SnapshotEpic(BaseModel):
+    id: UUID
+    title: str
+    status: EpicStatus
+    story_count: int = Field(..., description="Toutes les stories de l'epic, terminées comprises.")
+    story_points: int
+    done_points: int
+    stories: List[SnapshotStory] = Field(
+        ..., description="Stories non terminées, et stories du sprint actif."
+    )
+
+
+class SnapshotSprint(BaseModel):
+    id: UUID
+    name: str
+    status: SprintStatus
+    start_date: Optional[date] = None
+    end_date: Optional[date] = None
+    story_ids: List[UUID] = Field(..., description="Stories actives du sprint (détail dans ``epics``).")
+    story_points: int
+    done_points: int
+
+
+class SnapshotComment(BaseModel):
+    id: UUID
+    target_type: CommentTargetType
+    target_id: UUID
+    content: str
+    created_at: datetime
+
+
+class ProjectSnapshot(BaseModel):
+    """
+    Vue hiérarchique compacte d'un projet : epics → stories, sprint actif,
+    derniers commentaires. Les stories terminées hors sprint actif ne sont
+    que comptées (``story_count`` / ``done_points`` des epics).
+    """
+
+    project_id: UUID
+    name: str
+    description: Optional[str] = None
+    epics: List[SnapshotEpic]
+    stories_without_epic: List[SnapshotStory]
+    active_sprint: Optional[SnapshotSprint] = None
+    recent_comments: List[SnapshotComment]
+
+
+# ---------------------------------------------------------------------------
+# Batch multi-opérations (tool MCP ``execute_batch``)
+# ---------------------------------------------------------------------------
+
+
+class BatchOperation(BaseModel):
+    """
+    Opération d'un batch : nom du tool (``op``) et ses arguments.
+
+    Une chaîne ``"$<ref>"`` dans ``args`` est remplacée par l'identifiant créé
+    par l'opération antérieure nommée ``ref`` (ou de position ``<ref>``).
+    """
+
+    op: str = Field(..., description="Opération : create_story, add_story_to_sprint, ...")
+    args: dict[str, Any] = Field(default_factory=dict)
+    ref: Optional[str] = Field(
+        default=None, description="Nom réutilisable par les opérations suivantes (``$ref``)."
+    )
+
+
+class BatchOperationResult(BaseModel):
+    index: int
+    op: str
+    ref: Optional[str] = None
+    status: str = Field(..., description="ok, error, rolled_back ou skipped.")
+    result: Optional[dict[str, Any]] = None
+    code: Optional[str] = None
+    message: Optional[str] = None
+
+
+class BatchResult(BaseModel):
+    """Résultat d'un batch : validé en entier (``committed``) ou annulé en entier."""
+
+    committed: bool
+    results: List[BatchOperationResult]
+
+
 __all__ = [
+    # Pagination
+    "Page",
+    "ResponseView",
+    "validate_many",
+    "dump_many",
     # Projects
     "ProjectBase",
     "ProjectCreate",
@@ -276,6 +562,13 @@ __all__ = [
     "StoryCreate",
     "StoryUpdate",
     "StoryOut",
+    "BatchItemError",
+    "StoryBatchCreate",
+    "StoryBatchCreateResult",
+    "StoryFilter",
+    "StoryBulkTransition",
+    "StoryTransitionRejection",
+    "StoryBulkTransitionResult",
     # StoryDescriptions
     "StoryDescriptionBase",
     "StoryDescriptionCreate",
@@ -286,6 +579,9 @@ __all__ = [
     "SprintCreate",
     "SprintUpdate",
     "SprintOut",
+    "SprintStoriesBatch",
+    "SprintStoryRejection",
+    "SprintStoriesBatchResult",
     # Comments
     "CommentCreate",
     "CommentOut",
@@ -295,5 +591,21 @@ __all__ = [
     "DocumentCreate",
     "DocumentUpdate",
     "DocumentOut",
+    # Search
+    "SearchHit",
+    # Tableau de bord
+    "SummaryBucket",
+    "ProjectSummary",
+    "ProgressOut",
+    # Instantané de projet
+    "SnapshotStory",
+    "SnapshotEpic",
+    "SnapshotSprint",
+    "SnapshotComment",
+    "ProjectSnapshot",
+    # Batch
+    "BatchOperation",
+    "BatchOperationResult",
+    "BatchResult",
 ]
 
@@ -5,10 +5,30 @@ Cette couche encapsule :
 - les règles de workflow des stories
 - la gestion des sprints (start/close, affectation)
 - l'application des règles métier décrites dans ARCHITECTURE.md
+- la pagination par curseur partagée par REST et MCP
+- la projection des réponses (vue ``compact`` / ``fields``)
+- la recherche plein texte (index ``search_entries``)
+- le cache de lecture des entités (``get_*``) et son invalidation
+- les agrégats de tableau de bord par projet
+- les rollups de progression des epics et sprints
+- les métriques exposées sur ``/metrics`` (latences, erreurs, pools)
+- l'exécution de batchs d'opérations en une transaction (tool ``execute_batch``)
 """
 
 from .errors import DomainError  # noqa: F401
-from . import stories, sprints  # noqa: F401
+from . import batch, cache, metrics, pagination, projection, projects, rollups, search, stories, sprints  # noqa: F401
 
-__all__ = ["DomainError", "stories", "sprints"]
+__all__ = [
+    "DomainError",
+    "batch",
+    "cache",
+    "metrics",
+    "pagination",
+    "projection",
+    "projects",
+    "rollups",
+    "search",
+    "stories",
+    "sprints",
+]
 
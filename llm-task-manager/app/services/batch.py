@@ -0,0 +1,288 @@
+"""
+Exécution d'un batch d'opérations dans une seule transaction.
+
+Un LLM qui planifie un sprint enchaîne des dizaines d'appels
+(``create_story``, ``create_story_description``, ``add_story_to_sprint``,
+``add_comment``...), chacun avec sa session et son commit. ``execute_batch``
+les exécute dans l'ordre, sur une seule connexion et une seule transaction :
+
+- chaque opération porte le nom du tool MCP équivalent et ses arguments ;
+- un argument ``*_id`` de la forme ``"$<ref>"`` désigne l'identifiant créé
+  par une opération antérieure, nommée par son ``ref`` ou par sa position
+  (``"$0"``) ;
+- tout ou rien : à la première erreur, la transaction est annulée, les
+  opérations précédentes sont rapportées ``rolled_back`` et les suivantes
+  ``skipped``.
+
+Les services métier sont réutilisés tels quels : la session est jointe à la
+transaction de la connexion (``join_transaction_mode="rollback_only"``), si
+bien que leurs ``commit()`` ne valident rien en base et que leurs
+``rollback()`` annulent tout le batch. L'invalidation du cache d'entités est
+différée au commit effectif (cf. ``cache.defer_invalidation``).
+
+Les entités créées ou chargées restent référencées par la session jusqu'à
+la fin du batch (``_hold_references``) : une opération qui cible une entité
+d'une opération antérieure la retrouve dans l'identity map, sans la relire en
+base. Seuls les verrous (``SELECT ... FOR UPDATE`` de ``add_story_to_sprint``)
+sont repris à chaque opération.
+"""
+
+from collections.abc import Callable, Sequence
+from typing import Any, Final, Optional
+from uuid import UUID
+
+from pydantic import BaseModel, ValidationError
+from sqlalchemy import event
+from sqlalchemy.engine import Connection
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session, select
+
+from app.db.writes import save
+from app.models import Comment, Epic, Project, Sprint, Story, StoryDescription
+from app.models import schemas as sch
+from app.services import cache
+from app.services import sprints as sprint_service
+from app.services import stories as story_service
+from app.services.errors import DomainError
+from app.services.stories import MAX_BATCH_SIZE
+
+
+Operation = Callable[[Session, dict[str, Any]], Optional[BaseModel]]
+
+# Clés de ``db.info`` : entités référencées, stories créées encore sans description
+_REFERENCES_KEY: Final[str] = "batch_references"
+_NEW_STORIES_KEY: Final[str] = "batch_new_stories"
+
+
+def _hold_references(db: Session) -> None:
+    """
+    Garde une référence forte sur chaque entité persistante de ``db``.
+
+    L'identity map ne référence les entités que faiblement : les opérations
+    ne renvoyant que des schémas, leurs entités seraient libérées aussitôt
+    et rechargées par les opérations suivantes. Les références vivent dans
+    ``db.info`` jusqu'à la fermeture de la session.
+    """
+    held: list[Any] = db.info.setdefault(_REFERENCES_KEY, [])
+
+    @event.listens_for(db, "pending_to_persistent")
+    @event.listens_for(db, "loaded_as_persistent")
+    def _hold(session: Session, instance: Any) -> None:
+        held.append(instance)
+
+
+def _uuid(args: dict[str, Any], name: str) -> UUID:
+    value = args.get(name)
+    try:
+        return value if isinstance(value, UUID) else UUID(str(value))
+    except ValueError:
+        raise DomainError(
+            code="VALIDATION_ERROR", message=f"'{name}' must be a UUID.", http_status=400
+        ) from None
+
+
+def _create_project(db: Session, args: dict[str, Any]) -> sch.ProjectOut:
+    payload = sch.ProjectCreate.model_validate(args)
+    project = Project(name=payload.name, description=payload.description)
+    save(db, project)
+    return sch.ProjectOut.model_validate(project)
+
+
+def _create_epic(db: Session, args: dict[str, Any]) -> sch.EpicOut:
+    payload = sch.EpicCreate.model_validate(args)
+    epic = Epic(project_id=payload.project_id, title=payload.title, status=payload.status)
+    save(db, epic)
+    return sch.EpicOut.model_validate(epic)
+
+
+def _create_story(db: Session, args: dict[str, Any]) -> sch.StoryOut:
+    story = story_service.create_story(db, sch.StoryCreate.model_validate(args))
+    db.info.setdefault(_NEW_STORIES_KEY, set()).add(story.id)
+    return sch.StoryOut.model_validate(story)
+
+
+def _update_story(db: Session, args: dict[str, Any]) -> sch.StoryOut:
+    story_id = _uuid(args, "story_id")
+    payload = sch.StoryUpdate.model_validate({k: v for k, v in args.items() if k != "story_id"})
+    return sch.StoryOut.model_validate(story_service.update_story(db, story_id, payload))
+
+
+def _create_story_description(db: Session, args: dict[str, Any]) -> sch.StoryDescriptionOut:
+    payload = sch.StoryDescriptionCreate.model_validate(args)
+    new_stories: set[UUID] = db.info.get(_NEW_STORIES_KEY, set())
+    if payload.story_id in new_stories:
+        # Story créée par ce batch : existe, et n'a pas encore de description
+        new_stories.discard(payload.story_id)
+    else:
+        if db.get(Story, payload.story_id) is None:
+            raise DomainError(code="STORY_NOT_FOUND", message="Story not found.", http_status=404)
+        existing = db.exec(
+            select(StoryDescription.id).where(StoryDescription.story_id == payload.story_id)
+        ).first()
+        if existing is not None:
+            raise DomainError(
+                code="DESCRIPTION_EXISTS",
+                message="A description already exists for this story.",
+                http_status=409,
+            )
+    desc = StoryDescription(
+        story_id=payload.story_id,
+        description=payload.description,
+        acceptance_criteria=payload.acceptance_criteria,
+    )
+    save(db, desc)
+    return sch.StoryDescriptionOut.model_validate(desc)
+
+
+def _create_sprint(db: Session, args: dict[str, Any]) -> sch.SprintOut:
+    payload = sch.SprintCreate.model_validate(args)
+    sprint = Sprint(
+        project_id=payload.project_id,
+        name=payload.name,
+        status=payload.status,
+        start_date=payload.start_date,
+        end_date=payload.end_date,
+    )
+    save(db, sprint)
+    return sch.SprintOut.model_validate(sprint)
+
+
+def _start_sprint(db: Session, args: dict[str, Any]) -> sch.SprintOut:
+    return sch.SprintOut.model_validate(sprint_service.start_sprint(db, _uuid(args, "sprint_id")))
+
+
+def _add_story_to_sprint(db: Session, args: dict[str, Any]) -> None:
+    sprint_service.add_story_to_sprint(db, _uuid(args, "sprint_id"), _uuid(args, "story_id"))
+    return None
+
+
+def _add_comment(db: Session, args: dict[str, Any]) -> sch.CommentOut:
+    payload = sch.CommentCreate.model_validate(args)
+    comment = Comment(
+        project_id=payload.project_id,
+        target_type=payload.target_type,
+        target_id=payload.target_id,
+        content=payload.content,
+    )
+    save(db, comment)
+    return sch.CommentOut.model_validate(comment)
+
+
+OPERATIONS: Final[dict[str, Operation]] = {
+    "create_project": _create_project,
+    "create_epic": _create_epic,
+    "create_story": _create_story,
+    "update_story": _update_story,
+    "create_story_description": _create_story_description,
+    "create_sprint": _create_sprint,
+    "start_sprint": _start_sprint,
+    "add_story_to_sprint": _add_story_to_sprint,
+    "add_comment": _add_comment,
+}
+
+
+def _resolve(args: dict[str, Any], refs: dict[str, UUID]) -> dict[str, Any]:
+    """Remplace les références ``"$<ref>"`` des arguments ``*_id``."""
+    resolved = dict(args)
+    for name, value in args.items():
+        if name.endswith("_id") and isinstance(value, str) and value.startswith("$"):
+            if value[1:] not in refs:
+                raise DomainError(
+                    code="INVALID_REFERENCE",
+                    message=f"'{value}' does not match an earlier operation that created an entity.",
+                    http_status=400,
+                )
+            resolved[name] = refs[value[1:]]
+    return resolved
+
+
+def _check(operations: Sequence[sch.BatchOperation]) -> None:
+    """Rejette le batch entier avant toute écriture (taille, opération ou ``ref`` invalide)."""
+    if len(operations) > MAX_BATCH_SIZE:
+        raise DomainError(
+            code="BATCH_TOO_LARGE",
+            message=f"At most {MAX_BATCH_SIZE} operations per batch.",
+            http_status=400,
+        )
+    seen: set[str] = set()
+    for index, operation in enumerate(operations):
+        if operation.op not in OPERATIONS:
+            raise DomainError(
+                code="UNKNOWN_OPERATION",
+                message=f"Operation {index}: '{operation.op}' is not one of {sorted(OPERATIONS)}.",
+                http_status=400,
+            )
+        if operation.ref is not None:
+            if operation.ref in seen or operation.ref.isdigit():
+                raise DomainError(
+                    code="INVALID_REFERENCE",
+                    message=f"Operation {index}: ref '{operation.ref}' is already used or numeric.",
+                    http_status=400,
+                )
+            seen.add(operation.ref)
+
+
+def execute_batch(connection: Connection, operations: Sequence[sch.BatchOperation]) -> sch.BatchResult:
+    """
+    Exécute ``operations`` dans l'ordre, dans une transaction ouverte sur
+    ``connection`` (qui ne doit pas en avoir d'autre en cours).
+
+    Les erreurs métier et de validation d'une opération annulent le batch et
+    sont rapportées dans son résultat ; les autres exceptions sont propagées
+    (après annulation).
+    """
+    _check(operations)
+    results = [
+        sch.BatchOperationResult(index=index, op=operation.op, ref=operation.ref, status="skipped")
+        for index, operation in enumerate(operations)
+    ]
+    refs: dict[str, UUID] = {}
+    failed: Optional[int] = None
+
+    transaction = connection.begin()
+    db = Session(bind=connection, join_transaction_mode="rollback_only", expire_on_commit=False)
+    cache.defer_invalidation(db)
+    _hold_references(db)
+    try:
+        for index, operation in enumerate(operations):
+            entry = results[index]
+            try:
+                out = OPERATIONS[operation.op](db, _resolve(operation.args, refs))
+            except DomainError as exc:
+                entry.code, entry.message = exc.code, exc.message
+            except ValidationError as exc:
+                entry.code, entry.message = "VALIDATION_ERROR", str(exc)
+            except IntegrityError as exc:
+                entry.code, entry.message = "INTEGRITY_ERROR", str(exc.orig)
+            else:
+                entry.status = "ok"
+                entry.result = out.model_dump() if out is not None else None
+                created_id = getattr(out, "id", None)
+                if created_id is not None:
+                    refs[str(index)] = created_id
+                    if operation.ref is not None:
+                        refs[operation.ref] = created_id
+                continue
+            entry.status = "error"
+            failed = index
+            break
+
+        if failed is None:
+            transaction.commit()
+            cache.invalidate_pending(db)
+        else:
+            if transaction.is_active:  # déjà annulée si un service a fait ``rollback()``
+                transaction.rollback()
+            for entry in results[:failed]:
+                entry.status, entry.result = "rolled_back", None
+    except BaseException:
+        if transaction.is_active:
+            transaction.rollback()
+        raise
+    finally:
+        db.close()
+
+    return sch.BatchResult(committed=failed is None, results=results)
+
+
+__all__ = ["OPERATIONS", "execute_batch"]
@@ -0,0 +1,365 @@
+"""
+Cache de lecture (read-through) des entités pour les chemins ``get_*``.
+
+Entités mises en cache : stories, epics, documents et descriptions de
+stories (indexées par ``story_id``), ainsi que les instantanés de projets.
+Les valeurs sont les schémas de sortie sérialisés en JSON, ce qui permet de
+partager le même format entre backends.
+
+Backends (cf. ``CACHE_BACKEND``) :
+- ``memory`` (défaut) : LRU en mémoire du processus, avec TTL
+- ``redis`` : cache partagé entre instances (client ``redis`` optionnel,
+  ou tout client exposant ``get`` / ``set(ex=)`` / ``delete`` / ``scan_iter``)
+- ``none`` : cache désactivé
+
+Invalidation : tout commit d'une session SQLModel (REST, MCP, services)
+invalide les entités insérées, modifiées ou supprimées qu'elle a flushées.
+Les écritures ensemblistes (``UPDATE`` SQL sans passer par l'ORM) doivent
+appeler ``entity_cache.invalidate`` (ou ``invalidate_on_commit``)
+explicitement ; une session jointe à une transaction externe diffère
+l'invalidation (``defer_invalidation``).
+
+L'instantané d'un projet (``project_snapshot``, cf.
+``app.services.projects.project_snapshot``) est invalidé par toute écriture
+sur le projet, ses epics, stories, sprints et commentaires.
+
+Variables d'env :
+- CACHE_BACKEND (memory | redis | none)
+- CACHE_TTL_SECONDS (défaut 60)
+- CACHE_MAX_ENTRIES (défaut 1024, backend memory)
+- CACHE_REDIS_URL (backend redis)
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from typing import Any, Optional, Protocol, TypeVar
+
+from pydantic import BaseModel
+from sqlalchemy import event
+from sqlalchemy.orm import Session as SASession
+
+from app.models import Comment, Document, Epic, Project, Sprint, Story, StoryDescription
+
+
+M = TypeVar("M", bound=BaseModel)
+
+
+# ---------------------------------------------------------------------------
+# Backends
+# ---------------------------------------------------------------------------
+
+
+class CacheBackend(Protocol):
+    """Stockage clé → JSON avec expiration."""
+
+    def get(self, key: str) -> Optional[str]: ...
+
+    def set(self, key: str, value: str, ttl: float) -> None: ...
+
+    def delete(self, *keys: str) -> None: ...
+
+    def clear(self) -> None: ...
+
+
+class NullBackend:
+    """Backend désactivé : aucun stockage."""
+
+    def get(self, key: str) -> Optional[str]:
+        return None
+
+    def set(self, key: str, value: str, ttl: float) -> None:
+        return None
+
+    def delete(self, *keys: str) -> None:
+        return None
+
+    def clear(self) -> None:
+        return None
+
+
+class LRUBackend:
+    """LRU en mémoire du processus, thread-safe, avec expiration par entrée."""
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        self.max_entries = max_entries
+        self._data: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: str, ttl: float) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def delete(self, *keys: str) -> None:
+        with self._lock:
+            for key in keys:
+                self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class RedisBackend:
+    """
+    Cache partagé sur un client de type Redis.
+
+    Le client n'est pas importé par ce module : il est fourni par l'appelant
+    (``redis.Redis.from_url(...)`` en production, un substitut en test).
+    """
+
+    def __init__(self, client: Any, prefix: str = "ltm:cache:") -> None:
+        self.client = client
+        self.prefix = prefix
+
+    def get(self, key: str) -> Optional[str]:
+        value = self.client.get(self.prefix + key)
+        if isinstance(value, bytes):
+            return value.decode()
+        return value
+
+    def set(self, key: str, value: str, ttl: float) -> None:
+        self.client.set(self.prefix + key, value, ex=max(1, int(ttl)))
+
+    def delete(self, *keys: str) -> None:
+        if keys:
+            self.client.delete(*(self.prefix + key for key in keys))
+
+    def clear(self) -> None:
+        keys = list(self.client.scan_iter(match=self.prefix + "*"))
+        if keys:
+            self.client.delete(*keys)
+
+
+# ---------------------------------------------------------------------------
+# Cache d'entités
+# ---------------------------------------------------------------------------
+
+
+class EntityCache:
+    """
+    Façade read-through au-dessus d'un ``CacheBackend``.
+
+    Les clés sont de la forme ``<kind>:<id>`` (ex: ``story:<uuid>``).
+    Les compteurs hits / misses sont tenus par type d'entité.
+    """
+
+    def __init__(self, backend: CacheBackend, ttl: float = 60.0) -> None:
+        self.backend = backend
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._hits: dict[str, int] = {}
+        self._misses: dict[str, int] = {}
+
+    @staticmethod
+    def _key(kind: str, key: Any) -> str:
+        return f"{kind}:{key}"
+
+    def _count(self, counters: dict[str, int], kind: str) -> None:
+        with self._lock:
+            counters[kind] = counters.get(kind, 0) + 1
+
+    def get(self, kind: str, key: Any, out_model: type[M]) -> Optional[M]:
+        raw = self.backend.get(self._key(kind, key))
+        if raw is None:
+            self._count(self._misses, kind)
+            return None
+        self._count(self._hits, kind)
+        return out_model.model_validate_json(raw)
+
+    def set(self, kind: str, key: Any, value: BaseModel) -> None:
+        self.backend.set(self._key(kind, key), value.model_dump_json(), self.ttl)
+
+    def invalidate(self, kind: str, *keys: Any) -> None:
+        self.backend.delete(*(self._key(kind, key) for key in keys))
+
+    def read_through(
+        self,
+        kind: str,
+        key: Any,
+        out_model: type[M],
+        load: Callable[[], Optional[Any]],
+    ) -> Optional[M]:
+        """Renvoie l'entité depuis le cache, ou la charge via ``load`` et la met en cache."""
+        cached = self.get(kind, key, out_model)
+        if cached is not None:
+            return cached
+        obj = load()
+        if obj is None:
+            return None
+        out = out_model.model_validate(obj)
+        self.set(kind, key, out)
+        return out
+
+    async def read_through_async(
+        self,
+        kind: str,
+        key: Any,
+        out_model: type[M],
+        load: Callable[[], Awaitable[Optional[Any]]],
+    ) -> Optional[M]:
+        """Variante de ``read_through`` pour un chargeur asynchrone (tools MCP)."""
+        cached = self.get(kind, key, out_model)
+        if cached is not None:
+            return cached
+        obj = await load()
+        if obj is None:
+            return None
+        out = out_model.model_validate(obj)
+        self.set(kind, key, out)
+        return out
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            hits = dict(self._hits)
+            misses = dict(self._misses)
+        total_hits, total_misses = sum(hits.values()), sum(misses.values())
+        lookups = total_hits + total_misses
+        return {
+            "backend": type(self.backend).__name__,
+            "hits": total_hits,
+            "misses": total_misses,
+            "hit_ratio": round(total_hits / lookups, 4) if lookups else 0.0,
+            "by_kind": {
+                kind: {"hits": hits.get(kind, 0), "misses": misses.get(kind, 0)}
+                for kind in sorted(hits.keys() | misses.keys())
+            },
+        }
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._hits.clear()
+            self._misses.clear()
+
+    def clear(self) -> None:
+        self.backend.clear()
+        self.reset_stats()
+
+
+def _build_backend() -> CacheBackend:
+    kind = os.getenv("CACHE_BACKEND", "memory").lower()
+    if kind == "none":
+        return NullBackend()
+    if kind == "redis":
+        import redis  # dépendance optionnelle, uniquement pour ce backend
+
+        return RedisBackend(redis.Redis.from_url(os.environ["CACHE_REDIS_URL"]))
+    return LRUBackend(max_entries=int(os.getenv("CACHE_MAX_ENTRIES", "1024")))
+
+
+entity_cache = EntityCache(
+    _build_backend(),
+    ttl=float(os.getenv("CACHE_TTL_SECONDS", "60")),
+)
+
+
+# ---------------------------------------------------------------------------
+# Invalidation sur commit
+# ---------------------------------------------------------------------------
+
+# type ORM -> (kind, clé de cache)
+_CACHED_ENTITIES: dict[type, tuple[str, Callable[[Any], Any]]] = {
+    Story: ("story", lambda obj: obj.id),
+    Epic: ("epic", lambda obj: obj.id),
+    Document: ("document", lambda obj: obj.id),
+    StoryDescription: ("story_description", lambda obj: obj.story_id),
+}
+
+# type ORM -> projet dont l'instantané (``project_snapshot``) est à invalider
+_SNAPSHOT_PROJECTS: dict[type, Callable[[Any], Any]] = {
+    Project: lambda obj: obj.id,
+    Epic: lambda obj: obj.project_id,
+    Story: lambda obj: obj.project_id,
+    Sprint: lambda obj: obj.project_id,
+    Comment: lambda obj: obj.project_id,
+}
+
+_PENDING_KEY = "entity_cache_pending"
+_DEFERRED_KEY = "entity_cache_deferred"
+
+
+@event.listens_for(SASession, "after_flush")
+def _collect_changes(session: SASession, flush_context: Any) -> None:
+    pending: set[tuple[str, Any]] = session.info.setdefault(_PENDING_KEY, set())
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        entry = _CACHED_ENTITIES.get(type(obj))
+        if entry is not None:
+            kind, key = entry
+            pending.add((kind, key(obj)))
+            if kind == "story":
+                # Suppression en cascade de la description
+                pending.add(("story_description", obj.id))
+        project_of = _SNAPSHOT_PROJECTS.get(type(obj))
+        if project_of is not None:
+            pending.add(("project_snapshot", project_of(obj)))
+
+
+@event.listens_for(SASession, "after_commit")
+def _invalidate_committed(session: SASession) -> None:
+    if not session.info.get(_DEFERRED_KEY):
+        invalidate_pending(session)
+
+
+def invalidate_on_commit(session: SASession, kind: str, *keys: Any) -> None:
+    """
+    Invalide ``kind:<key>`` au prochain commit de ``session`` (abandonné en
+    cas de rollback) : pour les écritures ensemblistes, invisibles de
+    ``after_flush``.
+    """
+    session.info.setdefault(_PENDING_KEY, set()).update((kind, key) for key in keys)
+
+
+def defer_invalidation(session: SASession) -> None:
+    """
+    Reporte l'invalidation des entités flushées par ``session`` à un appel
+    explicite de ``invalidate_pending``.
+
+    Pour une session jointe à une transaction externe
+    (``join_transaction_mode="rollback_only"``) : ses ``commit()`` ne valident
+    rien en base, l'invalidation doit suivre le commit de la transaction externe.
+    """
+    session.info[_DEFERRED_KEY] = True
+
+
+def invalidate_pending(session: SASession) -> None:
+    """Invalide les entités flushées par ``session`` depuis le dernier commit ou rollback."""
+    for kind, key in session.info.pop(_PENDING_KEY, ()):
+        entity_cache.invalidate(kind, key)
+
+
+@event.listens_for(SASession, "after_rollback")
+def _discard_pending(session: SASession) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+__all__ = [
+    "CacheBackend",
+    "NullBackend",
+    "LRUBackend",
+    "RedisBackend",
+    "EntityCache",
+    "entity_cache",
+    "invalidate_on_commit",
+    "defer_invalidation",
+    "invalidate_pending",
+]
@@ -0,0 +1,241 @@
+"""
+Métriques applicatives exposées au format texte Prometheus (``GET /metrics``).
+
+- ``http_request_duration_seconds{method, route, status}`` : histogramme de
+  latence par route (gabarit de chemin, pas l'URL brute)
+- ``mcp_tool_duration_seconds{tool, outcome}`` : histogramme par tool MCP
+- ``domain_errors_total{code}`` : ``DomainError`` renvoyées aux clients
+  (REST et MCP), par code
+- ``db_pool_size`` / ``db_pool_checked_out`` / ``db_pool_overflow{pool}`` :
+  état des pools SQLAlchemy, lu au moment de la collecte
+- ``db_pool_exhausted_total{pool}`` : checkouts ayant pris la dernière
+  connexion disponible (la suivante attendra ``pool_timeout``)
+- ``entity_cache_hits_total`` / ``entity_cache_misses_total{kind}`` : lectures
+  du cache d'entités par type, lues au moment de la collecte
+
+Collecte volontairement minimale sur le chemin critique : une recherche
+dichotomique et quelques incréments sous verrou par observation ; la mise
+en forme n'a lieu qu'à la lecture de ``/metrics``. Les percentiles (p50,
+p99) se calculent côté Prometheus (``histogram_quantile``).
+"""
+
+import threading
+from bisect import bisect_left
+from collections.abc import Mapping, Sequence
+from typing import Any, Final, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import Pool
+
+
+LATENCY_BUCKETS: Final[tuple[float, ...]] = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    return "{" + ",".join(f'{n}="{_escape(str(v))}"' for n, v in zip(names, values)) + "}"
+
+
+class Counter:
+    """Compteur monotone, par combinaison de labels."""
+
+    def __init__(self, name: str, help_text: str, label_names: Sequence[str] = ()) -> None:
+        self.name = name
+        self.help_text = help_text
+        self.label_names = tuple(label_names)
+        self._values: dict[tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def value(self, *labels: str) -> float:
+        return self._values.get(labels, 0.0)
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            items = list(self._values.items())
+        lines += [f"{self.name}{_labels(self.label_names, k)} {v:g}" for k, v in items]
+        return lines
+
+
+class Histogram:
+    """Histogramme à buckets fixes (cumulés à la collecte), par combinaison de labels."""
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        label_names: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ) -> None:
+        self.name = name
+        self.help_text = help_text
+        self.label_names = tuple(label_names)
+        self.buckets = tuple(buckets)
+        # Par série : un compteur par bucket (+ ``+Inf``), puis somme et total
+        self._series: dict[tuple[str, ...], list[float]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *labels: str) -> None:
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [0.0] * (len(self.buckets) + 3)
+            series[index] += 1
+            series[-2] += value
+            series[-1] += 1
+
+    def count(self, *labels: str) -> int:
+        series = self._series.get(labels)
+        return int(series[-1]) if series else 0
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            items = [(k, list(v)) for k, v in self._series.items()]
+        names = (*self.label_names, "le")
+        for labels, series in items:
+            cumulative = 0.0
+            for bound, hits in zip((*self.buckets, "+Inf"), series):
+                cumulative += hits
+                le = bound if isinstance(bound, str) else f"{bound:g}"
+                lines.append(f"{self.name}_bucket{_labels(names, (*labels, le))} {cumulative:g}")
+            suffix = _labels(self.label_names, labels)
+            lines.append(f"{self.name}_sum{suffix} {series[-2]:.6f}")
+            lines.append(f"{self.name}_count{suffix} {series[-1]:g}")
+        return lines
+
+
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "Durée des requêtes HTTP par route.",
+    ("method", "route", "status"),
+)
+MCP_TOOL_DURATION = Histogram(
+    "mcp_tool_duration_seconds",
+    "Durée des appels de tools MCP.",
+    ("tool", "outcome"),
+)
+DOMAIN_ERRORS = Counter(
+    "domain_errors_total",
+    "Erreurs métier renvoyées aux clients, par code.",
+    ("code",),
+)
+POOL_EXHAUSTED = Counter(
+    "db_pool_exhausted_total",
+    "Checkouts ayant pris la dernière connexion disponible du pool.",
+    ("pool",),
+)
+
+
+def pool_capacity(pool: Pool) -> Optional[int]:
+    """Nombre maximal de connexions simultanées (``None`` : pool non borné)."""
+    if not hasattr(pool, "size") or not hasattr(pool, "_max_overflow"):
+        return None
+    if pool._max_overflow < 0:  # type: ignore[attr-defined]
+        return None
+    return pool.size() + pool._max_overflow  # type: ignore[attr-defined]
+
+
+def watch_pool(engine: Engine, name: str) -> None:
+    """Compte les checkouts qui épuisent le pool de ``engine`` (pools bornés uniquement)."""
+    pool = engine.pool
+    capacity = pool_capacity(pool)
+    if capacity is None:
+        return
+
+    def _on_checkout(*_: Any) -> None:
+        if pool.checkedout() >= capacity:  # type: ignore[attr-defined]
+            POOL_EXHAUSTED.inc(name)
+
+    event.listen(pool, "checkout", _on_checkout)
+
+
+def pool_stats(pool: Pool) -> Optional[dict[str, int]]:
+    """État d'un pool borné (``None`` pour les pools SQLite non bornés)."""
+    capacity = pool_capacity(pool)
+    if capacity is None:
+        return None
+    return {
+        "size": pool.size(),  # type: ignore[attr-defined]
+        "checked_out": pool.checkedout(),  # type: ignore[attr-defined]
+        "overflow": pool.overflow(),  # type: ignore[attr-defined]
+        "capacity": capacity,
+    }
+
+
+def _render_pool_gauges(pools: Mapping[str, Pool]) -> list[str]:
+    gauges = {
+        "db_pool_size": ("Connexions maintenues par le pool.", "size"),
+        "db_pool_checked_out": ("Connexions actuellement empruntées.", "checked_out"),
+        "db_pool_overflow": ("Connexions ouvertes au-delà de pool_size.", "overflow"),
+    }
+    stats = {name: pool_stats(pool) for name, pool in pools.items()}
+    lines: list[str] = []
+    for metric, (help_text, key) in gauges.items():
+        samples = [
+            f"{metric}{_labels(('pool',), (name,))} {values[key]}"
+            for name, values in stats.items()
+            if values is not None
+        ]
+        if samples:
+            lines += [f"# HELP {metric} {help_text}", f"# TYPE {metric} gauge", *samples]
+    return lines
+
+
+def _render_cache_counters(by_kind: Mapping[str, Mapping[str, int]]) -> list[str]:
+    counters = {
+        "entity_cache_hits_total": ("Lectures servies par le cache d'entités.", "hits"),
+        "entity_cache_misses_total": ("Lectures absentes du cache d'entités.", "misses"),
+    }
+    lines: list[str] = []
+    for metric, (help_text, key) in counters.items():
+        lines += [f"# HELP {metric} {help_text}", f"# TYPE {metric} counter"]
+        lines += [
+            f"{metric}{_labels(('kind',), (kind,))} {values[key]}"
+            for kind, values in by_kind.items()
+        ]
+    return lines
+
+
+def render(
+    pools: Optional[Mapping[str, Pool]] = None,
+    cache: Optional[Mapping[str, Mapping[str, int]]] = None,
+) -> str:
+    """
+    Exposition texte Prometheus de toutes les métriques ; ``cache`` : hits et
+    misses du cache d'entités par type (``entity_cache.stats()["by_kind"]``).
+    """
+    lines: list[str] = []
+    for metric in (HTTP_REQUEST_DURATION, MCP_TOOL_DURATION, DOMAIN_ERRORS, POOL_EXHAUSTED):
+        lines += metric.render()
+    lines += _render_pool_gauges(pools or {})
+    lines += _render_cache_counters(cache or {})
+    return "\n".join(lines) + "\n"
+
+
+__all__ = [
+    "LATENCY_BUCKETS",
+    "Counter",
+    "Histogram",
+    "HTTP_REQUEST_DURATION",
+    "MCP_TOOL_DURATION",
+    "DOMAIN_ERRORS",
+    "POOL_EXHAUSTED",
+    "pool_capacity",
+    "pool_stats",
+    "watch_pool",
+    "render",
+]
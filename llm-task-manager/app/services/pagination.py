@@ -0,0 +1,134 @@
+"""
+Pagination par curseur (keyset) partagée par les couches REST et MCP.
+
+Le curseur est opaque pour le client : il encode la clé ``(created_at, id)``
+de la dernière ligne renvoyée. La page suivante est obtenue par
+``WHERE (created_at, id) < (:created_at, :id) ORDER BY created_at DESC, id DESC``,
+ce qui garde un coût constant quelle que soit la profondeur de la page
+(contrairement à ``OFFSET``).
+
+Les fonctions sont découpées pour fonctionner avec une session synchrone
+comme asynchrone :
+- ``apply_cursor`` : ajoute filtre keyset, tri et ``LIMIT`` à un ``select``
+- ``build_page``   : construit la ``Page`` à partir des lignes récupérées
+- ``paginate``     : raccourci pour une session synchrone
+- ``paginate_async`` : raccourci pour une session asynchrone (tools MCP)
+"""
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Generic, Optional, Sequence, TypeVar
+from uuid import UUID
+
+from sqlalchemy import tuple_
+from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.services.errors import DomainError
+
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+T = TypeVar("T")
+
+
+@dataclass
+class Page(Generic[T]):
+    """Une page de résultats et le curseur permettant d'obtenir la suivante."""
+
+    items: list[T] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+
+
+def encode_cursor(created_at: datetime, row_id: UUID) -> str:
+    """Encode la clé ``(created_at, id)`` en curseur opaque (base64 url-safe)."""
+    raw = json.dumps([created_at.isoformat(), str(row_id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """Décode un curseur produit par ``encode_cursor``."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, row_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(created_at), UUID(row_id)
+    except (binascii.Error, ValueError, TypeError) as exc:
+        raise DomainError(
+            code="INVALID_CURSOR",
+            message="Malformed pagination cursor.",
+            http_status=400,
+        ) from exc
+
+
+def clamp_limit(limit: Optional[int]) -> int:
+    """Ramène ``limit`` dans l'intervalle ``[1, MAX_PAGE_SIZE]``."""
+    if limit is None:
+        return DEFAULT_PAGE_SIZE
+    return max(1, min(limit, MAX_PAGE_SIZE))
+
+
+def apply_cursor(stmt: Any, model: Any, cursor: Optional[str], limit: int) -> Any:
+    """
+    Applique le filtre keyset, le tri ``(created_at, id) DESC`` et la limite.
+
+    Une ligne de plus que ``limit`` est demandée afin de savoir s'il existe
+    une page suivante sans requête ``COUNT`` supplémentaire.
+    """
+    if cursor:
+        created_at, row_id = decode_cursor(cursor)
+        stmt = stmt.where(tuple_(model.created_at, model.id) < tuple_(created_at, row_id))
+    return stmt.order_by(model.created_at.desc(), model.id.desc()).limit(limit + 1)
+
+
+def build_page(rows: Sequence[T], limit: int) -> Page[T]:
+    """Construit la page à partir des ``limit + 1`` lignes récupérées."""
+    items = list(rows[:limit])
+    next_cursor = None
+    if len(rows) > limit and items:
+        last = items[-1]
+        next_cursor = encode_cursor(last.created_at, last.id)  # type: ignore[attr-defined]
+    return Page(items=items, next_cursor=next_cursor)
+
+
+def paginate(
+    db: Session,
+    stmt: Any,
+    model: Any,
+    cursor: Optional[str] = None,
+    limit: Optional[int] = None,
+) -> Page[Any]:
+    """Exécute ``stmt`` paginé par curseur sur une session synchrone."""
+    limit = clamp_limit(limit)
+    rows = db.exec(apply_cursor(stmt, model, cursor, limit)).all()
+    return build_page(rows, limit)
+
+
+async def paginate_async(
+    db: AsyncSession,
+    stmt: Any,
+    model: Any,
+    cursor: Optional[str] = None,
+    limit: Optional[int] = None,
+) -> Page[Any]:
+    """Exécute ``stmt`` paginé par curseur sur une session asynchrone."""
+    limit = clamp_limit(limit)
+    rows = (await db.exec(apply_cursor(stmt, model, cursor, limit))).all()
+    return build_page(rows, limit)
+
+
+__all__ = [
+    "DEFAULT_PAGE_SIZE",
+    "MAX_PAGE_SIZE",
+    "Page",
+    "encode_cursor",
+    "decode_cursor",
+    "clamp_limit",
+    "apply_cursor",
+    "build_page",
+    "paginate",
+    "paginate_async",
+]
@@ -0,0 +1,104 @@
+"""
+Projection des réponses de liste et de lecture, partagée par REST et MCP.
+
+Une liste complète renvoie, pour chaque ligne, identifiants, horodatages et
+tous les champs du schéma de sortie : autant d'octets lus en base, encodés
+puis placés dans le contexte d'un LLM. Le client peut restreindre la
+réponse :
+
+- ``view=compact`` : champs essentiels de chaque type (``COMPACT_FIELDS``) ;
+- ``fields=...`` : liste explicite de champs du schéma de sortie (prioritaire
+  sur ``view``) ; ``id`` est toujours renvoyé.
+
+Sur les listes, seules les colonnes nécessaires sont lues (``load_only``,
+plus la clé de pagination ``(created_at, id)`` et ``updated_at``, version
+servant à l'ETag de la page) et les lignes sont
+sérialisées sans validation Pydantic, directement depuis les attributs
+chargés. Les lectures unitaires (servies par le cache d'entités) ne
+réduisent que la réponse.
+"""
+
+from collections.abc import Iterable, Sequence
+from typing import Any, Final, Optional, Union
+
+from pydantic import BaseModel
+from sqlalchemy.orm import load_only
+
+from app.models import schemas as sch
+from app.models.schemas import ResponseView
+from app.services.errors import DomainError
+
+
+COMPACT_FIELDS: Final[dict[type[BaseModel], tuple[str, ...]]] = {
+    sch.ProjectOut: ("id", "name"),
+    sch.EpicOut: ("id", "title", "status"),
+    sch.StoryOut: ("id", "epic_id", "title", "status", "priority", "story_points", "assignee"),
+    sch.StoryDescriptionOut: ("story_id", "description", "acceptance_criteria"),
+    sch.SprintOut: ("id", "name", "status", "start_date", "end_date"),
+    sch.CommentOut: ("id", "target_type", "target_id", "content", "created_at"),
+    sch.DocumentOut: ("id", "title", "template_key", "updated_at"),
+}
+
+# Colonnes toujours chargées sur une liste : clé du curseur de pagination et
+# version de la ligne (ETag de la page, cf. ``app.api.conditional``)
+_ALWAYS_LOADED: Final[tuple[str, ...]] = ("id", "created_at", "updated_at")
+
+
+def resolve_fields(
+    out_model: type[BaseModel],
+    view: Union[ResponseView, str] = ResponseView.FULL,
+    fields: Optional[Sequence[str]] = None,
+) -> Optional[tuple[str, ...]]:
+    """
+    Champs à renvoyer pour ``out_model``, dans l'ordre du schéma ; ``None``
+    pour la vue complète (chemin habituel, sans projection).
+    """
+    known = out_model.model_fields
+    if fields:
+        requested = {name.strip() for name in fields if name.strip()}
+        unknown = sorted(requested - known.keys())
+        if unknown:
+            raise DomainError(
+                code="INVALID_FIELDS",
+                message=f"Unknown fields {unknown}; allowed: {list(known)}.",
+                http_status=400,
+            )
+        if "id" in known:
+            requested.add("id")
+        return tuple(name for name in known if name in requested)
+
+    try:
+        view = ResponseView(view)
+    except ValueError:
+        raise DomainError(
+            code="INVALID_FIELDS",
+            message=f"view must be one of {[v.value for v in ResponseView]}.",
+            http_status=400,
+        ) from None
+    if view == ResponseView.FULL:
+        return None
+    return COMPACT_FIELDS[out_model]
+
+
+def load_fields(stmt: Any, model: Any, fields: Optional[Sequence[str]]) -> Any:
+    """Restreint le ``SELECT`` de ``stmt`` aux colonnes de ``fields`` (et à la clé de pagination)."""
+    if fields is None:
+        return stmt
+    always = (name for name in _ALWAYS_LOADED if hasattr(model, name))
+    names = dict.fromkeys((*always, *fields))
+    return stmt.options(load_only(*(getattr(model, name) for name in names)))
+
+
+def dump_fields(objs: Iterable[Any], fields: Sequence[str]) -> list[dict[str, Any]]:
+    """Sérialise les attributs ``fields`` de chaque objet (chargés par ``load_fields``)."""
+    return [{name: getattr(obj, name) for name in fields} for obj in objs]
+
+
+def dump(out: BaseModel, fields: Optional[Sequence[str]]) -> dict[str, Any]:
+    """``model_dump`` d'un schéma de sortie, restreint à ``fields`` le cas échéant."""
+    if fields is None:
+        return out.model_dump()
+    return out.model_dump(include=set(fields))
+
+
+__all__ = ["COMPACT_FIELDS", "resolve_fields", "load_fields", "dump_fields", "dump"]
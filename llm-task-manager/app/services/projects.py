@@ -0,0 +1,239 @@
+"""
+Services de lecture agrégée pour les projets.
+
+``project_summary`` calcule le tableau de bord d'un projet (nombre de stories
+et somme des story points par statut, priorité, assignee, epic et sprint
+actif) en SQL, sans charger les stories en mémoire : un seul parcours des
+stories du projet, groupé par ``(status, priority, assignee, epic_id,
+sprint_id)``. Le nombre de lignes renvoyées est celui des combinaisons
+distinctes (quelques centaines en pratique, quel que soit le volume de
+stories) ; chaque dimension en est ensuite dérivée.
+
+``project_snapshot`` assemble la vue hiérarchique servie à un LLM en début
+de conversation (epics → stories, sprint actif, derniers commentaires), en
+un nombre fixe de requêtes ; elle est mise en cache par projet jusqu'à la
+prochaine écriture (cf. ``app.services.cache``).
+"""
+
+from collections import defaultdict
+from collections.abc import Iterable
+from typing import Any, Final, Optional
+from uuid import UUID
+
+from sqlalchemy import case, func
+from sqlmodel import Session, and_, or_, select
+
+from app.models import Comment, Epic, Project, Sprint, Story, StorySprintHistory
+from app.models import schemas as sch
+from app.models.domain import SprintStatus, StoryPriority, StoryStatus
+from app.services.errors import DomainError
+
+
+RECENT_COMMENTS: Final[int] = 10
+
+
+def _buckets(
+    totals: dict[Any, list[int]],
+    labels: Optional[dict[Any, str]] = None,
+    order: Optional[Iterable[Any]] = None,
+) -> list[sch.SummaryBucket]:
+    """
+    Construit les buckets d'une dimension.
+
+    Avec ``order`` (dimension énumérée), toutes les valeurs sont présentes,
+    dans cet ordre ; sinon, tri par nombre de stories décroissant.
+    """
+    labels = labels or {}
+    keys = list(order) if order is not None else sorted(
+        totals, key=lambda k: (-totals[k][0], "" if k is None else str(k))
+    )
+    return [
+        sch.SummaryBucket(
+            key=None if key is None else str(getattr(key, "value", key)),
+            label=labels.get(key),
+            count=totals.get(key, (0, 0))[0],
+            points=totals.get(key, (0, 0))[1],
+        )
+        for key in keys
+    ]
+
+
+def _labels(db: Session, id_column: Any, label_column: Any, keys: Iterable[Any]) -> dict[Any, str]:
+    """Libellés (titre d'epic, nom de sprint) des identifiants présents dans ``keys``."""
+    ids = [key for key in keys if key is not None]
+    if not ids:
+        return {}
+    return dict(db.exec(select(id_column, label_column).where(id_column.in_(ids))).all())
+
+
+def project_summary(db: Session, project_id: UUID) -> sch.ProjectSummary:
+    """Tableau de bord agrégé des stories d'un projet."""
+    if db.get(Project, project_id) is None:
+        raise DomainError(
+            code="PROJECT_NOT_FOUND",
+            message="Project not found.",
+            http_status=404,
+        )
+
+    dimensions = (
+        Story.status,
+        Story.priority,
+        Story.assignee,
+        Story.epic_id,
+        StorySprintHistory.sprint_id,
+    )
+    rows = db.exec(
+        select(*dimensions, func.count(Story.id), func.coalesce(func.sum(Story.story_points), 0))
+        .select_from(Story)
+        .outerjoin(
+            StorySprintHistory,
+            and_(
+                StorySprintHistory.story_id == Story.id,
+                StorySprintHistory.is_active.is_(True),
+            ),
+        )
+        .where(Story.project_id == project_id)
+        .group_by(*dimensions)
+    ).all()
+
+    # totals[dimension][valeur] = [count, points]
+    totals: list[dict[Any, list[int]]] = [defaultdict(lambda: [0, 0]) for _ in dimensions]
+    for *keys, count, points in rows:
+        for dimension, key in zip(totals, keys):
+            dimension[key][0] += count
+            dimension[key][1] += points
+    by_status, by_priority, by_assignee, by_epic, by_sprint = totals
+
+    return sch.ProjectSummary(
+        project_id=project_id,
+        story_count=sum(count for count, _ in by_status.values()),
+        story_points=sum(points for _, points in by_status.values()),
+        by_status=_buckets(by_status, order=StoryStatus),
+        by_priority=_buckets(by_priority, order=StoryPriority),
+        by_assignee=_buckets(by_assignee),
+        by_epic=_buckets(by_epic, labels=_labels(db, Epic.id, Epic.title, by_epic)),
+        by_sprint=_buckets(by_sprint, labels=_labels(db, Sprint.id, Sprint.name, by_sprint)),
+    )
+
+
+def project_snapshot(db: Session, project_id: UUID) -> sch.ProjectSnapshot:
+    """
+    Instantané d'un projet en six requêtes, quel que soit son volume : projet,
+    sprint actif, stories listées (non terminées ou du sprint actif) avec leur
+    sprint, totaux par epic (``GROUP BY``), epics, derniers commentaires.
+    """
+    project = db.get(Project, project_id)
+    if project is None:
+        raise DomainError(
+            code="PROJECT_NOT_FOUND",
+            message="Project not found.",
+            http_status=404,
+        )
+
+    sprint = db.exec(
+        select(Sprint)
+        .where(Sprint.project_id == project_id, Sprint.status == SprintStatus.ACTIVE)
+        .order_by(Sprint.created_at.desc())
+        .limit(1)
+    ).first()
+
+    listed = Story.status != StoryStatus.DONE
+    if sprint is not None:
+        listed = or_(listed, StorySprintHistory.sprint_id == sprint.id)
+    story_rows = db.exec(
+        select(
+            Story.id,
+            Story.epic_id,
+            Story.title,
+            Story.status,
+            Story.priority,
+            Story.story_points,
+            Story.assignee,
+            StorySprintHistory.sprint_id,
+        )
+        .select_from(Story)
+        .outerjoin(
+            StorySprintHistory,
+            and_(
+                StorySprintHistory.story_id == Story.id,
+                StorySprintHistory.is_active.is_(True),
+            ),
+        )
+        .where(Story.project_id == project_id, listed)
+        .order_by(Story.created_at, Story.id)
+    ).all()
+
+    done_points = case((Story.status == StoryStatus.DONE, Story.story_points), else_=0)
+    totals = {
+        epic_id: (count, points, done)
+        for epic_id, count, points, done in db.exec(
+            select(
+                Story.epic_id,
+                func.count(Story.id),
+                func.coalesce(func.sum(Story.story_points), 0),
+                func.coalesce(func.sum(done_points), 0),
+            )
+            .where(Story.project_id == project_id)
+            .group_by(Story.epic_id)
+        ).all()
+    }
+    epic_rows = db.exec(
+        select(Epic.id, Epic.title, Epic.status)
+        .where(Epic.project_id == project_id)
+        .order_by(Epic.created_at, Epic.id)
+    ).all()
+    comment_rows = db.exec(
+        select(Comment.id, Comment.target_type, Comment.target_id, Comment.content, Comment.created_at)
+        .where(Comment.project_id == project_id)
+        .order_by(Comment.created_at.desc(), Comment.id.desc())
+        .limit(RECENT_COMMENTS)
+    ).all()
+
+    by_epic: dict[Optional[UUID], list[sch.SnapshotStory]] = defaultdict(list)
+    for row in story_rows:
+        by_epic[row.epic_id].append(sch.SnapshotStory.model_validate(dict(row._mapping)))
+
+    epics = []
+    for epic_id, title, epic_status in epic_rows:
+        count, points, done = totals.get(epic_id, (0, 0, 0))
+        epics.append(
+            sch.SnapshotEpic(
+                id=epic_id,
+                title=title,
+                status=epic_status,
+                story_count=count,
+                story_points=points,
+                done_points=done,
+                stories=by_epic.pop(epic_id, []),
+            )
+        )
+
+    active_sprint = None
+    if sprint is not None:
+        in_sprint = [story for story in story_rows if story.sprint_id == sprint.id]
+        active_sprint = sch.SnapshotSprint(
+            id=sprint.id,
+            name=sprint.name,
+            status=sprint.status,
+            start_date=sprint.start_date,
+            end_date=sprint.end_date,
+            story_ids=[story.id for story in in_sprint],
+            story_points=sum(story.story_points for story in in_sprint),
+            done_points=sum(
+                story.story_points for story in in_sprint if story.status == StoryStatus.DONE
+            ),
+        )
+
+    return sch.ProjectSnapshot(
+        project_id=project.id,
+        name=project.name,
+        description=project.description,
+        epics=epics,
+        # Stories sans epic (ou d'un epic introuvable)
+        stories_without_epic=[story for stories in by_epic.values() for story in stories],
+        active_sprint=active_sprint,
+        recent_comments=[sch.SnapshotComment.model_validate(dict(row._mapping)) for row in comment_rows],
+    )
+
+
+__all__ = ["RECENT_COMMENTS", "project_summary", "project_snapshot"]
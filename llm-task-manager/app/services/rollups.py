@@ -0,0 +1,228 @@
+"""
+Rollups de progression des epics et des sprints.
+
+La table ``progress_rollups`` tient, pour chaque epic et chaque sprint, le
+nombre de stories et la somme des story points par ``StoryStatus``. Elle
+est maintenue incrémentalement par les services d'écriture, **dans la même
+transaction** que l'écriture elle-même (avant le ``commit``) :
+- ``stories.create_story`` / ``stories.update_story``
+- ``sprints.add_story_to_sprint`` / ``sprints.remove_story_from_sprint``
+
+Chaque mise à jour est un ``INSERT ... ON CONFLICT DO UPDATE`` qui ajoute
+des deltas (``story_count = story_count + :delta``) : deux transactions
+concurrentes ne s'écrasent pas. La lecture d'une progression est alors une
+recherche par clé primaire (au plus une ligne par statut).
+
+``rebuild_rollups`` recalcule entièrement la table depuis ``stories`` et
+``story_sprint_history`` (indexation initiale, réparation d'une dérive) ;
+en ligne de commande : ``python -c "from app.services.rollups import main; main()"``
+ou ``llm-task-manager-rebuild-rollups`` une fois le paquet installé.
+"""
+
+from collections import defaultdict
+from typing import Any, NamedTuple, Optional
+from uuid import UUID
+
+from sqlalchemy import func, literal, select as sa_select, union_all
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import Connection
+from sqlmodel import Session, select
+
+from app.models import Epic, ProgressRollup, Sprint, Story, StorySprintHistory
+from app.models import schemas as sch
+from app.models.domain import RollupScope, StoryStatus
+from app.services.errors import DomainError
+
+
+class StoryState(NamedTuple):
+    """Ce qui, d'une story, compte dans les rollups."""
+
+    epic_id: Optional[UUID]
+    sprint_id: Optional[UUID]
+    status: StoryStatus
+    points: int
+
+
+def story_state(story: Story, sprint_id: Optional[UUID]) -> StoryState:
+    return StoryState(story.epic_id, sprint_id, story.status, story.story_points)
+
+
+def sprint_membership(story: Story, sprint_id: UUID) -> StoryState:
+    """État d'une story ne comptant que pour le rollup du sprint (affectation / retrait)."""
+    return StoryState(None, sprint_id, story.status, story.story_points)
+
+
+def active_sprint_id(db: Session, story_id: UUID) -> Optional[UUID]:
+    """Sprint dans lequel la story est active, le cas échéant."""
+    return db.exec(
+        select(StorySprintHistory.sprint_id).where(
+            StorySprintHistory.story_id == story_id,
+            StorySprintHistory.is_active.is_(True),
+        )
+    ).first()
+
+
+def _scopes(state: StoryState) -> list[tuple[RollupScope, UUID]]:
+    scopes = []
+    if state.epic_id is not None:
+        scopes.append((RollupScope.EPIC, state.epic_id))
+    if state.sprint_id is not None:
+        scopes.append((RollupScope.SPRINT, state.sprint_id))
+    return scopes
+
+
+def record_story_change(
+    db: Session,
+    before: Optional[StoryState],
+    after: Optional[StoryState],
+) -> None:
+    """
+    Reporte dans les rollups le passage d'une story de ``before`` à ``after``
+    (``None`` : la story n'existait pas / n'existe plus).
+
+    N'effectue aucun ``commit`` : l'appelant l'inclut dans sa transaction.
+    """
+    record_story_changes(db, [(before, after)])
+
+
+def record_story_changes(
+    db: Session,
+    changes: list[tuple[Optional[StoryState], Optional[StoryState]]],
+) -> None:
+    """Variante ensembliste de ``record_story_change`` : une seule requête d'upsert."""
+    deltas: dict[tuple[RollupScope, UUID, StoryStatus], list[int]] = defaultdict(lambda: [0, 0])
+    for before, after in changes:
+        for state, sign in ((before, -1), (after, 1)):
+            if state is None:
+                continue
+            for scope_type, scope_id in _scopes(state):
+                delta = deltas[(scope_type, scope_id, state.status)]
+                delta[0] += sign
+                delta[1] += sign * state.points
+
+    rows = [
+        {
+            "scope_type": scope_type.value,
+            "scope_id": scope_id,
+            "status": status,
+            "story_count": count,
+            "story_points": points,
+        }
+        for (scope_type, scope_id, status), (count, points) in deltas.items()
+        if count or points
+    ]
+    if not rows:
+        return
+
+    table = ProgressRollup.__table__
+    dialect = postgresql if db.get_bind().dialect.name == "postgresql" else sqlite
+    stmt = dialect.insert(table).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[table.c.scope_type, table.c.scope_id, table.c.status],
+        set_={
+            "story_count": table.c.story_count + stmt.excluded.story_count,
+            "story_points": table.c.story_points + stmt.excluded.story_points,
+        },
+    )
+    db.exec(stmt)  # type: ignore[call-overload]
+
+
+def get_progress(db: Session, scope_type: RollupScope, scope_id: UUID) -> sch.ProgressOut:
+    """Progression d'un epic ou d'un sprint, lue depuis ``progress_rollups``."""
+    model: Any = Epic if scope_type == RollupScope.EPIC else Sprint
+    if db.get(model, scope_id) is None:
+        raise DomainError(
+            code=f"{scope_type.name}_NOT_FOUND",
+            message=f"{scope_type.value.capitalize()} not found.",
+            http_status=404,
+        )
+
+    rows = db.exec(
+        select(ProgressRollup).where(
+            ProgressRollup.scope_type == scope_type.value,
+            ProgressRollup.scope_id == scope_id,
+        )
+    ).all()
+    by_status = {row.status: row for row in rows}
+
+    def bucket(status: StoryStatus) -> sch.SummaryBucket:
+        row = by_status.get(status)
+        return sch.SummaryBucket(
+            key=status.value,
+            count=row.story_count if row else 0,
+            points=row.story_points if row else 0,
+        )
+
+    buckets = [bucket(status) for status in StoryStatus]
+    done = bucket(StoryStatus.DONE)
+    return sch.ProgressOut(
+        scope_type=scope_type,
+        scope_id=scope_id,
+        story_count=sum(b.count for b in buckets),
+        story_points=sum(b.points for b in buckets),
+        done_count=done.count,
+        done_points=done.points,
+        by_status=buckets,
+    )
+
+
+def rebuild_rollups(connection: Connection) -> None:
+    """Recalcule ``progress_rollups`` depuis ``stories`` et ``story_sprint_history``."""
+    stories = Story.__table__
+    history = StorySprintHistory.__table__
+    table = ProgressRollup.__table__
+
+    points = func.coalesce(func.sum(stories.c.story_points), 0)
+    by_epic = (
+        sa_select(
+            literal(RollupScope.EPIC.value),
+            stories.c.epic_id,
+            stories.c.status,
+            func.count(),
+            points,
+        )
+        .where(stories.c.epic_id.is_not(None))
+        .group_by(stories.c.epic_id, stories.c.status)
+    )
+    by_sprint = (
+        sa_select(
+            literal(RollupScope.SPRINT.value),
+            history.c.sprint_id,
+            stories.c.status,
+            func.count(),
+            points,
+        )
+        .select_from(history.join(stories, stories.c.id == history.c.story_id))
+        .where(history.c.is_active.is_(True))
+        .group_by(history.c.sprint_id, stories.c.status)
+    )
+
+    connection.execute(table.delete())
+    connection.execute(
+        table.insert().from_select(
+            ["scope_type", "scope_id", "status", "story_count", "story_points"],
+            union_all(by_epic, by_sprint),
+        )
+    )
+
+
+def main() -> None:  # pragma: no cover - point d'entrée
+    """Reconstruit les rollups sur la base configurée (``DATABASE_URL``)."""
+    from app.db import engine
+
+    with engine.begin() as connection:
+        rebuild_rollups(connection)
+    print("progress_rollups rebuilt.")
+
+
+__all__ = [
+    "StoryState",
+    "story_state",
+    "sprint_membership",
+    "active_sprint_id",
+    "record_story_change",
+    "record_story_changes",
+    "get_progress",
+    "rebuild_rollups",
+    "main",
+]
@@ -0,0 +1,151 @@
+"""
+Service de recherche plein texte (stories, epics, documents).
+
+S'appuie sur l'index ``search_entries`` (cf. ``app.models.search_index``) :
+- PostgreSQL : ``tsv @@ to_tsquery`` servi par l'index GIN, classé par
+  ``ts_rank``, extrait via ``ts_headline``
+- SQLite : ``MATCH`` FTS5, classé par ``bm25``, extrait via ``snippet``
+
+Chaque mot de la requête est cherché en préfixe et tous doivent être
+présents (ET logique). Les caractères de syntaxe FTS sont ignorés, ce qui
+évite toute injection dans le langage de requête.
+
+La recherche unifiée (tous types confondus) plafonne le nombre de résultats
+par type d'entité dans la même requête, via
+``ROW_NUMBER() OVER (PARTITION BY entity_type ...)`` : un seul parcours de
+l'index, quel que soit le nombre de types demandés.
+"""
+
+import re
+from typing import Final, Iterable, Optional
+from uuid import UUID
+
+from sqlalchemy import Uuid, bindparam, text
+from sqlmodel import Session
+
+from app.models import schemas as sch
+from app.models.domain import SearchEntityType
+
+
+DEFAULT_SEARCH_LIMIT: Final[int] = 20
+MAX_SEARCH_LIMIT: Final[int] = 100
+DEFAULT_PER_TYPE_LIMIT: Final[int] = 10
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+# FTS5 : ``snippet()`` n'est disponible que dans la requête portant le MATCH.
+_SQLITE_QUERY = """
+    WITH matches AS (
+        SELECT e.entity_type, e.entity_id, e.project_id, e.title,
+               snippet(search_fts, -1, '[', ']', '…', 16) AS snippet,
+               -bm25(search_fts, 4.0, 1.0) AS rank
+        FROM search_fts
+        JOIN search_entries e ON e.id = search_fts.rowid
+        WHERE search_fts MATCH :query {filters}
+    ), ranked AS (
+        SELECT matches.*,
+               ROW_NUMBER() OVER (PARTITION BY entity_type ORDER BY rank DESC) AS type_rank
+        FROM matches
+    )
+    SELECT entity_type, entity_id, project_id, title, snippet, rank
+    FROM ranked
+    WHERE type_rank <= :per_type_limit
+    ORDER BY rank DESC
+    LIMIT :limit
+"""
+
+# PostgreSQL : ``ts_headline`` (coûteux) n'est calculé que pour les lignes retenues.
+_POSTGRESQL_QUERY = """
+    WITH ranked AS (
+        SELECT e.id, ts_rank(e.tsv, q) AS rank,
+               ROW_NUMBER() OVER (
+                   PARTITION BY e.entity_type ORDER BY ts_rank(e.tsv, q) DESC
+               ) AS type_rank
+        FROM search_entries e, to_tsquery('simple', :query) AS q
+        WHERE e.tsv @@ q {filters}
+    ), kept AS (
+        SELECT id, rank FROM ranked
+        WHERE type_rank <= :per_type_limit
+        ORDER BY rank DESC
+        LIMIT :limit
+    )
+    SELECT e.entity_type, e.entity_id, e.project_id, e.title,
+           ts_headline('simple', e.title || ' ' || e.body, to_tsquery('simple', :query),
+                       'StartSel=[, StopSel=], MaxWords=24, MinWords=8') AS snippet,
+           kept.rank
+    FROM kept
+    JOIN search_entries e ON e.id = kept.id
+    ORDER BY kept.rank DESC
+"""
+
+
+def _tokens(q: str) -> list[str]:
+    return _TOKEN_RE.findall(q.lower())
+
+
+def _match_query(dialect: str, tokens: list[str]) -> str:
+    if dialect == "postgresql":
+        return " & ".join(f"{token}:*" for token in tokens)
+    return " ".join(f'"{token}"*' for token in tokens)
+
+
+def search(
+    db: Session,
+    q: str,
+    *,
+    entity_types: Optional[Iterable[SearchEntityType]] = None,
+    project_id: Optional[UUID] = None,
+    limit: int = DEFAULT_SEARCH_LIMIT,
+    per_type_limit: Optional[int] = None,
+) -> list[sch.SearchHit]:
+    """
+    Recherche plein texte classée par pertinence.
+
+    - ``entity_types`` : restreint aux types donnés (tous par défaut)
+    - ``project_id`` : restreint à un projet
+    - ``limit`` : nombre total de résultats
+    - ``per_type_limit`` : nombre maximal de résultats par type d'entité
+    """
+    tokens = _tokens(q)
+    if not tokens:
+        return []
+
+    dialect = db.get_bind().dialect.name
+    limit = max(1, min(limit, MAX_SEARCH_LIMIT))
+    params: dict = {
+        "query": _match_query(dialect, tokens),
+        "limit": limit,
+        "per_type_limit": max(1, min(per_type_limit or limit, limit)),
+    }
+    filters = ""
+    binds = []
+    if entity_types is not None:
+        filters += " AND e.entity_type IN :entity_types"
+        params["entity_types"] = [SearchEntityType(t).value for t in entity_types]
+        binds.append(bindparam("entity_types", expanding=True))
+    if project_id is not None:
+        filters += " AND e.project_id = :project_id"
+        params["project_id"] = project_id
+        binds.append(bindparam("project_id", type_=Uuid()))
+
+    template = _POSTGRESQL_QUERY if dialect == "postgresql" else _SQLITE_QUERY
+    stmt = (
+        text(template.format(filters=filters))
+        .bindparams(*binds)
+        .columns(entity_id=Uuid(), project_id=Uuid())
+    )
+    rows = db.exec(stmt, params=params).all()  # type: ignore[call-overload]
+    return [
+        sch.SearchHit(
+            entity_type=row.entity_type,
+            id=row.entity_id,
+            project_id=row.project_id,
+            title=row.title,
+            snippet=row.snippet or "",
+            rank=float(row.rank),
+        )
+        for row in rows
+    ]
+
+
+__all__ = ["DEFAULT_SEARCH_LIMIT", "MAX_SEARCH_LIMIT", "DEFAULT_PER_TYPE_LIMIT", "search"]
@@ -3,17 +3,28 @@ Services métier pour les sprints.
 
 Règles implémentées ici :
 - Clôture de sprint uniquement si toutes les stories actives sont `done`
-- Gestion de l'affectation story/sprint via StorySprintHistory
+- Gestion de l'affectation story/sprint via StorySprintHistory (unitaire ou
+  par lot)
+- Rollups de progression des sprints mis à jour dans la même transaction
 """
 
-from typing import Iterable
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Any
 from uuid import UUID
 
+from sqlalchemy import and_, exists, insert, or_, update
+from sqlalchemy.exc import IntegrityError
 from sqlmodel import Session, select
 
+from app.db.writes import save
 from app.models import Sprint, Story, StorySprintHistory
 from app.models.domain import SprintStatus, StoryStatus
+from app.models.schemas import SprintStoriesBatchResult, SprintStoryRejection
+from app.services import rollups
+from app.services.cache import invalidate_on_commit
 from app.services.errors import DomainError
+from app.services.stories import MAX_BATCH_SIZE
 
 
 def start_sprint(db: Session, sprint_id: UUID) -> Sprint:
@@ -26,15 +37,22 @@ def start_sprint(db: Session, sprint_id: UUID) -> Sprint:
         )
 
     sprint.status = SprintStatus.ACTIVE
-    db.add(sprint)
-    db.commit()
-    db.refresh(sprint)
+    save(db, sprint)
     return sprint
 
 
 def close_sprint(db: Session, sprint_id: UUID) -> Sprint:
-    """Clôture un sprint si toutes les stories associées sont `done`."""
-    sprint = db.get(Sprint, sprint_id)
+    """
+    Clôture un sprint si toutes les stories associées sont `done`.
+
+    La ligne du sprint est verrouillée (``SELECT ... FOR UPDATE`` ; ignoré par
+    SQLite, qui sérialise déjà les écritures) jusqu'au commit.
+    ``add_story_to_sprint`` prend le même verrou, et une story `done` ne peut
+    plus changer de statut : le résultat de la vérification reste donc vrai
+    jusqu'à la clôture. La vérification elle-même est une seule requête
+    ``EXISTS``, sans charger les stories.
+    """
+    sprint = db.get(Sprint, sprint_id, with_for_update=True)
     if not sprint:
         raise DomainError(
             code="SPRINT_NOT_FOUND",
@@ -42,37 +60,82 @@ def close_sprint(db: Session, sprint_id: UUID) -> Sprint:
             http_status=404,
         )
 
-    # Récupérer toutes les stories actives dans ce sprint
-    active_links: Iterable[StorySprintHistory] = db.exec(
-        select(StorySprintHistory).where(
-            StorySprintHistory.sprint_id == sprint_id,
-            StorySprintHistory.is_active.is_(True),
-        )
-    ).all()
-
-    story_ids = [link.story_id for link in active_links]
-    if story_ids:
-        stories: Iterable[Story] = db.exec(
-            select(Story).where(Story.id.in_(story_ids))
-        ).all()
-        not_done = [s for s in stories if s.status != StoryStatus.DONE]
-        if not_done:
-            raise DomainError(
-                code="SPRINT_CLOSE_BLOCKED",
-                message="Cannot close sprint: some stories are not in 'done' status.",
-                http_status=409,
+    has_undone_story = db.exec(
+        select(
+            exists().where(
+                StorySprintHistory.sprint_id == sprint_id,
+                StorySprintHistory.is_active.is_(True),
+                Story.id == StorySprintHistory.story_id,
+                Story.status != StoryStatus.DONE,
             )
+        )
+    ).one()
+    if has_undone_story:
+        raise DomainError(
+            code="SPRINT_CLOSE_BLOCKED",
+            message="Cannot close sprint: some stories are not in 'done' status.",
+            http_status=409,
+        )
 
     sprint.status = SprintStatus.CLOSED
-    db.add(sprint)
-    db.commit()
-    db.refresh(sprint)
+    save(db, sprint)
     return sprint
 
 
-def add_story_to_sprint(db: Session, sprint_id: UUID, story_id: UUID) -> None:
-    sprint = db.get(Sprint, sprint_id)
-    story = db.get(Story, story_id)
+def _deactivate_links(db: Session, *criteria: Any) -> dict[UUID, UUID]:
+    """
+    Désactive en un seul ``UPDATE`` les liens actifs répondant à ``criteria``
+    et renvoie, par story, le sprint du lien désactivé (un lien actif au plus
+    par story).
+    """
+    result = db.exec(  # type: ignore[call-overload]
+        update(StorySprintHistory)
+        .where(StorySprintHistory.is_active.is_(True), *criteria)
+        .values(is_active=False, removed_at=datetime.utcnow())
+        .returning(StorySprintHistory.story_id, StorySprintHistory.sprint_id)
+    )
+    return {story_id: sprint_id for story_id, sprint_id in result}
+
+
+def _insert_active_links(db: Session, sprint_id: UUID, story_ids: Sequence[UUID]) -> None:
+    """
+    Crée les liens actifs en un seul ``INSERT`` multi-lignes.
+
+    L'index unique partiel ``uq_story_sprint_history_active`` rejette le lien
+    si une transaction concurrente a rendu la story active ailleurs entre la
+    désactivation et l'insertion.
+    """
+    try:
+        db.exec(  # type: ignore[call-overload]
+            insert(StorySprintHistory.__table__),
+            params=[
+                StorySprintHistory(story_id=story_id, sprint_id=sprint_id).model_dump()
+                for story_id in story_ids
+            ],
+        )
+    except IntegrityError as exc:
+        db.rollback()
+        raise DomainError(
+            code="CONCURRENT_SPRINT_ASSIGNMENT",
+            message="Story was assigned to a sprint concurrently, retry the request.",
+            http_status=409,
+        ) from exc
+
+
+def add_story_to_sprint(db: Session, sprint_id: UUID, story_id: UUID) -> Sprint:
+    """
+    Rend la story active dans le sprint et renvoie le sprint (chargé pour le
+    verrou, non expiré par le commit).
+
+    Désactivation du lien actif précédent puis insertion du nouveau, sans
+    lecture préalable : l'unicité du lien actif est garantie par l'index
+    unique partiel, pas par un read-modify-write.
+    """
+    # Verrou partagé avec ``close_sprint`` : pas d'ajout pendant une clôture
+    sprint = db.get(Sprint, sprint_id, with_for_update=True)
+    # Verrou partagé avec ``update_story`` : statut et points lus pour les
+    # rollups restent ceux de la ligne jusqu'au commit
+    story = db.get(Story, story_id, with_for_update=True, populate_existing=True)
     if not sprint or not story:
         raise DomainError(
             code="SPRINT_OR_STORY_NOT_FOUND",
@@ -80,42 +143,186 @@ def add_story_to_sprint(db: Session, sprint_id: UUID, story_id: UUID) -> None:
             http_status=404,
         )
 
-    # Désactiver les éventuelles entrées actives existantes pour cette story
-    active_entries = db.exec(
-        select(StorySprintHistory).where(
-            StorySprintHistory.story_id == story_id,
-            StorySprintHistory.is_active.is_(True),
+    previous = _deactivate_links(db, StorySprintHistory.story_id == story_id)
+    _insert_active_links(db, sprint_id, [story_id])
+    rollups.record_story_changes(
+        db,
+        [(rollups.sprint_membership(story, old), None) for old in previous.values()]
+        + [(None, rollups.sprint_membership(story, sprint_id))],
+    )
+    invalidate_on_commit(db, "project_snapshot", sprint.project_id)
+    save(db, sprint)
+    return sprint
+
+
+def remove_story_from_sprint(db: Session, sprint_id: UUID, story_id: UUID) -> Sprint:
+    """Désactive le lien actif de la story dans le sprint et renvoie le sprint."""
+    if not _deactivate_links(
+        db,
+        StorySprintHistory.story_id == story_id,
+        StorySprintHistory.sprint_id == sprint_id,
+    ):
+        raise DomainError(
+            code="ACTIVE_LINK_NOT_FOUND",
+            message="Active story/sprint link not found.",
+            http_status=404,
         )
-    ).all()
-    for entry in active_entries:
-        entry.is_active = False
-        db.add(entry)
 
-    link = StorySprintHistory(story_id=story_id, sprint_id=sprint_id, is_active=True)
-    db.add(link)
-    db.commit()
+    story = db.get(Story, story_id, with_for_update=True, populate_existing=True)
+    if story is not None:
+        rollups.record_story_change(db, rollups.sprint_membership(story, sprint_id), None)
+    # Le lien actif existait : le sprint aussi (clé étrangère)
+    sprint = db.get(Sprint, sprint_id)
+    invalidate_on_commit(db, "project_snapshot", sprint.project_id)
+    save(db, sprint)
+    return sprint
 
 
-def remove_story_from_sprint(db: Session, sprint_id: UUID, story_id: UUID) -> None:
-    link = db.exec(
-        select(StorySprintHistory).where(
-            StorySprintHistory.story_id == story_id,
-            StorySprintHistory.sprint_id == sprint_id,
-            StorySprintHistory.is_active.is_(True),
+def update_sprint_stories(
+    db: Session,
+    sprint_id: UUID,
+    add: Sequence[UUID] = (),
+    remove: Sequence[UUID] = (),
+) -> SprintStoriesBatchResult:
+    """
+    Ajoute (``add``) et retire (``remove``) des stories d'un sprint en une
+    seule transaction.
+
+    Les stories concernées et leur sprint actif sont lus en une requête ;
+    les liens actifs à fermer (stories retirées, ou ajoutées depuis un autre
+    sprint) sont désactivés par un seul ``UPDATE``, les nouveaux liens créés
+    par un seul ``INSERT`` multi-lignes, sous la garantie de l'index unique
+    partiel sur les liens actifs. Les stories inconnues, ou retirées
+    sans être actives dans ce sprint, sont renvoyées dans ``rejected``.
+    """
+    if len(add) + len(remove) > MAX_BATCH_SIZE:
+        raise DomainError(
+            code="BATCH_TOO_LARGE",
+            message=f"At most {MAX_BATCH_SIZE} items per batch.",
+            http_status=400,
+        )
+    if set(add) & set(remove):
+        raise DomainError(
+            code="INVALID_SELECTION",
+            message="A story cannot be both added to and removed from the sprint.",
+            http_status=400,
         )
-    ).first()
 
-    if not link:
+    # Verrou partagé avec ``close_sprint`` : pas d'ajout pendant une clôture
+    sprint = db.get(Sprint, sprint_id, with_for_update=True)
+    if not sprint:
         raise DomainError(
-            code="ACTIVE_LINK_NOT_FOUND",
-            message="Active story/sprint link not found.",
+            code="SPRINT_NOT_FOUND",
+            message="Sprint not found.",
             http_status=404,
         )
 
-    link.is_active = False
-    db.add(link)
+    rows = db.exec(
+        select(
+            Story.id,
+            Story.status,
+            Story.story_points,
+            StorySprintHistory.sprint_id,
+        )
+        .outerjoin(
+            StorySprintHistory,
+            and_(
+                StorySprintHistory.story_id == Story.id,
+                StorySprintHistory.is_active.is_(True),
+            ),
+        )
+        .where(Story.id.in_([*add, *remove]))
+        .with_for_update(of=Story)
+    ).all()
+    stories = {
+        story_id: (status, points, active_sprint_id)
+        for story_id, status, points, active_sprint_id in rows
+    }
+
+    added: list[UUID] = []
+    removed: list[UUID] = []
+    unchanged: list[UUID] = []
+    rejected: list[SprintStoryRejection] = []
+    changes: list[tuple[rollups.StoryState | None, rollups.StoryState | None]] = []
+
+    for story_id in dict.fromkeys(add):
+        if story_id not in stories:
+            rejected.append(
+                SprintStoryRejection(id=story_id, code="STORY_NOT_FOUND", message="Story not found.")
+            )
+            continue
+        status, points, active_sprint_id = stories[story_id]
+        if active_sprint_id == sprint_id:
+            unchanged.append(story_id)
+            continue
+        added.append(story_id)
+
+    for story_id in dict.fromkeys(remove):
+        if story_id not in stories:
+            rejected.append(
+                SprintStoryRejection(id=story_id, code="STORY_NOT_FOUND", message="Story not found.")
+            )
+            continue
+        status, points, active_sprint_id = stories[story_id]
+        if active_sprint_id != sprint_id:
+            rejected.append(
+                SprintStoryRejection(
+                    id=story_id,
+                    code="ACTIVE_LINK_NOT_FOUND",
+                    message="Active story/sprint link not found.",
+                )
+            )
+            continue
+        removed.append(story_id)
+
+    # Sprint « avant » de chaque story : celui du lien effectivement désactivé
+    previous: dict[UUID, UUID] = {}
+    if added or removed:
+        previous = _deactivate_links(
+            db,
+            or_(
+                StorySprintHistory.story_id.in_(added),
+                and_(
+                    StorySprintHistory.story_id.in_(removed),
+                    StorySprintHistory.sprint_id == sprint_id,
+                ),
+            ),
+        )
+    lost = [story_id for story_id in removed if story_id not in previous]
+    if lost:
+        # Lien désactivé entre la lecture et l'``UPDATE``
+        removed = [story_id for story_id in removed if story_id in previous]
+        rejected += [
+            SprintStoryRejection(
+                id=story_id,
+                code="ACTIVE_LINK_NOT_FOUND",
+                message="Active story/sprint link not found.",
+            )
+            for story_id in lost
+        ]
+    for story_id, old_sprint_id in previous.items():
+        status, points, _ = stories[story_id]
+        changes.append((rollups.StoryState(None, old_sprint_id, status, points), None))
+    if added:
+        _insert_active_links(db, sprint_id, added)
+        for story_id in added:
+            status, points, _ = stories[story_id]
+            changes.append((None, rollups.StoryState(None, sprint_id, status, points)))
+    rollups.record_story_changes(db, changes)
+    if added or removed:
+        invalidate_on_commit(db, "project_snapshot", sprint.project_id)
     db.commit()
 
+    return SprintStoriesBatchResult(
+        added=added, removed=removed, unchanged=unchanged, rejected=rejected
+    )
+
 
-__all__ = ["start_sprint", "close_sprint", "add_story_to_sprint", "remove_story_from_sprint"]
+__all__ = [
+    "start_sprint",
+    "close_sprint",
+    "add_story_to_sprint",
+    "remove_story_from_sprint",
+    "update_sprint_stories",
+]
 
@@ -6,22 +6,40 @@ Règles implémentées ici :
 - Workflow strict des statuts :
   backlog -> todo -> in_progress -> in_review -> done
 - Impossible de quitter l'état `done`
+
+Les rollups de progression (epic / sprint) sont mis à jour dans la même
+transaction que l'écriture (cf. ``app.services.rollups``).
 """
 
-from collections.abc import Mapping
-from typing import Final
+from collections.abc import Mapping, Sequence
+from typing import Final, Optional
 from uuid import UUID
 
-from sqlmodel import Session
+from sqlalchemy import and_, insert, update
+from sqlmodel import Session, select
 
-from app.models import Story
+from app.db.writes import save
+from app.models import Epic, Project, Story, StorySprintHistory
 from app.models.domain import StoryStatus
-from app.models.schemas import StoryCreate, StoryUpdate
+from app.models.schemas import (
+    BatchItemError,
+    StoryBatchCreateResult,
+    StoryBulkTransitionResult,
+    StoryCreate,
+    StoryFilter,
+    StoryOut,
+    StoryTransitionRejection,
+    StoryUpdate,
+)
+from app.services import rollups
+from app.services.cache import entity_cache, invalidate_on_commit
 from app.services.errors import DomainError
 
 
 FIBONACCI_STORY_POINTS: Final[set[int]] = {0, 1, 2, 3, 5, 8, 13}
 
+MAX_BATCH_SIZE: Final[int] = 500
+
 ALLOWED_TRANSITIONS: Final[Mapping[StoryStatus, set[StoryStatus]]] = {
     StoryStatus.BACKLOG: {StoryStatus.TODO},
     StoryStatus.TODO: {StoryStatus.IN_PROGRESS},
@@ -74,14 +92,82 @@ def create_story(db: Session, payload: StoryCreate) -> Story:
         assignee=payload.assignee,
     )
     db.add(story)
-    db.commit()
-    db.refresh(story)
+    rollups.record_story_change(db, None, rollups.story_state(story, sprint_id=None))
+    save(db, story)
     return story
 
 
+def create_stories(db: Session, payloads: Sequence[StoryCreate]) -> StoryBatchCreateResult:
+    """
+    Crée un lot de stories en une seule transaction.
+
+    Tous les éléments sont validés avant toute écriture (points, existence du
+    projet et de l'epic : une requête par type de référence). Les éléments
+    valides sont insérés par un unique ``INSERT ... VALUES (...), (...)
+    RETURNING`` ; les éléments invalides sont rapportés dans ``errors`` avec
+    leur position, sans bloquer les autres.
+    """
+    if len(payloads) > MAX_BATCH_SIZE:
+        raise DomainError(
+            code="BATCH_TOO_LARGE",
+            message=f"At most {MAX_BATCH_SIZE} items per batch.",
+            http_status=400,
+        )
+
+    project_ids = {p.project_id for p in payloads}
+    epic_ids = {p.epic_id for p in payloads if p.epic_id is not None}
+    known_projects = set(db.exec(select(Project.id).where(Project.id.in_(project_ids))).all())
+    known_epics = (
+        set(db.exec(select(Epic.id).where(Epic.id.in_(epic_ids))).all()) if epic_ids else set()
+    )
+
+    errors: list[BatchItemError] = []
+    rows: list[dict] = []
+    for index, payload in enumerate(payloads):
+        try:
+            _validate_story_points(payload.story_points)
+            if payload.project_id not in known_projects:
+                raise DomainError(
+                    code="PROJECT_NOT_FOUND", message="Project not found.", http_status=404
+                )
+            if payload.epic_id is not None and payload.epic_id not in known_epics:
+                raise DomainError(code="EPIC_NOT_FOUND", message="Epic not found.", http_status=404)
+        except DomainError as exc:
+            errors.append(BatchItemError(index=index, code=exc.code, message=exc.message))
+            continue
+        rows.append(Story(**payload.model_dump()).model_dump())
+
+    created: list[StoryOut] = []
+    if rows:
+        table = Story.__table__
+        result = db.exec(  # type: ignore[call-overload]
+            insert(table).returning(*table.c, sort_by_parameter_order=True),
+            params=rows,
+        )
+        created = [StoryOut.model_validate(dict(row._mapping)) for row in result]
+        rollups.record_story_changes(
+            db,
+            [
+                (None, rollups.StoryState(s.epic_id, None, s.status, s.story_points))
+                for s in created
+            ],
+        )
+        # ``INSERT`` ensembliste : invisible des évènements ORM du cache
+        invalidate_on_commit(db, "project_snapshot", *{s.project_id for s in created})
+        db.commit()
+
+    return StoryBatchCreateResult(created=created, errors=errors)
+
+
 def update_story(db: Session, story_id: UUID, payload: StoryUpdate) -> Story:
-    """Met à jour une story en validant transitions de statut et points."""
-    story = db.get(Story, story_id)
+    """
+    Met à jour une story en validant transitions de statut et points.
+
+    La ligne est verrouillée (``SELECT ... FOR UPDATE``) jusqu'au commit :
+    l'état « avant » des rollups ne peut pas être modifié entre-temps par
+    une autre mise à jour ou une affectation de sprint.
+    """
+    story = db.get(Story, story_id, with_for_update=True, populate_existing=True)
     if not story:
         raise DomainError(
             code="STORY_NOT_FOUND",
@@ -97,14 +183,132 @@ def update_story(db: Session, story_id: UUID, payload: StoryUpdate) -> Story:
     if "status" in data:
         _validate_status_transition(story.status, data["status"])
 
+    before = rollups.story_state(story, sprint_id=None)
     for field, value in data.items():
         setattr(story, field, value)
+    after = rollups.story_state(story, sprint_id=None)
 
-    db.add(story)
-    db.commit()
-    db.refresh(story)
+    if after != before:
+        # Le sprint actif n'est concerné que si statut ou points changent
+        sprint_id = None
+        if (before.status, before.points) != (after.status, after.points):
+            sprint_id = rollups.active_sprint_id(db, story_id)
+        rollups.record_story_change(
+            db, before._replace(sprint_id=sprint_id), after._replace(sprint_id=sprint_id)
+        )
+
+    save(db, story)
     return story
 
 
-__all__ = ["create_story", "update_story"]
+def transition_stories(
+    db: Session,
+    target: StoryStatus,
+    *,
+    story_ids: Optional[Sequence[UUID]] = None,
+    story_filter: Optional[StoryFilter] = None,
+) -> StoryBulkTransitionResult:
+    """
+    Fait passer un ensemble de stories au statut ``target``.
+
+    Sélection : soit ``story_ids``, soit ``story_filter`` (au moins un
+    critère), exclusivement. Les stories sélectionnées sont lues en une
+    requête (verrouillées par ``FOR UPDATE`` si le backend le permet), le
+    workflow est vérifié pour toutes en un passage, puis les transitions
+    valides sont appliquées par un seul ``UPDATE ... WHERE id IN (...)``.
+    Les stories refusées (transition interdite, story inconnue) sont
+    renvoyées avec la raison ; celles déjà au statut cible sont ignorées.
+    """
+    criteria = story_filter.model_dump(exclude_none=True) if story_filter else {}
+    if (story_ids is None) == (not criteria):
+        raise DomainError(
+            code="INVALID_SELECTION",
+            message="Provide either story_ids or a non-empty filter.",
+            http_status=400,
+        )
+    if story_ids is not None and len(story_ids) > MAX_BATCH_SIZE:
+        raise DomainError(
+            code="BATCH_TOO_LARGE",
+            message=f"At most {MAX_BATCH_SIZE} items per batch.",
+            http_status=400,
+        )
+
+    stmt = (
+        select(
+            Story.id,
+            Story.project_id,
+            Story.epic_id,
+            StorySprintHistory.sprint_id,
+            Story.status,
+            Story.story_points,
+        )
+        .outerjoin(
+            StorySprintHistory,
+            and_(
+                StorySprintHistory.story_id == Story.id,
+                StorySprintHistory.is_active.is_(True),
+            ),
+        )
+        .with_for_update(of=Story)
+    )
+    if story_ids is not None:
+        stmt = stmt.where(Story.id.in_(story_ids))
+    for field in ("project_id", "epic_id", "status", "priority", "assignee"):
+        if field in criteria:
+            stmt = stmt.where(getattr(Story, field) == criteria[field])
+    if "sprint_id" in criteria:
+        stmt = stmt.where(StorySprintHistory.sprint_id == criteria["sprint_id"])
+    rows = db.exec(stmt).all()
+
+    updated: list[UUID] = []
+    projects: set[UUID] = set()
+    changes: list[tuple[rollups.StoryState, rollups.StoryState]] = []
+    unchanged: list[UUID] = []
+    rejected: list[StoryTransitionRejection] = []
+    for story_id, project_id, epic_id, sprint_id, status, points in rows:
+        if status == target:
+            unchanged.append(story_id)
+            continue
+        try:
+            _validate_status_transition(status, target)
+        except DomainError as exc:
+            rejected.append(
+                StoryTransitionRejection(id=story_id, status=status, code=exc.code, message=exc.message)
+            )
+            continue
+        updated.append(story_id)
+        projects.add(project_id)
+        before = rollups.StoryState(epic_id, sprint_id, status, points)
+        changes.append((before, before._replace(status=target)))
+
+    if story_ids is not None:
+        found = {row[0] for row in rows}
+        rejected += [
+            StoryTransitionRejection(id=story_id, code="STORY_NOT_FOUND", message="Story not found.")
+            for story_id in dict.fromkeys(story_ids)
+            if story_id not in found
+        ]
+
+    if updated:
+        db.exec(  # type: ignore[call-overload]
+            update(Story)
+            .where(Story.id.in_(updated))
+            .values(status=target)
+        )
+        rollups.record_story_changes(db, changes)
+        invalidate_on_commit(db, "project_snapshot", *projects)
+        db.commit()
+        # ``UPDATE`` ensembliste : invisible des évènements ORM du cache
+        entity_cache.invalidate("story", *updated)
+
+    return StoryBulkTransitionResult(updated=updated, unchanged=unchanged, rejected=rejected)
+
+
+__all__ = [
+    "MAX_BATCH_SIZE",
+    "create_story",
+    "create_stories",
+    "update_story",
+    "transition_stories",
+]
 
@@ -0,0 +1,6 @@
+"""
+Benchmarks de performance (hors suite de tests fonctionnels).
+
+Chaque module s'exécute avec ``python -m benchmarks.<module>`` depuis la
+racine du projet.
+"""
@@ -0,0 +1,211 @@
+"""
+Générateur de données synthétiques pour les benchmarks.
+
+``generate`` remplit une base (schéma déjà créé) avec ``projects`` projets,
+chacun doté d'epics, de stories (statuts, priorités, assignees et dates de
+création variés), de sprints, de commentaires et de documents. Les
+insertions passent par des ``INSERT`` multi-lignes ; l'index de recherche
+est alimenté par ses triggers et les rollups sont recalculés à la fin.
+
+Le résultat est déterministe pour une ``seed`` donnée (hors identifiants).
+"""
+
+from __future__ import annotations
+
+import random
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import insert
+from sqlalchemy.engine import Connection
+from sqlmodel import SQLModel
+
+from app.models import (
+    Comment,
+    CommentTargetType,
+    Document,
+    Epic,
+    Project,
+    Sprint,
+    Story,
+    StoryDescription,
+    StoryPriority,
+    StorySprintHistory,
+    StoryStatus,
+)
+from app.services.rollups import rebuild_rollups
+
+
+ASSIGNEES = ("alice", "bob", "carol", "dave", "erin", "frank", "grace", "heidi")
+
+WORDS = (
+    "alerte", "maintenance", "shift", "opérateur", "tournée", "rapport", "capteur",
+    "dashboard", "usine", "planning", "export", "notification", "tablette", "badge",
+    "incident", "qualité", "stock", "machine", "équipe", "synthèse",
+)
+
+CHUNK_SIZE = 1000
+
+
+@dataclass(frozen=True)
+class Size:
+    """Volumétrie par projet."""
+
+    projects: int
+    epics: int
+    stories: int
+    sprints: int
+    comments_per_story: int
+    documents: int
+
+
+SIZES: dict[str, Size] = {
+    "small": Size(projects=1, epics=10, stories=1_000, sprints=10, comments_per_story=1, documents=20),
+    "medium": Size(projects=3, epics=25, stories=5_000, sprints=25, comments_per_story=2, documents=50),
+    "large": Size(projects=5, epics=50, stories=20_000, sprints=50, comments_per_story=2, documents=100),
+}
+
+
+@dataclass
+class Dataset:
+    """Identifiants utiles aux scénarios."""
+
+    project_ids: list[UUID] = field(default_factory=list)
+    epic_ids: list[UUID] = field(default_factory=list)
+    story_ids: list[UUID] = field(default_factory=list)
+    sprint_ids: list[UUID] = field(default_factory=list)
+    document_ids: list[UUID] = field(default_factory=list)
+    # Sprint dont toutes les stories actives sont ``done`` (clôturable)
+    closable_sprint_id: UUID | None = None
+    # Stories sans sprint actif (candidates aux affectations)
+    unplanned_story_ids: list[UUID] = field(default_factory=list)
+    # Story ayant au moins un commentaire
+    commented_story_id: UUID | None = None
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words))
+
+
+def _insert(conn: Connection, model: type[SQLModel], rows: Iterable[SQLModel]) -> None:
+    batch: list[dict[str, Any]] = []
+    for row in rows:
+        batch.append(row.model_dump())
+        if len(batch) >= CHUNK_SIZE:
+            conn.execute(insert(model.__table__), batch)  # type: ignore[attr-defined]
+            batch = []
+    if batch:
+        conn.execute(insert(model.__table__), batch)  # type: ignore[attr-defined]
+
+
+def _project(conn: Connection, size: Size, rng: random.Random, data: Dataset, index: int) -> None:
+    start = datetime.utcnow() - timedelta(days=365)
+    project = Project(name=f"Projet {index}", description=_sentence(rng, 12))
+    _insert(conn, Project, [project])
+    data.project_ids.append(project.id)
+
+    epics = [
+        Epic(project_id=project.id, title=_sentence(rng, 4), created_at=start + timedelta(hours=i))
+        for i in range(size.epics)
+    ]
+    _insert(conn, Epic, epics)
+    data.epic_ids += [e.id for e in epics]
+
+    sprints = [
+        Sprint(project_id=project.id, name=f"Sprint {i}", created_at=start + timedelta(days=7 * i))
+        for i in range(size.sprints)
+    ]
+    _insert(conn, Sprint, sprints)
+    data.sprint_ids += [s.id for s in sprints]
+
+    stories = [
+        Story(
+            project_id=project.id,
+            epic_id=rng.choice(epics).id if epics and rng.random() < 0.8 else None,
+            title=_sentence(rng, 6),
+            status=rng.choice(list(StoryStatus)),
+            priority=rng.choice(list(StoryPriority)),
+            story_points=rng.choice((0, 1, 2, 3, 5, 8, 13)),
+            assignee=rng.choice(ASSIGNEES) if rng.random() < 0.9 else None,
+            created_at=start + timedelta(minutes=i),
+        )
+        for i in range(size.stories)
+    ]
+    _insert(conn, Story, stories)
+    data.story_ids += [s.id for s in stories]
+
+    _insert(
+        conn,
+        StoryDescription,
+        (
+            StoryDescription(
+                story_id=s.id,
+                description=_sentence(rng, 30),
+                acceptance_criteria=_sentence(rng, 15),
+            )
+            for s in stories
+            if rng.random() < 0.5
+        ),
+    )
+
+    # Affectations : le premier sprint ne reçoit que des stories ``done``
+    # (clôturable), les autres un échantillon ; historique inactif en plus
+    links: list[StorySprintHistory] = []
+    closable, *others = sprints or [None]
+    for story in stories:
+        if rng.random() < 0.3:
+            links.append(
+                StorySprintHistory(story_id=story.id, sprint_id=rng.choice(sprints).id, is_active=False)
+            )
+        if closable is not None and story.status == StoryStatus.DONE and rng.random() < 0.05:
+            links.append(StorySprintHistory(story_id=story.id, sprint_id=closable.id))
+        elif others and story.status != StoryStatus.DONE and rng.random() < 0.5:
+            links.append(StorySprintHistory(story_id=story.id, sprint_id=rng.choice(others).id))
+        else:
+            data.unplanned_story_ids.append(story.id)
+    _insert(conn, StorySprintHistory, links)
+    if closable is not None and data.closable_sprint_id is None:
+        data.closable_sprint_id = closable.id
+
+    comments = [
+        Comment(
+            project_id=project.id,
+            target_type=CommentTargetType.STORY,
+            target_id=story.id,
+            content=_sentence(rng, 20),
+            created_at=story.created_at + timedelta(hours=n + 1),
+        )
+        for story in stories
+        for n in range(size.comments_per_story)
+    ]
+    _insert(conn, Comment, comments)
+    if comments and data.commented_story_id is None:
+        data.commented_story_id = comments[0].target_id
+
+    documents = [
+        Document(project_id=project.id, title=_sentence(rng, 4), content=_sentence(rng, 200))
+        for _ in range(size.documents)
+    ]
+    _insert(conn, Document, documents)
+    data.document_ids += [d.id for d in documents]
+
+
+def generate(conn: Connection, size: Size, seed: int = 42) -> Dataset:
+    """Remplit la base et renvoie les identifiants utiles aux scénarios."""
+    rng = random.Random(seed)
+    data = Dataset()
+    for index in range(size.projects):
+        _project(conn, size, rng, data, index)
+    rebuild_rollups(conn)
+    return data
+
+
+def sample(rng: random.Random, ids: Sequence[UUID], k: int) -> list[UUID]:
+    """Échantillon sans remise, borné par la taille de ``ids``."""
+    return rng.sample(list(ids), min(k, len(ids)))
+
+
+__all__ = ["ASSIGNEES", "WORDS", "SIZES", "Size", "Dataset", "generate", "sample"]
@@ -0,0 +1,277 @@
+"""
+Plans d'exécution avant / après la migration ``e0ed0638436c`` (index composites).
+
+Crée le schéma sur une base jetable, la remplit de données synthétiques,
+puis, pour chaque requête de liste / filtre réellement exécutée par l'API :
+- relève le plan (``EXPLAIN QUERY PLAN`` sous SQLite, ``EXPLAIN`` sous
+  PostgreSQL) et la durée médiane avec les index actuels (« after ») ;
+- remet les index d'avant la migration (``ix_<table>_id``,
+  ``ix_story_sprint_history_is_active`` / ``_sprint_id``,
+  ``ix_comments_target_id``) et recommence (« before »).
+
+Usage :
+
+    python -m benchmarks.query_plans [--database-url URL] [--stories N] [--json FICHIER]
+
+Sans ``--database-url``, une base SQLite temporaire est utilisée. Avec une
+URL PostgreSQL, la base doit être dédiée au benchmark : les tables y sont
+créées puis supprimées.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import statistics
+import tempfile
+import time
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import Index, exists, insert, text
+from sqlalchemy.engine import Connection, Engine
+from sqlmodel import SQLModel, create_engine, select
+
+from app.models import (
+    Comment,
+    CommentTargetType,
+    Project,
+    Sprint,
+    Story,
+    StoryPriority,
+    StorySprintHistory,
+    StoryStatus,
+)
+from app.services.pagination import DEFAULT_PAGE_SIZE, apply_cursor
+
+
+# Index introduits par la migration (supprimés pour la mesure « before »)
+NEW_INDEXES = (
+    "ix_stories_created_at",
+    "ix_stories_status_created_at",
+    "ix_stories_priority_created_at",
+    "ix_stories_assignee_created_at",
+    "ix_comments_target_created_at",
+    "ix_story_sprint_history_sprint_active",
+)
+
+# Index supprimés par la migration (recréés pour la mesure « before »)
+LEGACY_INDEXES = (
+    *(
+        (f"ix_{model.__tablename__}_id", model, ("id",))
+        for model in (Project, Sprint, Story, StorySprintHistory, Comment)
+    ),
+    ("ix_story_sprint_history_is_active", StorySprintHistory, ("is_active",)),
+    ("ix_story_sprint_history_sprint_id", StorySprintHistory, ("sprint_id",)),
+    ("ix_comments_target_id", Comment, ("target_id",)),
+)
+
+ASSIGNEES = ("alice", "bob", "carol", "dave", "erin", "frank", "grace", "heidi")
+
+
+def explain(conn: Connection, stmt: Any) -> list[str]:
+    """
+    Plan d'exécution de ``stmt`` (``EXPLAIN QUERY PLAN`` sous SQLite,
+    ``EXPLAIN`` sous PostgreSQL).
+
+    Exécuté en SQL textuel, valeurs incluses : les lignes du plan n'ont pas
+    les types de résultat de la requête (UUID, enums...), qui ne sauraient
+    pas les convertir.
+    """
+    prefix = "EXPLAIN QUERY PLAN " if conn.dialect.name == "sqlite" else "EXPLAIN "
+    sql = stmt.compile(dialect=conn.dialect, compile_kwargs={"literal_binds": True})
+    return [str(row[-1]) for row in conn.exec_driver_sql(prefix + str(sql))]
+
+
+# ---------------------------------------------------------------------------
+# Données synthétiques
+# ---------------------------------------------------------------------------
+
+
+def seed(conn: Connection, story_count: int, rng: random.Random) -> dict[str, Any]:
+    """Insère un projet, ``story_count`` stories, des sprints et des commentaires."""
+    project = Project(name="Benchmark")
+    conn.execute(insert(Project.__table__), [project.model_dump()])
+
+    sprints = [Sprint(project_id=project.id, name=f"Sprint {i}") for i in range(max(1, story_count // 200))]
+    conn.execute(insert(Sprint.__table__), [s.model_dump() for s in sprints])
+
+    start = datetime.utcnow() - timedelta(days=365)
+    stories = [
+        Story(
+            project_id=project.id,
+            title=f"Story {i}",
+            status=rng.choice(list(StoryStatus)),
+            priority=rng.choice(list(StoryPriority)),
+            story_points=rng.choice((0, 1, 2, 3, 5, 8, 13)),
+            assignee=rng.choice(ASSIGNEES),
+            created_at=start + timedelta(minutes=i),
+        )
+        for i in range(story_count)
+    ]
+    conn.execute(insert(Story.__table__), [s.model_dump() for s in stories])
+
+    links = []
+    for story in stories:
+        # Historique : un lien inactif sur deux stories, un lien actif sur trois
+        if rng.random() < 0.5:
+            links.append(
+                StorySprintHistory(story_id=story.id, sprint_id=rng.choice(sprints).id, is_active=False)
+            )
+        if rng.random() < 0.33:
+            links.append(StorySprintHistory(story_id=story.id, sprint_id=rng.choice(sprints).id))
+    conn.execute(insert(StorySprintHistory.__table__), [link.model_dump() for link in links])
+
+    comments = [
+        Comment(
+            project_id=project.id,
+            target_type=CommentTargetType.STORY,
+            target_id=story.id,
+            content="lorem ipsum",
+            created_at=start + timedelta(minutes=i),
+        )
+        for i, story in enumerate(rng.choices(stories, k=story_count * 2))
+    ]
+    conn.execute(insert(Comment.__table__), [c.model_dump() for c in comments])
+
+    return {
+        "sprint_id": sprints[0].id,
+        "target_id": comments[0].target_id,
+    }
+
+
+# ---------------------------------------------------------------------------
+# Requêtes mesurées (identiques à celles des routes / services)
+# ---------------------------------------------------------------------------
+
+
+def _page(stmt: Any, model: Any) -> Any:
+    return apply_cursor(stmt, model, None, DEFAULT_PAGE_SIZE)
+
+
+def queries(ids: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "list_stories": _page(select(Story), Story),
+        "list_stories?status": _page(select(Story).where(Story.status == StoryStatus.IN_PROGRESS), Story),
+        "list_stories?priority": _page(select(Story).where(Story.priority == StoryPriority.HIGH), Story),
+        "list_stories?assignee": _page(select(Story).where(Story.assignee == "carol"), Story),
+        "list_stories?sprint_id": _page(
+            select(Story)
+            .join(StorySprintHistory)
+            .where(
+                StorySprintHistory.sprint_id == ids["sprint_id"],
+                StorySprintHistory.is_active.is_(True),
+            ),
+            Story,
+        ),
+        "list_comments?target": _page(
+            select(Comment).where(
+                Comment.target_type == CommentTargetType.STORY,
+                Comment.target_id == ids["target_id"],
+            ),
+            Comment,
+        ),
+        "close_sprint (EXISTS)": select(
+            exists().where(
+                StorySprintHistory.sprint_id == ids["sprint_id"],
+                StorySprintHistory.is_active.is_(True),
+                Story.id == StorySprintHistory.story_id,
+                Story.status != StoryStatus.DONE,
+            )
+        ),
+    }
+
+
+# ---------------------------------------------------------------------------
+# Mesure
+# ---------------------------------------------------------------------------
+
+
+def _timed(run: Callable[[], Any], repeat: int) -> float:
+    durations = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        run()
+        durations.append((time.perf_counter() - started) * 1000)
+    return round(statistics.median(durations), 3)
+
+
+def measure(engine: Engine, stmts: dict[str, Any], repeat: int) -> dict[str, Any]:
+    results: dict[str, Any] = {}
+    with engine.connect() as conn:
+        conn.execute(text("ANALYZE"))
+        for name, stmt in stmts.items():
+            plan = explain(conn, stmt)
+            median_ms = _timed(lambda: conn.execute(stmt).all(), repeat)
+            results[name] = {"plan": plan, "median_ms": median_ms}
+    return results
+
+
+def restore_legacy_indexes(engine: Engine) -> None:
+    """Remet le jeu d'index d'avant la migration."""
+    with engine.begin() as conn:
+        for model in (Story, StorySprintHistory, Comment):
+            for index in model.__table__.indexes:
+                if index.name in NEW_INDEXES:
+                    index.drop(conn)
+        for name, model, columns in LEGACY_INDEXES:
+            Index(name, *(model.__table__.c[c] for c in columns)).create(conn)
+
+
+def run(database_url: str, story_count: int, repeat: int, seed_value: int) -> dict[str, Any]:
+    engine = create_engine(database_url)
+    SQLModel.metadata.create_all(engine)
+    try:
+        with engine.begin() as conn:
+            ids = seed(conn, story_count, random.Random(seed_value))
+        stmts = queries(ids)
+        after = measure(engine, stmts, repeat)
+        restore_legacy_indexes(engine)
+        before = measure(engine, stmts, repeat)
+    finally:
+        SQLModel.metadata.drop_all(engine)
+        engine.dispose()
+
+    return {
+        "dialect": engine.dialect.name,
+        "stories": story_count,
+        "repeat": repeat,
+        "queries": {name: {"before": before[name], "after": after[name]} for name in stmts},
+    }
+
+
+def _print_report(report: dict[str, Any]) -> None:
+    print(f"# {report['dialect']} — {report['stories']} stories, médiane sur {report['repeat']} exécutions\n")
+    for name, result in report["queries"].items():
+        before, after = result["before"], result["after"]
+        print(f"## {name}: {before['median_ms']} ms -> {after['median_ms']} ms")
+        for label, measured in (("before", before), ("after", after)):
+            print(f"  {label}:")
+            for line in measured["plan"]:
+                print(f"    {line}")
+        print()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--database-url", default=None, help="Base jetable (défaut : SQLite temporaire).")
+    parser.add_argument("--stories", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--json", type=Path, default=None, help="Écrit aussi le rapport en JSON.")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        url = args.database_url or f"sqlite:///{Path(tmp) / 'query_plans.db'}"
+        report = run(url, args.stories, args.repeat, args.seed)
+
+    _print_report(report)
+    if args.json:
+        args.json.write_text(json.dumps(report, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+"""
+Coût de sérialisation d'une page de stories : chemin ``response_model`` vs
+chemin direct (``app.api.serialization``), et ``_page_out`` MCP.
+
+Les stories sont construites en mémoire (pas de base) pour isoler le coût
+CPU de validation et d'encodage :
+
+- ``rest.response_model`` : la route renvoie un ``Page[StoryOut]`` validé
+  ligne à ligne ; FastAPI le revalide contre ``response_model``, le
+  resérialise puis l'encode avec ``json.dumps`` (comportement d'avant) ;
+- ``rest.direct`` : ``page_response`` (une validation, encodage pydantic-core) ;
+- ``encode.*`` : les mêmes chemins sans la pile HTTP (``serialize_response``
+  de FastAPI + ``JSONResponse`` vs ``page_response``), coût CPU seul ;
+- ``mcp.per_row`` / ``mcp.batched`` : ``model_validate(...).model_dump()``
+  par ligne vs ``sch.dump_many``.
+
+Les deux chemins renvoient des corps identiques (vérifié avant mesure).
+
+    python -m benchmarks.serialization --rows 500 --repeat 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from typing import Any
+from uuid import uuid4
+
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute, serialize_response
+from fastapi.testclient import TestClient
+
+from app.api.serialization import page_response
+from app.models import Story, StoryPriority, StoryStatus
+from app.models import schemas as sch
+from app.services.pagination import Page
+
+
+def make_stories(count: int) -> list[Story]:
+    project_id = uuid4()
+    start = datetime(2024, 1, 1)
+    return [
+        Story(
+            id=uuid4(),
+            project_id=project_id,
+            epic_id=uuid4() if i % 3 else None,
+            title=f"Story {i} : export du rapport de maintenance",
+            status=list(StoryStatus)[i % len(StoryStatus)],
+            priority=list(StoryPriority)[i % len(StoryPriority)],
+            story_points=i % 13,
+            assignee="alice" if i % 2 else None,
+            created_at=start + timedelta(minutes=i),
+            updated_at=start + timedelta(minutes=i, seconds=30),
+        )
+        for i in range(count)
+    ]
+
+
+def build_app(stories: list[Story]) -> FastAPI:
+    app = FastAPI()
+    page = Page(items=stories, next_cursor="cursor")
+
+    @app.get("/response-model", response_model=sch.Page[sch.StoryOut])
+    def legacy() -> sch.Page[sch.StoryOut]:
+        return sch.Page[sch.StoryOut](
+            items=[sch.StoryOut.model_validate(s) for s in page.items],
+            next_cursor=page.next_cursor,
+        )
+
+    @app.get("/direct", response_model=sch.Page[sch.StoryOut])
+    def direct() -> Any:
+        return page_response(page, sch.StoryOut)
+
+    return app
+
+
+def timed(fn: Callable[[], Any], repeat: int) -> dict[str, float]:
+    fn()
+    durations = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        durations.append((time.perf_counter() - started) * 1000)
+    return {"median_ms": round(statistics.median(durations), 3), "min_ms": round(min(durations), 3)}
+
+
+def run(rows: int, repeat: int) -> dict[str, Any]:
+    stories = make_stories(rows)
+    client = TestClient(build_app(stories))
+    legacy_body = client.get("/response-model").content
+    direct_body = client.get("/direct").content
+    if json.loads(legacy_body) != json.loads(direct_body):
+        raise RuntimeError("Les deux chemins REST ne renvoient pas le même JSON")
+
+    page = Page(items=stories, next_cursor="cursor")
+    field = next(
+        r.response_field for r in client.app.routes if isinstance(r, APIRoute) and r.path == "/direct"
+    )
+    loop = asyncio.new_event_loop()
+
+    def encode_legacy() -> bytes:
+        content = sch.Page[sch.StoryOut](
+            items=[sch.StoryOut.model_validate(s) for s in page.items], next_cursor=page.next_cursor
+        )
+        serialized = loop.run_until_complete(
+            serialize_response(field=field, response_content=content, is_coroutine=False)
+        )
+        return JSONResponse(serialized).body
+
+    def encode_direct() -> bytes:
+        return page_response(page, sch.StoryOut).body
+
+    if encode_legacy() != encode_direct():
+        raise RuntimeError("Les deux encodages ne produisent pas les mêmes octets")
+
+    results = {
+        "rest.response_model": timed(lambda: client.get("/response-model"), repeat),
+        "rest.direct": timed(lambda: client.get("/direct"), repeat),
+        "encode.response_model": timed(encode_legacy, repeat),
+        "encode.direct": timed(encode_direct, repeat),
+        "mcp.per_row": timed(
+            lambda: [sch.StoryOut.model_validate(s).model_dump() for s in page.items], repeat
+        ),
+        "mcp.batched": timed(lambda: sch.dump_many(sch.StoryOut, page.items), repeat),
+    }
+    speedup = {
+        "rest": round(results["rest.response_model"]["median_ms"] / results["rest.direct"]["median_ms"], 2),
+        "encode": round(results["encode.response_model"]["median_ms"] / results["encode.direct"]["median_ms"], 2),
+        "mcp": round(results["mcp.per_row"]["median_ms"] / results["mcp.batched"]["median_ms"], 2),
+    }
+    loop.close()
+    return {
+        "meta": {"rows": rows, "repeat": repeat, "bytes": len(direct_body)},
+        "scenarios": results,
+        "speedup": speedup,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    report = run(args.rows, args.repeat)
+    print(json.dumps(report, indent=2, sort_keys=True))
+    speedup = report["speedup"]
+    print(
+        f"speedup REST x{speedup['rest']}, encode x{speedup['encode']}, MCP x{speedup['mcp']}",
+        file=sys.stderr,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -7,11 +7,13 @@ garantissant l'isolation et la rapidité d'exécution.
 
 from __future__ import annotations
 
-from collections.abc import Generator
+from collections.abc import Callable, Generator, Iterator
+from contextlib import AbstractContextManager, contextmanager
 from uuid import uuid4
 
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import event
 from sqlalchemy.pool import StaticPool
 from sqlmodel import Session, SQLModel, create_engine
 
@@ -48,7 +50,10 @@ _engine = create_engine(
 
 @pytest.fixture(autouse=True)
 def _setup_db() -> Generator[None, None, None]:
-    """Crée les tables avant chaque test et les supprime après."""
+    """Crée les tables avant chaque test et les supprime après (cache d'entités vidé)."""
+    from app.services.cache import entity_cache
+
+    entity_cache.clear()
     SQLModel.metadata.create_all(bind=_engine)
     yield
     SQLModel.metadata.drop_all(bind=_engine)
@@ -61,6 +66,29 @@ def db() -> Generator[Session, None, None]:
         yield session
 
 
+@pytest.fixture()
+def capture_sql() -> Callable[[], AbstractContextManager[list[str]]]:
+    """
+    Enregistre, dans l'ordre, les instructions SQL exécutées sur le moteur de
+    test pendant un bloc ``with capture_sql() as statements:``.
+    """
+
+    @contextmanager
+    def capture() -> Iterator[list[str]]:
+        statements: list[str] = []
+
+        def _record(conn, cursor, statement, *args):  # noqa: ANN001
+            statements.append(statement)
+
+        event.listen(_engine, "before_cursor_execute", _record)
+        try:
+            yield statements
+        finally:
+            event.remove(_engine, "before_cursor_execute", _record)
+
+    return capture
+
+
 # ---------------------------------------------------------------------------
 # Fixtures d'entités pré-créées (helpers)
 # ---------------------------------------------------------------------------
@@ -0,0 +1,36 @@
+"""
+Tests de fumée des scripts de benchmark (package ``benchmarks``).
+
+Couvre :
+- ``python -m benchmarks.query_plans`` : exécution complète sur une petite
+  base SQLite temporaire, plans « before » / « after » produits
+"""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+
+class TestQueryPlans:
+    def test_runs_on_sqlite(self, tmp_path: Path):
+        report_file = tmp_path / "plans.json"
+        subprocess.run(
+            [sys.executable, "-m", "benchmarks.query_plans",
+             "--stories", "50", "--repeat", "1", "--json", str(report_file)],
+            cwd=PROJECT_ROOT,
+            check=True,
+            capture_output=True,
+            timeout=120,
+        )
+
+        report = json.loads(report_file.read_text())
+        assert report["dialect"] == "sqlite"
+        plans = report["queries"]["list_stories?status"]
+        assert plans["before"]["plan"] and plans["after"]["plan"]
+        assert any("ix_stories_status_created_at" in line for line in plans["after"]["plan"])
@@ -0,0 +1,77 @@
+"""
+Tests de l'instrumentation SQL (app/db/instrumentation.py).
+
+Couvre :
+- Comptage des requêtes et de leur durée dans une unité de travail
+- Détection des lectures répétées (N+1), pas des écritures ni des verrous
+- Unités imbriquées mises en commun
+- En-têtes ``X-DB-*`` sur les réponses HTTP
+"""
+
+from __future__ import annotations
+
+from uuid import uuid4
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session, select
+
+from app.db import instrumentation
+from app.models.domain import Project, Story
+
+
+@pytest.fixture(autouse=True)
+def _instrumented(db: Session) -> None:
+    instrumentation.install(db.get_bind())
+
+
+class TestTrack:
+    def test_counts_statements_and_flags_repeats(self, db: Session, project: Project):
+        with instrumentation.track("test") as stats:
+            db.exec(select(Project)).all()
+            for _ in range(instrumentation.N_PLUS_ONE_THRESHOLD):
+                db.exec(select(Story).where(Story.id == uuid4())).all()
+
+        assert stats.count == 1 + instrumentation.N_PLUS_ONE_THRESHOLD
+        assert stats.total_ms > 0
+        (repeated,) = stats.repeated().items()
+        assert repeated[1] == instrumentation.N_PLUS_ONE_THRESHOLD
+        assert stats.headers()["X-DB-Repeated-Statements"] == "1"
+
+    def test_repeated_writes_not_flagged(self, db: Session):
+        with instrumentation.track("test") as stats:
+            for i in range(instrumentation.N_PLUS_ONE_THRESHOLD):
+                db.add(Project(name=f"P{i}"))
+                db.flush()
+
+        assert stats.count == instrumentation.N_PLUS_ONE_THRESHOLD
+        assert stats.repeated() == {}
+
+    def test_repeated_row_locks_not_flagged(self, db: Session, project: Project):
+        with instrumentation.track("test") as stats:
+            for _ in range(instrumentation.N_PLUS_ONE_THRESHOLD):
+                db.get(Project, project.id, with_for_update=True)
+
+        assert stats.count == instrumentation.N_PLUS_ONE_THRESHOLD
+        assert stats.repeated() == {}
+
+    def test_nested_units_are_shared(self, db: Session):
+        with instrumentation.track("outer") as outer:
+            with instrumentation.track("inner") as inner:
+                db.exec(select(Project)).all()
+        assert inner is outer
+        assert outer.count == 1
+        assert instrumentation.current_stats() is None
+
+    def test_untracked_statements_ignored(self, db: Session):
+        db.exec(select(Project)).all()
+        assert instrumentation.current_stats() is None
+
+
+class TestHttpHeaders:
+    def test_response_reports_query_count(self, client: TestClient, project: Project):
+        resp = client.get(f"/v1/projects/{project.id}/summary")
+        assert resp.status_code == 200
+        assert int(resp.headers["X-DB-Query-Count"]) >= 1
+        assert float(resp.headers["X-DB-Time-Ms"]) >= 0
+        assert "X-DB-Repeated-Statements" not in resp.headers
@@ -0,0 +1,95 @@
+"""
+Tests de la sonde de disponibilité (app/db/readiness.py et ``GET /ready``).
+
+Couvre :
+- Base joignable : prêt, latence mesurée (moteurs synchrone et asynchrone)
+- Pool saturé : indisponible sans attendre ``pool_timeout``
+- Base lente : indisponible au-delà du délai, sans empiler les emprunts
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+from sqlmodel import create_engine
+
+from app.db import readiness
+
+
+@pytest.fixture()
+def bounded_engine(tmp_path: Path):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'ready.db'}", poolclass=QueuePool, pool_size=1, max_overflow=0
+    )
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture()
+def bounded_async_engine(tmp_path: Path):
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'ready.db'}",
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+    )
+    yield engine
+    asyncio.run(engine.dispose())
+
+
+class TestCheck:
+    def test_ready(self, bounded_engine, bounded_async_engine):
+        result = asyncio.run(
+            readiness.check({"sync": bounded_engine, "async": bounded_async_engine})
+        )
+        assert result.ready
+        assert result.latency_ms is not None
+        assert result.pools["sync"]["capacity"] == result.pools["async"]["capacity"] == 1
+
+    def test_pool_exhausted(self, bounded_engine):
+        with bounded_engine.connect():
+            result = asyncio.run(readiness.check({"sync": bounded_engine}, timeout=5))
+        assert not result.ready
+        assert result.reason == "pool_exhausted: sync"
+        assert result.pools["sync"]["checked_out"] == 1
+
+    def test_async_pool_exhausted(self, bounded_async_engine):
+        async def scenario():
+            async with bounded_async_engine.connect():
+                return await readiness.check({"async": bounded_async_engine}, timeout=5)
+
+        result = asyncio.run(scenario())
+        assert not result.ready
+        assert result.reason == "pool_exhausted: async"
+
+    def test_slow_database(self, bounded_engine, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(readiness, "ping", lambda engine: time.sleep(0.3))
+
+        async def scenario():
+            first = await readiness.check({"sync": bounded_engine}, timeout=0.05)
+            # Ping précédent encore en cours : pas de second emprunt
+            second = await readiness.check({"sync": bounded_engine}, timeout=0.05)
+            await asyncio.sleep(0.4)
+            third = await readiness.check({"sync": bounded_engine}, timeout=1)
+            return first, second, third
+
+        first, second, third = asyncio.run(scenario())
+        assert not first.ready
+        assert first.reason.startswith("timeout")
+        assert second.reason == "previous check still pending"
+        assert third.ready
+
+
+class TestReadyEndpoint:
+    def test_ready_endpoint(self, client: TestClient):
+        resp = client.get("/ready")
+        assert resp.status_code == 200
+        body = resp.json()
+        assert body["status"] == "ready"
+        assert body["db_latency_ms"] >= 0
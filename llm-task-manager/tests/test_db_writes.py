@@ -0,0 +1,68 @@
+"""
+Tests des écritures sans relecture (app/db/writes.py).
+
+Couvre :
+- Création : un seul ``INSERT``, objet complet sans ``SELECT`` ultérieur
+- Mise à jour : ``updated_at`` (``onupdate`` Python) lisible sans relecture
+- Services et routes : une instruction par mutation, plus le chargement
+- Services renvoyant l'entité mise à jour (sans relecture par l'appelant)
+"""
+
+from __future__ import annotations
+
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from app.db import instrumentation, save
+from app.models.domain import Project, Sprint, SprintStatus, Story
+from app.services import sprints as sprint_service
+
+
+class TestSave:
+    def test_insert_without_reload(self, db: Session):
+        instrumentation.install(db.get_bind())
+        project = Project(name="Sans relecture")
+        with instrumentation.track("test") as stats:
+            save(db, project)
+            assert project.id is not None
+            assert project.created_at is not None
+        assert stats.count == 1
+        assert db.expire_on_commit
+
+    def test_update_keeps_onupdate_value(self, db: Session, project: Project):
+        instrumentation.install(db.get_bind())
+        before = project.updated_at
+        project.name = "Renommé"
+        with instrumentation.track("test") as stats:
+            save(db, project)
+            assert project.updated_at > before
+        assert stats.count == 1
+        assert db.get(Project, project.id).updated_at == project.updated_at
+
+
+class TestWriteRoundTrips:
+    def test_start_sprint(self, db: Session, sprint: Sprint):
+        instrumentation.install(db.get_bind())
+        db.expunge_all()
+        with instrumentation.track("test") as stats:
+            started = sprint_service.start_sprint(db, sprint.id)
+            assert started.status == SprintStatus.ACTIVE
+        # Chargement + UPDATE, sans SELECT de rechargement
+        assert stats.count == 2
+
+    def test_sprint_link_returns_sprint(self, db: Session, sprint: Sprint, story: Story):
+        instrumentation.install(db.get_bind())
+        sprint_id, name, story_id = sprint.id, sprint.name, story.id
+        db.expunge_all()
+        added = sprint_service.add_story_to_sprint(db, sprint_id, story_id)
+        removed = sprint_service.remove_story_from_sprint(db, sprint_id, story_id)
+        # Sprint renvoyé non expiré : sérialisable sans nouvelle requête
+        with instrumentation.track("test") as stats:
+            assert (added.id, removed.name) == (sprint_id, name)
+        assert stats.count == 0
+
+    def test_rest_create(self, client: TestClient, db: Session):
+        instrumentation.install(db.get_bind())
+        resp = client.post("/v1/projects", json={"name": "REST"})
+        assert resp.status_code == 201
+        assert resp.headers["X-DB-Query-Count"] == "1"
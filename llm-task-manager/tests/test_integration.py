@@ -8,10 +8,12 @@ Couvre :
   - Story points invalides
   - Clôture de sprint bloquée
   - Retrait d'une story non liée
+- Instantané de projet : contenu, requêtes fixes, cache et invalidation
 """
 
 from __future__ import annotations
 
+import json
 from uuid import uuid4
 
 import pytest
@@ -37,7 +39,7 @@ class TestCRUDIntegration:
         # 2. Lister les projets
         resp = client.get("/v1/projects")
         assert resp.status_code == 200
-        projects = resp.json()
+        projects = resp.json()["items"]
         assert any(p["id"] == project_id for p in projects)
 
         # 3. Créer un epic
@@ -122,7 +124,7 @@ class TestCRUDIntegration:
         # Lister les commentaires
         resp = client.get("/v1/comments")
         assert resp.status_code == 200
-        assert len(resp.json()) >= 1
+        assert len(resp.json()["items"]) >= 1
 
     def test_create_and_list_documents(self, client: TestClient):
         resp = client.post("/v1/projects", json={"name": "DocProj"})
@@ -139,7 +141,7 @@ class TestCRUDIntegration:
 
         resp = client.get("/v1/documents")
         assert resp.status_code == 200
-        assert len(resp.json()) >= 1
+        assert len(resp.json()["items"]) >= 1
 
 
 # ---------------------------------------------------------------------------
@@ -291,7 +293,7 @@ class TestFiltersAndSearch:
         # Filtrer par status=todo
         resp = client.get("/v1/stories", params={"status": "todo"})
         assert resp.status_code == 200
-        stories = resp.json()
+        stories = resp.json()["items"]
         assert all(s["status"] == "todo" for s in stories)
         assert any(s["id"] == s2_id for s in stories)
 
@@ -309,5 +311,442 @@ class TestFiltersAndSearch:
 
         resp = client.get("/v1/sprints", params={"status": "active"})
         assert resp.status_code == 200
-        sprints = resp.json()
+        sprints = resp.json()["items"]
         assert all(s["status"] == "active" for s in sprints)
+
+    def test_search_stories(self, client: TestClient):
+        resp = client.post("/v1/projects", json={"name": "SearchProj"})
+        project_id = resp.json()["id"]
+
+        resp = client.post("/v1/stories", json={
+            "project_id": project_id, "title": "Alerte maintenance", "story_points": 1,
+        })
+        story_id = resp.json()["id"]
+        client.post("/v1/stories", json={
+            "project_id": project_id, "title": "Rapport de shift", "story_points": 1,
+        })
+
+        resp = client.get("/v1/stories/search", params={"q": "maintenance"})
+        assert resp.status_code == 200
+        hits = resp.json()
+        assert [h["id"] for h in hits] == [story_id]
+        assert hits[0]["entity_type"] == "story"
+        assert "[maintenance]" in hits[0]["snippet"]
+
+    def test_unified_search(self, client: TestClient):
+        resp = client.post("/v1/projects", json={"name": "UnifiedProj"})
+        project_id = resp.json()["id"]
+        resp = client.post("/v1/projects", json={"name": "OtherProj"})
+        other_id = resp.json()["id"]
+
+        client.post("/v1/epics", json={"project_id": project_id, "title": "Shift planning"})
+        client.post("/v1/stories", json={
+            "project_id": project_id, "title": "Shift handover", "story_points": 1,
+        })
+        client.post("/v1/documents", json={
+            "project_id": project_id, "title": "Retro", "content": "Shift issues",
+        })
+        client.post("/v1/stories", json={
+            "project_id": other_id, "title": "Shift elsewhere", "story_points": 1,
+        })
+
+        resp = client.get("/v1/search", params={"q": "shift", "project_id": project_id})
+        assert resp.status_code == 200
+        hits = resp.json()
+        assert sorted(h["entity_type"] for h in hits) == ["document", "epic", "story"]
+        assert all(h["project_id"] == project_id for h in hits)
+
+        resp = client.get(
+            "/v1/search", params=[("q", "shift"), ("types", "story"), ("types", "epic")],
+        )
+        assert sorted(h["entity_type"] for h in resp.json()) == ["epic", "story", "story"]
+
+
+# ---------------------------------------------------------------------------
+# Pagination par curseur
+# ---------------------------------------------------------------------------
+
+
+class TestPagination:
+    def test_list_stories_walks_all_pages(self, client: TestClient):
+        resp = client.post("/v1/projects", json={"name": "PageProj"})
+        project_id = resp.json()["id"]
+
+        created = set()
+        for i in range(5):
+            resp = client.post("/v1/stories", json={
+                "project_id": project_id, "title": f"Page {i}", "story_points": 1,
+            })
+            created.add(resp.json()["id"])
+
+        seen: list[str] = []
+        cursor = None
+        while True:
+            params = {"limit": 2}
+            if cursor:
+                params["cursor"] = cursor
+            resp = client.get("/v1/stories", params=params)
+            assert resp.status_code == 200
+            body = resp.json()
+            assert len(body["items"]) <= 2
+            seen.extend(s["id"] for s in body["items"])
+            cursor = body["next_cursor"]
+            if cursor is None:
+                break
+
+        assert len(seen) == len(set(seen)) == 5
+        assert set(seen) == created
+
+    def test_list_encoded_like_response_model(self, client: TestClient):
+        """Le chemin direct (sans revalidation) produit le même JSON que ``response_model``."""
+        resp = client.post("/v1/projects", json={"name": "JsonProj"})
+        project_id = resp.json()["id"]
+        story = client.post("/v1/stories", json={"project_id": project_id, "title": "S"}).json()
+
+        resp = client.get("/v1/stories")
+        assert resp.headers["content-type"] == "application/json"
+        assert resp.json() == {"items": [story], "next_cursor": None}
+        assert resp.content == json.dumps(resp.json(), separators=(",", ":")).encode()
+
+    def test_compact_view_and_fields(self, client: TestClient):
+        project_id = client.post("/v1/projects", json={"name": "CompactProj"}).json()["id"]
+        story = client.post("/v1/stories", json={"project_id": project_id, "title": "S"}).json()
+
+        compact = client.get("/v1/stories", params={"view": "compact"}).json()["items"][0]
+        assert set(compact) == {"id", "epic_id", "title", "status", "priority", "story_points", "assignee"}
+        assert compact == {k: story[k] for k in compact}
+
+        resp = client.get("/v1/stories", params={"fields": "title,status"})
+        assert resp.json()["items"] == [{"id": story["id"], "title": "S", "status": "backlog"}]
+
+        resp = client.get("/v1/epics", params={"fields": "title,secret"})
+        assert resp.status_code == 400
+        assert resp.json()["detail"]["code"] == "INVALID_FIELDS"
+
+    def test_invalid_cursor(self, client: TestClient):
+        resp = client.get("/v1/projects", params={"cursor": "not-a-cursor"})
+        assert resp.status_code == 400
+        assert resp.json()["detail"]["code"] == "INVALID_CURSOR"
+
+    def test_limit_out_of_bounds(self, client: TestClient):
+        resp = client.get("/v1/epics", params={"limit": 0})
+        assert resp.status_code == 422
+
+
+# ---------------------------------------------------------------------------
+# GET conditionnels (ETag / If-None-Match)
+# ---------------------------------------------------------------------------
+
+
+class TestConditionalGet:
+    def test_entity_etag_and_304(self, client: TestClient):
+        resp = client.post("/v1/projects", json={"name": "EtagProj"})
+        project_id = resp.json()["id"]
+        resp = client.post("/v1/documents", json={
+            "project_id": project_id, "title": "Doc", "content": "x" * 10_000,
+        })
+        doc_id = resp.json()["id"]
+
+        resp = client.get(f"/v1/documents/{doc_id}")
+        etag = resp.headers["etag"]
+        assert etag.startswith('"') and not etag.startswith("W/")
+
+        resp = client.get(f"/v1/documents/{doc_id}", headers={"If-None-Match": etag})
+        assert resp.status_code == 304
+        assert resp.headers["etag"] == etag
+        assert resp.content == b""
+
+        # Une modification rafraîchit updated_at, donc l'ETag
+        client.patch(f"/v1/documents/{doc_id}", json={"content": "v2"})
+        resp = client.get(f"/v1/documents/{doc_id}", headers={"If-None-Match": etag})
+        assert resp.status_code == 200
+        assert resp.headers["etag"] != etag
+        assert resp.json()["content"] == "v2"
+
+    def test_weak_and_multiple_validators(self, client: TestClient):
+        resp = client.post("/v1/projects", json={"name": "EtagProj"})
+        resp = client.post("/v1/epics", json={"project_id": resp.json()["id"], "title": "E"})
+        epic_id = resp.json()["id"]
+        etag = client.get(f"/v1/epics/{epic_id}").headers["etag"]
+
+        resp = client.get(f"/v1/epics/{epic_id}", headers={"If-None-Match": f'"other", W/{etag}'})
+        assert resp.status_code == 304
+
+    def test_list_etag_tracks_changes(self, client: TestClient):
+        resp = client.post("/v1/projects", json={"name": "EtagProj"})
+        project_id = resp.json()["id"]
+        resp = client.post("/v1/stories", json={"project_id": project_id, "title": "S1"})
+        story_id = resp.json()["id"]
+
+        resp = client.get("/v1/stories")
+        etag = resp.headers["etag"]
+        assert client.get("/v1/stories", headers={"If-None-Match": etag}).status_code == 304
+
+        # Paramètres différents -> représentation différente
+        assert client.get("/v1/stories", params={"limit": 1}).headers["etag"] != etag
+
+        # Mise à jour -> updated_at d'une ligne de la page change
+        client.patch(f"/v1/stories/{story_id}", json={"status": "todo"})
+        resp = client.get("/v1/stories", headers={"If-None-Match": etag})
+        assert resp.status_code == 200
+        etag = resp.headers["etag"]
+
+        # Création -> nouvelle ligne dans la page
+        client.post("/v1/stories", json={"project_id": project_id, "title": "S2"})
+        assert client.get("/v1/stories", headers={"If-None-Match": etag}).status_code == 200
+
+    def test_list_etag_single_query(self, client: TestClient, db):
+        from app.db import instrumentation
+
+        instrumentation.install(db.get_bind())
+        project_id = client.post("/v1/projects", json={"name": "EtagProj"}).json()["id"]
+        for title in ("S1", "S2", "S3"):
+            client.post("/v1/stories", json={"project_id": project_id, "title": title})
+
+        first = client.get("/v1/stories", params={"limit": 2, "view": "compact"})
+        assert first.headers["X-DB-Query-Count"] == "1"
+        params = {"limit": 2, "view": "compact", "cursor": first.json()["next_cursor"]}
+        resp = client.get("/v1/stories", params=params)
+        assert resp.headers["X-DB-Query-Count"] == "1"
+
+        resp = client.get("/v1/stories", params=params, headers={"If-None-Match": resp.headers["etag"]})
+        assert resp.status_code == 304
+        assert resp.headers["X-DB-Query-Count"] == "1"
+
+    @pytest.mark.parametrize("path", ["/v1/projects", "/v1/sprints", "/v1/comments"])
+    def test_other_lists_support_etag(self, client: TestClient, path: str):
+        project_id = client.post("/v1/projects", json={"name": "EtagProj"}).json()["id"]
+        client.post("/v1/sprints", json={"project_id": project_id, "name": "Sprint"})
+        client.post("/v1/comments", json={
+            "project_id": project_id, "target_type": "story", "target_id": str(uuid4()), "content": "A",
+        })
+
+        etag = client.get(path).headers["etag"]
+        assert client.get(path, headers={"If-None-Match": etag}).status_code == 304
+
+        client.post("/v1/comments", json={
+            "project_id": project_id, "target_type": "story", "target_id": str(uuid4()), "content": "B",
+        })
+        client.post("/v1/sprints", json={"project_id": project_id, "name": "Sprint 2"})
+        client.post("/v1/projects", json={"name": "EtagProj 2"})
+        assert client.get(path, headers={"If-None-Match": etag}).status_code == 200
+
+    def test_sprint_list_etag_tracks_membership(self, client: TestClient):
+        resp = client.post("/v1/projects", json={"name": "EtagProj"})
+        project_id = resp.json()["id"]
+        resp = client.post("/v1/sprints", json={"project_id": project_id, "name": "Sprint"})
+        sprint_id = resp.json()["id"]
+        story_id = client.post("/v1/stories", json={"project_id": project_id, "title": "S"}).json()["id"]
+
+        params = {"sprint_id": sprint_id}
+        etag = client.get("/v1/stories", params=params).headers["etag"]
+        client.post(f"/v1/sprints/{sprint_id}/stories/{story_id}")
+        resp = client.get("/v1/stories", params=params, headers={"If-None-Match": etag})
+        assert resp.status_code == 200
+        assert len(resp.json()["items"]) == 1
+
+
+# ---------------------------------------------------------------------------
+# Tableau de bord projet
+# ---------------------------------------------------------------------------
+
+
+class TestProjectSummary:
+    def test_summary_groups(self, client: TestClient):
+        project_id = client.post("/v1/projects", json={"name": "Dash"}).json()["id"]
+        epic_id = client.post("/v1/epics", json={"project_id": project_id, "title": "E1"}).json()["id"]
+        sprint_id = client.post("/v1/sprints", json={"project_id": project_id, "name": "S1"}).json()["id"]
+
+        stories = [
+            {"title": "A", "story_points": 3, "assignee": "alice", "epic_id": epic_id, "priority": "high"},
+            {"title": "B", "story_points": 5, "assignee": "alice", "epic_id": epic_id},
+            {"title": "C", "story_points": 8, "status": "todo"},
+        ]
+        ids = [
+            client.post("/v1/stories", json={"project_id": project_id, **s}).json()["id"]
+            for s in stories
+        ]
+        client.post(f"/v1/sprints/{sprint_id}/stories/{ids[0]}")
+        # Story d'un autre projet : ignorée
+        other = client.post("/v1/projects", json={"name": "Other"}).json()["id"]
+        client.post("/v1/stories", json={"project_id": other, "title": "X", "story_points": 13})
+
+        resp = client.get(f"/v1/projects/{project_id}/summary")
+        assert resp.status_code == 200
+        body = resp.json()
+        assert (body["story_count"], body["story_points"]) == (3, 16)
+
+        by_status = {b["key"]: (b["count"], b["points"]) for b in body["by_status"]}
+        assert by_status["backlog"] == (2, 8)
+        assert by_status["todo"] == (1, 8)
+        assert by_status["done"] == (0, 0)
+        assert [b["key"] for b in body["by_priority"]] == ["low", "medium", "high", "critical"]
+
+        assert body["by_assignee"][0] == {"key": "alice", "label": None, "count": 2, "points": 8}
+        assert {"key": None, "label": None, "count": 1, "points": 8} in body["by_assignee"]
+
+        by_epic = {b["key"]: b for b in body["by_epic"]}
+        assert by_epic[epic_id]["label"] == "E1"
+        assert by_epic[epic_id]["points"] == 8
+
+        by_sprint = {b["key"]: (b["label"], b["count"]) for b in body["by_sprint"]}
+        assert by_sprint == {sprint_id: ("S1", 1), None: (None, 2)}
+
+    def test_summary_unknown_project(self, client: TestClient):
+        resp = client.get(f"/v1/projects/{uuid4()}/summary")
+        assert resp.status_code == 404
+        assert resp.json()["detail"]["code"] == "PROJECT_NOT_FOUND"
+
+    def test_snapshot(self, client: TestClient, db):
+        from app.db import instrumentation
+
+        instrumentation.install(db.get_bind())
+        project_id = client.post("/v1/projects", json={"name": "Snap"}).json()["id"]
+        epic_id = client.post("/v1/epics", json={"project_id": project_id, "title": "E1"}).json()["id"]
+        sprint_id = client.post("/v1/sprints", json={"project_id": project_id, "name": "S1"}).json()["id"]
+        ids = {
+            title: client.post("/v1/stories", json={
+                "project_id": project_id, "title": title, "story_points": points,
+                **({"epic_id": epic_id} if title != "C" else {}),
+            }).json()["id"]
+            for title, points in (("A", 3), ("B", 5), ("C", 8), ("D", 2))
+        }
+        for title in ("A", "B"):
+            client.post(f"/v1/sprints/{sprint_id}/stories/{ids[title]}")
+        client.post(f"/v1/sprints/{sprint_id}/start")
+        for status in ("todo", "in_progress", "in_review", "done"):
+            for title in ("B", "D"):
+                client.patch(f"/v1/stories/{ids[title]}", json={"status": status})
+        client.post("/v1/comments", json={
+            "project_id": project_id, "target_type": "story", "target_id": ids["A"], "content": "Go",
+        })
+
+        resp = client.get(f"/v1/projects/{project_id}/snapshot")
+        assert resp.status_code == 200
+        assert resp.headers["X-DB-Query-Count"] == "6"
+        body = resp.json()
+        epic = body["epics"][0]
+        assert (epic["story_count"], epic["story_points"], epic["done_points"]) == (3, 10, 7)
+        # D (terminée, hors sprint actif) n'est que comptée
+        assert [s["title"] for s in epic["stories"]] == ["A", "B"]
+        assert [s["title"] for s in body["stories_without_epic"]] == ["C"]
+        sprint = body["active_sprint"]
+        assert sprint["story_ids"] == [ids["A"], ids["B"]]
+        assert (sprint["story_points"], sprint["done_points"]) == (8, 5)
+        assert [c["content"] for c in body["recent_comments"]] == ["Go"]
+
+        cached = client.get(f"/v1/projects/{project_id}/snapshot")
+        assert cached.headers["X-DB-Query-Count"] == "0"
+        assert cached.json() == body
+
+        # Écriture ensembliste (lien story/sprint) : instantané invalidé
+        client.post(f"/v1/sprints/{sprint_id}/stories/{ids['C']}")
+        body = client.get(f"/v1/projects/{project_id}/snapshot").json()
+        assert body["active_sprint"]["story_ids"] == [ids["A"], ids["B"], ids["C"]]
+
+    def test_snapshot_unknown_project(self, client: TestClient):
+        resp = client.get(f"/v1/projects/{uuid4()}/snapshot")
+        assert resp.status_code == 404
+        assert resp.json()["detail"]["code"] == "PROJECT_NOT_FOUND"
+
+    def test_epic_and_sprint_progress(self, client: TestClient):
+        project_id = client.post("/v1/projects", json={"name": "Prog"}).json()["id"]
+        epic_id = client.post("/v1/epics", json={"project_id": project_id, "title": "E"}).json()["id"]
+        sprint_id = client.post("/v1/sprints", json={"project_id": project_id, "name": "S"}).json()["id"]
+        story_id = client.post("/v1/stories", json={
+            "project_id": project_id, "epic_id": epic_id, "title": "S", "story_points": 5,
+        }).json()["id"]
+        client.post(f"/v1/sprints/{sprint_id}/stories/{story_id}")
+        for status in ("todo", "in_progress", "in_review", "done"):
+            client.patch(f"/v1/stories/{story_id}", json={"status": status})
+
+        for url in (f"/v1/epics/{epic_id}/progress", f"/v1/sprints/{sprint_id}/progress"):
+            body = client.get(url).json()
+            assert (body["story_count"], body["done_count"], body["done_points"]) == (1, 1, 5)
+
+        assert client.get(f"/v1/sprints/{uuid4()}/progress").status_code == 404
+
+
+# ---------------------------------------------------------------------------
+# Opérations par lot
+# ---------------------------------------------------------------------------
+
+
+class TestBatchOperations:
+    def test_create_stories_batch(self, client: TestClient):
+        project_id = client.post("/v1/projects", json={"name": "Batch"}).json()["id"]
+        epic_id = client.post("/v1/epics", json={"project_id": project_id, "title": "E"}).json()["id"]
+
+        resp = client.post("/v1/stories:batch", json={"items": [
+            {"project_id": project_id, "epic_id": epic_id, "title": "One", "story_points": 2},
+            {"project_id": project_id, "title": "Bad", "story_points": 6},
+            {"project_id": project_id, "epic_id": epic_id, "title": "Two", "story_points": 3},
+        ]})
+        assert resp.status_code == 200
+        body = resp.json()
+        assert [s["title"] for s in body["created"]] == ["One", "Two"]
+        assert body["errors"] == [{
+            "index": 1,
+            "code": "INVALID_STORY_POINTS",
+            "message": body["errors"][0]["message"],
+        }]
+
+        # Stories lisibles, indexées et comptées dans les rollups
+        story_id = body["created"][0]["id"]
+        assert client.get(f"/v1/stories/{story_id}").json()["title"] == "One"
+        hits = client.get("/v1/stories/search", params={"q": "two"}).json()
+        assert [h["title"] for h in hits] == ["Two"]
+        progress = client.get(f"/v1/epics/{epic_id}/progress").json()
+        assert (progress["story_count"], progress["story_points"]) == (2, 5)
+
+    def test_create_stories_batch_requires_items(self, client: TestClient):
+        assert client.post("/v1/stories:batch", json={"items": []}).status_code == 422
+
+    def test_transition_stories(self, client: TestClient):
+        project_id = client.post("/v1/projects", json={"name": "Bulk"}).json()["id"]
+        resp = client.post("/v1/stories:batch", json={"items": [
+            {"project_id": project_id, "title": f"S{i}", "assignee": "ann"} for i in range(3)
+        ] + [{"project_id": project_id, "title": "Other", "assignee": "bob"}]})
+        created = [s["id"] for s in resp.json()["created"]]
+
+        resp = client.post("/v1/stories:transition", json={
+            "status": "todo", "filter": {"project_id": project_id, "assignee": "ann"},
+        })
+        assert resp.status_code == 200
+        assert sorted(resp.json()["updated"]) == sorted(created[:3])
+
+        resp = client.post("/v1/stories:transition", json={
+            "status": "done", "story_ids": created[:1],
+        })
+        assert resp.json()["rejected"][0]["code"] == "INVALID_STATUS_TRANSITION"
+        assert client.get(f"/v1/stories/{created[0]}").json()["status"] == "todo"
+
+        resp = client.post("/v1/stories:transition", json={"status": "todo"})
+        assert resp.status_code == 400
+        assert resp.json()["detail"]["code"] == "INVALID_SELECTION"
+
+    def test_update_sprint_stories_batch(self, client: TestClient):
+        project_id = client.post("/v1/projects", json={"name": "Planning"}).json()["id"]
+        sprint_id = client.post(
+            "/v1/sprints", json={"project_id": project_id, "name": "S1"}
+        ).json()["id"]
+        resp = client.post("/v1/stories:batch", json={"items": [
+            {"project_id": project_id, "title": f"S{i}", "story_points": 1} for i in range(3)
+        ]})
+        ids = [s["id"] for s in resp.json()["created"]]
+
+        resp = client.post(f"/v1/sprints/{sprint_id}/stories:batch", json={"add": ids})
+        assert resp.status_code == 200
+        assert resp.json()["added"] == ids
+
+        resp = client.post(
+            f"/v1/sprints/{sprint_id}/stories:batch", json={"remove": ids[:1] + ids[:1]}
+        )
+        assert resp.json()["removed"] == ids[:1]
+        progress = client.get(f"/v1/sprints/{sprint_id}/progress").json()
+        assert progress["story_count"] == 2
+
+        missing = client.post(
+            f"/v1/sprints/{uuid4()}/stories:batch", json={"add": ids}
+        )
+        assert missing.status_code == 404
@@ -0,0 +1,310 @@
+"""
+Tests des tools MCP (app/mcp/server.py) sur le moteur asynchrone.
+
+Utilise une base SQLite fichier temporaire (aiosqlite), partagée entre un
+moteur synchrone (création du schéma) et le moteur asynchrone des tools.
+
+Couvre :
+- Création / lecture / liste paginée via les tools
+- Appel des services métier synchrones via ``run_sync``
+- Exécution concurrente de plusieurs tools
+- Batch multi-opérations (`execute_batch`) sur une connexion dédiée
+- Vue compacte des listes et lectures (`view` / `fields`)
+- Instantané de projet (`get_project_snapshot`) et son invalidation
+- Transport streamable HTTP monté dans l'application FastAPI (``/mcp``)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib
+from collections.abc import Generator
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import SQLModel, create_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.db.config import get_async_database_url
+
+# ``app.mcp.server`` est masqué par l'objet FastMCP exporté par ``app.mcp``.
+mcp_server = importlib.import_module("app.mcp.server")
+
+
+@pytest.fixture()
+def mcp_db(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Generator[None, None, None]:
+    """Branche les tools MCP sur une base SQLite fichier dédiée au test."""
+    db_file = tmp_path / "mcp.db"
+    sync_engine = create_engine(f"sqlite:///{db_file}")
+    SQLModel.metadata.create_all(bind=sync_engine)
+
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{db_file}")
+    monkeypatch.setattr(
+        mcp_server,
+        "async_session",
+        lambda: AsyncSession(async_engine, expire_on_commit=False),
+    )
+    monkeypatch.setattr(mcp_server, "async_engine", async_engine)
+    yield
+    asyncio.run(async_engine.dispose())
+    sync_engine.dispose()
+
+
+class TestAsyncDatabaseUrl:
+    @pytest.mark.parametrize(
+        ("sync_url", "async_url"),
+        [
+            ("sqlite:///./x.db", "sqlite+aiosqlite:///./x.db"),
+            ("postgresql://u:p@h/db", "postgresql+psycopg://u:p@h/db"),
+            ("postgresql+psycopg://u:p@h/db", "postgresql+psycopg://u:p@h/db"),
+            ("postgresql+asyncpg://u:p@h/db", "postgresql+asyncpg://u:p@h/db"),
+        ],
+    )
+    def test_driver_mapping(self, monkeypatch: pytest.MonkeyPatch, sync_url: str, async_url: str):
+        from app.db import config
+
+        monkeypatch.setenv("DATABASE_URL", sync_url)
+        config.get_database_url.cache_clear()
+        config.get_async_database_url.cache_clear()
+        try:
+            assert get_async_database_url() == async_url
+        finally:
+            config.get_database_url.cache_clear()
+            config.get_async_database_url.cache_clear()
+
+
+@pytest.mark.usefixtures("mcp_db")
+class TestMcpTools:
+    def test_project_story_roundtrip(self):
+        async def scenario():
+            project = await mcp_server.create_project(name="MCP")
+            story = await mcp_server.create_story(
+                project_id=str(project["id"]), title="Async story", story_points=3,
+            )
+            fetched = await mcp_server.get_story(story_id=str(story["id"]))
+            updated = await mcp_server.update_story(story_id=str(story["id"]), status="todo")
+            page = await mcp_server.list_stories(status="todo")
+            return fetched, updated, page
+
+        fetched, updated, page = asyncio.run(scenario())
+        assert fetched["title"] == "Async story"
+        assert updated["status"] == "todo"
+        assert [s["id"] for s in page["items"]] == [fetched["id"]]
+
+    def test_domain_error_surfaces_code(self):
+        async def scenario():
+            project = await mcp_server.create_project(name="MCP")
+            await mcp_server.create_story(
+                project_id=str(project["id"]), title="Bad", story_points=4,
+            )
+
+        with pytest.raises(RuntimeError, match="INVALID_STORY_POINTS"):
+            asyncio.run(scenario())
+
+    def test_concurrent_tool_calls(self):
+        async def scenario():
+            await asyncio.gather(*(mcp_server.create_project(name=f"P{i}") for i in range(10)))
+            return await mcp_server.list_projects(limit=100)
+
+        page = asyncio.run(scenario())
+        assert len(page["items"]) == 10
+
+    def test_project_summary(self):
+        async def scenario():
+            project = await mcp_server.create_project(name="MCP")
+            for points in (1, 2):
+                await mcp_server.create_story(
+                    project_id=str(project["id"]), title=f"S{points}", story_points=points,
+                )
+            return await mcp_server.get_project_summary(project_id=str(project["id"]))
+
+        summary = asyncio.run(scenario())
+        assert (summary["story_count"], summary["story_points"]) == (2, 3)
+        assert summary["by_status"][0] == {"key": "backlog", "label": None, "count": 2, "points": 3}
+
+    def test_project_snapshot(self):
+        async def scenario():
+            project = await mcp_server.create_project(name="MCP")
+            pid = str(project["id"])
+            await mcp_server.create_story(project_id=pid, title="A", story_points=2)
+            first = await mcp_server.get_project_snapshot(project_id=pid)
+            await mcp_server.create_stories(stories=[{"project_id": pid, "title": "B"}])
+            second = await mcp_server.get_project_snapshot(project_id=pid)
+            return first, second
+
+        first, second = asyncio.run(scenario())
+        assert [s["title"] for s in first["stories_without_epic"]] == ["A"]
+        assert first["active_sprint"] is None
+        assert [s["title"] for s in second["stories_without_epic"]] == ["A", "B"]
+
+    def test_sprint_progress(self):
+        async def scenario():
+            project = await mcp_server.create_project(name="MCP")
+            sprint = await mcp_server.create_sprint(project_id=str(project["id"]), name="S1")
+            story = await mcp_server.create_story(
+                project_id=str(project["id"]), title="S", story_points=8,
+            )
+            linked = await mcp_server.add_story_to_sprint(sprint_id=str(sprint["id"]), story_id=str(story["id"]))
+            assert linked["id"] == sprint["id"]
+            return await mcp_server.get_sprint_progress(sprint_id=str(sprint["id"]))
+
+        progress = asyncio.run(scenario())
+        assert (progress["story_count"], progress["story_points"]) == (1, 8)
+
+    def test_create_stories_reports_item_errors(self):
+        async def scenario():
+            project = await mcp_server.create_project(name="MCP")
+            pid = str(project["id"])
+            return await mcp_server.create_stories(stories=[
+                {"project_id": pid, "title": "ok", "story_points": 1},
+                {"project_id": pid, "title": "bad status", "status": "doing"},
+                {"project_id": pid, "title": "bad points", "story_points": 4},
+                {"project_id": pid, "title": "ok too"},
+            ])
+
+        result = asyncio.run(scenario())
+        assert [s["title"] for s in result["created"]] == ["ok", "ok too"]
+        assert [(e["index"], e["code"]) for e in result["errors"]] == [
+            (1, "VALIDATION_ERROR"),
+            (2, "INVALID_STORY_POINTS"),
+        ]
+
+    def test_transition_stories(self):
+        async def scenario():
+            project = await mcp_server.create_project(name="MCP")
+            result = await mcp_server.create_stories(stories=[
+                {"project_id": str(project["id"]), "title": f"S{i}"} for i in range(2)
+            ])
+            ids = [str(s["id"]) for s in result["created"]]
+            moved = await mcp_server.transition_stories(
+                status="todo", project_id=str(project["id"]), from_status="backlog",
+            )
+            rejected = await mcp_server.transition_stories(status="done", story_ids=ids[:1])
+            return ids, moved, rejected
+
+        ids, moved, rejected = asyncio.run(scenario())
+        assert sorted(str(i) for i in moved["updated"]) == sorted(ids)
+        assert rejected["rejected"][0]["code"] == "INVALID_STATUS_TRANSITION"
+
+    def test_update_sprint_stories(self):
+        async def scenario():
+            project = await mcp_server.create_project(name="MCP")
+            sprint = await mcp_server.create_sprint(project_id=str(project["id"]), name="S1")
+            result = await mcp_server.create_stories(stories=[
+                {"project_id": str(project["id"]), "title": f"S{i}"} for i in range(2)
+            ])
+            ids = [str(s["id"]) for s in result["created"]]
+            added = await mcp_server.update_sprint_stories(sprint_id=str(sprint["id"]), add=ids)
+            removed = await mcp_server.update_sprint_stories(
+                sprint_id=str(sprint["id"]), remove=ids[:1]
+            )
+            return ids, added, removed
+
+        ids, added, removed = asyncio.run(scenario())
+        assert [str(i) for i in added["added"]] == ids
+        assert [str(i) for i in removed["removed"]] == ids[:1]
+
+    def test_execute_batch(self):
+        async def scenario():
+            project = await mcp_server.create_project(name="MCP")
+            pid = str(project["id"])
+            result = await mcp_server.execute_batch(operations=[
+                {"op": "create_sprint", "args": {"project_id": pid, "name": "S1"}, "ref": "sprint"},
+                {"op": "create_story", "args": {"project_id": pid, "title": "A", "story_points": 3}, "ref": "a"},
+                {"op": "add_story_to_sprint", "args": {"sprint_id": "$sprint", "story_id": "$a"}},
+            ])
+            progress = await mcp_server.get_sprint_progress(sprint_id=str(result["results"][0]["result"]["id"]))
+            return result, progress
+
+        result, progress = asyncio.run(scenario())
+        assert result["committed"]
+        assert [r["status"] for r in result["results"]] == ["ok", "ok", "ok"]
+        assert (progress["story_count"], progress["story_points"]) == (1, 3)
+
+    def test_compact_view(self):
+        async def scenario():
+            project = await mcp_server.create_project(name="MCP")
+            story = await mcp_server.create_story(project_id=str(project["id"]), title="S", story_points=2)
+            page = await mcp_server.list_stories(view="compact")
+            fetched = await mcp_server.get_story(story_id=str(story["id"]), fields=["title"])
+            return story, page, fetched
+
+        story, page, fetched = asyncio.run(scenario())
+        assert page["items"] == [{k: story[k] for k in page["items"][0]}]
+        assert "created_at" not in page["items"][0]
+        assert fetched == {"id": story["id"], "title": "S"}
+
+
+_MCP_HEADERS = {"Accept": "application/json, text/event-stream"}
+
+
+def _rpc(client: TestClient, method: str, params: dict, headers: dict, id: int = 1):
+    return client.post(
+        "/mcp",
+        headers=headers,
+        json={"jsonrpc": "2.0", "id": id, "method": method, "params": params},
+    )
+
+
+def _open_session(client: TestClient) -> dict:
+    """Initialise une session MCP et renvoie les en-têtes à joindre aux appels."""
+    resp = _rpc(client, "initialize", {
+        "protocolVersion": "2025-06-18",
+        "capabilities": {},
+        "clientInfo": {"name": "test", "version": "1"},
+    }, _MCP_HEADERS)
+    assert resp.status_code == 200
+    headers = {**_MCP_HEADERS, "mcp-session-id": resp.headers["mcp-session-id"]}
+    client.post("/mcp", headers=headers, json={"jsonrpc": "2.0", "method": "notifications/initialized"})
+    return headers
+
+
+@pytest.mark.usefixtures("mcp_db")
+class TestHttpTransport:
+    def test_tool_calls_over_http(self, monkeypatch: pytest.MonkeyPatch):
+        from app.main import app
+
+        monkeypatch.setenv("MCP_ALLOWED_HOSTS", "testserver")
+        with TestClient(app) as client:
+            headers = _open_session(client)
+            created = _rpc(client, "tools/call", {
+                "name": "create_project", "arguments": {"name": "HTTP"},
+            }, headers, id=2)
+            listed = _rpc(client, "tools/call", {
+                "name": "list_projects", "arguments": {"view": "compact"},
+            }, headers, id=3)
+
+        assert created.status_code == 200
+        project = created.json()["result"]["structuredContent"]["result"]
+        assert project["name"] == "HTTP"
+        page = listed.json()["result"]["structuredContent"]["result"]
+        assert page["items"] == [{"id": project["id"], "name": "HTTP"}]
+
+    def test_session_limit(self, monkeypatch: pytest.MonkeyPatch):
+        from app.main import app
+
+        monkeypatch.setenv("MCP_ALLOWED_HOSTS", "testserver")
+        monkeypatch.setenv("MCP_MAX_SESSIONS", "1")
+        with TestClient(app) as client:
+            headers = _open_session(client)
+            refused = _rpc(client, "initialize", {
+                "protocolVersion": "2025-06-18",
+                "capabilities": {},
+                "clientInfo": {"name": "test", "version": "1"},
+            }, _MCP_HEADERS)
+            listed = _rpc(client, "tools/call", {
+                "name": "list_projects", "arguments": {},
+            }, headers, id=2)
+
+        assert refused.status_code == 503
+        assert listed.status_code == 200
+
+    def test_unknown_host_rejected(self, monkeypatch: pytest.MonkeyPatch):
+        from app.main import app
+
+        monkeypatch.delenv("MCP_ALLOWED_HOSTS", raising=False)
+        with TestClient(app) as client:
+            resp = _rpc(client, "initialize", {}, _MCP_HEADERS)
+        assert resp.status_code == 421
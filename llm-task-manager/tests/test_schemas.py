@@ -36,6 +36,8 @@ from app.models.schemas import (
     StoryCreate,
     StoryOut,
     StoryUpdate,
+    dump_many,
+    validate_many,
 )
 
 
@@ -103,6 +105,21 @@ class TestProjectOut:
         assert out.id == uid
         assert out.name == "Proj"
 
+    def test_validate_many_matches_per_row(self):
+        now = datetime.utcnow()
+
+        class FakeProject:
+            def __init__(self, name: str) -> None:
+                self.id = uuid4()
+                self.name = name
+                self.description = None
+                self.created_at = now
+                self.updated_at = now
+
+        rows = [FakeProject(f"P{i}") for i in range(3)]
+        assert validate_many(ProjectOut, rows) == [ProjectOut.model_validate(r) for r in rows]
+        assert dump_many(ProjectOut, rows) == [ProjectOut.model_validate(r).model_dump() for r in rows]
+
 
 # ---------------------------------------------------------------------------
 # EpicCreate / EpicUpdate
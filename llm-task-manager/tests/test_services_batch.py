@@ -0,0 +1,143 @@
+"""
+Tests du service de batch multi-opérations (app/services/batch.py).
+
+Couvre :
+- Enchaînement d'opérations avec références ``$ref`` / ``$<position>``
+- Tout ou rien : annulation complète à la première erreur
+- Rejet préalable (opération inconnue, ``ref`` dupliquée, référence invalide)
+- Invalidation du cache d'entités au commit effectif du batch
+- Nombre de requêtes proportionnel aux écritures : pas de relecture des
+  entités créées par une opération antérieure
+"""
+
+from __future__ import annotations
+
+import pytest
+from sqlmodel import Session, select
+
+from app.db import instrumentation
+from app.models import schemas as sch
+from app.models.domain import (
+    Comment,
+    Project,
+    RollupScope,
+    Sprint,
+    Story,
+    StoryDescription,
+    StorySprintHistory,
+)
+from app.services import rollups
+from app.services.batch import execute_batch
+from app.services.cache import entity_cache
+from app.services.errors import DomainError
+
+
+def _run(db: Session, *operations: dict) -> sch.BatchResult:
+    with db.get_bind().connect() as conn:
+        return execute_batch(conn, [sch.BatchOperation.model_validate(op) for op in operations])
+
+
+class TestExecuteBatch:
+    def test_plan_sprint_with_references(self, db: Session, project: Project):
+        pid = str(project.id)
+        result = _run(
+            db,
+            {"op": "create_sprint", "args": {"project_id": pid, "name": "S1"}, "ref": "sprint"},
+            {"op": "create_story", "args": {"project_id": pid, "title": "Login", "story_points": 5}, "ref": "login"},
+            {"op": "create_story_description", "args": {"story_id": "$login", "description": "Détail"}},
+            {"op": "add_story_to_sprint", "args": {"sprint_id": "$sprint", "story_id": "$1"}},
+            {"op": "add_comment", "args": {
+                "project_id": pid, "target_type": "story", "target_id": "$login", "content": "OK",
+            }},
+        )
+
+        assert result.committed
+        assert [r.status for r in result.results] == ["ok"] * 5
+        story_id = result.results[1].result["id"]
+        sprint_id = result.results[0].result["id"]
+        assert db.exec(select(StoryDescription)).one().story_id == story_id
+        link = db.exec(select(StorySprintHistory)).one()
+        assert (link.story_id, link.sprint_id, link.is_active) == (story_id, sprint_id, True)
+        assert db.exec(select(Comment)).one().target_id == story_id
+        progress = rollups.get_progress(db, RollupScope.SPRINT, sprint_id)
+        assert (progress.story_count, progress.story_points) == (1, 5)
+
+    def test_error_rolls_back_everything(self, db: Session, project: Project):
+        pid = str(project.id)
+        result = _run(
+            db,
+            {"op": "create_sprint", "args": {"project_id": pid, "name": "S1"}},
+            {"op": "create_story", "args": {"project_id": pid, "title": "A"}, "ref": "a"},
+            {"op": "update_story", "args": {"story_id": "$a", "status": "done"}},
+            {"op": "create_story", "args": {"project_id": pid, "title": "B"}},
+        )
+
+        assert not result.committed
+        assert [r.status for r in result.results] == ["rolled_back", "rolled_back", "error", "skipped"]
+        assert result.results[2].code == "INVALID_STATUS_TRANSITION"
+        assert result.results[0].result is None
+        assert db.exec(select(Story)).all() == []
+        assert db.exec(select(Sprint)).all() == []
+
+    def test_validation_error_is_reported(self, db: Session, project: Project):
+        result = _run(
+            db,
+            {"op": "create_story", "args": {"project_id": str(project.id), "title": "A", "status": "doing"}},
+        )
+        assert not result.committed
+        assert result.results[0].code == "VALIDATION_ERROR"
+
+    def test_reference_to_operation_without_id(self, db: Session, project: Project, story: Story, sprint: Sprint):
+        result = _run(
+            db,
+            {"op": "add_story_to_sprint", "args": {"sprint_id": str(sprint.id), "story_id": str(story.id)}},
+            {"op": "update_story", "args": {"story_id": "$0", "title": "X"}},
+        )
+        assert [(r.status, r.code) for r in result.results] == [
+            ("rolled_back", None),
+            ("error", "INVALID_REFERENCE"),
+        ]
+
+    @pytest.mark.parametrize(
+        ("operations", "code"),
+        [
+            ([{"op": "drop_project"}], "UNKNOWN_OPERATION"),
+            ([{"op": "create_project", "args": {"name": "A"}, "ref": "p"}] * 2, "INVALID_REFERENCE"),
+            ([{"op": "create_project", "args": {"name": "A"}, "ref": "1"}], "INVALID_REFERENCE"),
+        ],
+    )
+    def test_rejected_before_any_write(self, db: Session, operations: list, code: str):
+        with pytest.raises(DomainError) as exc:
+            _run(db, *operations)
+        assert exc.value.code == code
+        assert db.exec(select(Project)).all() == []
+
+    def test_cache_invalidated_on_commit(self, db: Session, story: Story):
+        entity_cache.set("story", story.id, sch.StoryOut.model_validate(story))
+        result = _run(db, {"op": "update_story", "args": {"story_id": str(story.id), "title": "Renommée"}})
+
+        assert result.committed
+        assert entity_cache.get("story", story.id, sch.StoryOut) is None
+
+    @pytest.mark.parametrize("stories", [3, 12])
+    def test_queries_bounded_per_operation(self, db: Session, project: Project, stories: int):
+        instrumentation.install(db.get_bind())
+        pid = str(project.id)
+        operations = [{"op": "create_sprint", "args": {"project_id": pid, "name": "S1"}, "ref": "sprint"}]
+        for i in range(stories):
+            operations += [
+                {"op": "create_story", "args": {"project_id": pid, "title": f"S{i}"}, "ref": f"s{i}"},
+                {"op": "create_story_description", "args": {"story_id": f"$s{i}", "description": "D"}},
+                {"op": "add_story_to_sprint", "args": {"sprint_id": "$sprint", "story_id": f"$s{i}"}},
+            ]
+
+        with instrumentation.track("batch") as stats:
+            result = _run(db, *operations)
+
+        assert result.committed
+        selects = {sql: n for sql, n in stats.statements.items() if sql.lstrip().upper().startswith("SELECT")}
+        # Verrous du sprint et de la story à chaque affectation, aucune autre relecture
+        assert list(selects.values()) == [stories, stories]
+        # Par story : INSERT story, INSERT description, deux verrous, UPDATE + INSERT du lien, rollup
+        assert stats.count == 1 + 7 * stories
+
@@ -0,0 +1,162 @@
+"""
+Tests unitaires pour le cache d'entités (app/services/cache.py).
+
+Couvre :
+- LRU : éviction, expiration (TTL)
+- Backend partagé via un substitut local de client Redis
+- Read-through et compteurs hits / misses
+- Invalidation au commit (services, ORM) et non-invalidation au rollback
+- Intégration REST : lecture en cache puis invalidation par PATCH
+"""
+
+from __future__ import annotations
+
+import fnmatch
+from uuid import uuid4
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from app.models import schemas as sch
+from app.models.domain import Story, StoryDescription, StoryStatus
+from app.services import cache as cache_module
+from app.services.cache import EntityCache, LRUBackend, RedisBackend, entity_cache
+from app.services.stories import update_story
+
+
+class FakeRedis:
+    """Substitut minimal d'un client Redis (get / set ex= / delete / scan_iter)."""
+
+    def __init__(self) -> None:
+        self.data: dict[str, bytes] = {}
+        self.ttls: dict[str, int] = {}
+
+    def get(self, name: str):
+        return self.data.get(name)
+
+    def set(self, name: str, value: str, ex: int | None = None) -> None:
+        self.data[name] = value.encode()
+        if ex is not None:
+            self.ttls[name] = ex
+
+    def delete(self, *names: str) -> None:
+        for name in names:
+            self.data.pop(name, None)
+
+    def scan_iter(self, match: str = "*"):
+        return [k for k in list(self.data) if fnmatch.fnmatch(k, match)]
+
+
+def _story_out(story: Story) -> sch.StoryOut:
+    return sch.StoryOut.model_validate(story)
+
+
+class TestLRUBackend:
+    def test_eviction_is_lru(self):
+        backend = LRUBackend(max_entries=2)
+        backend.set("a", "1", ttl=60)
+        backend.set("b", "2", ttl=60)
+        assert backend.get("a") == "1"  # "a" devient le plus récent
+        backend.set("c", "3", ttl=60)
+        assert backend.get("b") is None
+        assert backend.get("a") == "1"
+        assert backend.get("c") == "3"
+
+    def test_expiration(self, monkeypatch: pytest.MonkeyPatch):
+        now = [1000.0]
+        monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+        backend = LRUBackend()
+        backend.set("a", "1", ttl=10)
+        now[0] += 9
+        assert backend.get("a") == "1"
+        now[0] += 2
+        assert backend.get("a") is None
+        assert len(backend) == 0
+
+
+class TestEntityCache:
+    def test_read_through_counts_hits_and_misses(self, story: Story):
+        cache = EntityCache(LRUBackend(), ttl=60)
+        loads = []
+
+        def load():
+            loads.append(1)
+            return story
+
+        for _ in range(3):
+            out = cache.read_through("story", story.id, sch.StoryOut, load)
+            assert out == _story_out(story)
+
+        assert len(loads) == 1
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"]) == (2, 1)
+        assert stats["by_kind"]["story"] == {"hits": 2, "misses": 1}
+
+    def test_missing_entity_is_not_cached(self):
+        cache = EntityCache(LRUBackend(), ttl=60)
+        assert cache.read_through("story", uuid4(), sch.StoryOut, lambda: None) is None
+        assert cache.stats()["misses"] == 1
+
+    def test_shared_backend(self, story: Story):
+        client = FakeRedis()
+        writer = EntityCache(RedisBackend(client), ttl=30)
+        reader = EntityCache(RedisBackend(client), ttl=30)
+
+        writer.set("story", story.id, _story_out(story))
+        assert reader.get("story", story.id, sch.StoryOut) == _story_out(story)
+        assert client.ttls == {f"ltm:cache:story:{story.id}": 30}
+
+        reader.invalidate("story", story.id)
+        assert writer.get("story", story.id, sch.StoryOut) is None
+
+        writer.set("story", story.id, _story_out(story))
+        writer.clear()
+        assert client.data == {}
+
+
+class TestInvalidation:
+    def test_service_update_invalidates(self, db: Session, story: Story):
+        entity_cache.set("story", story.id, _story_out(story))
+
+        update_story(db, story.id, sch.StoryUpdate(status=StoryStatus.TODO))
+
+        assert entity_cache.get("story", story.id, sch.StoryOut) is None
+
+    def test_description_keyed_by_story(self, db: Session, story: Story):
+        desc = StoryDescription(story_id=story.id, description="v1")
+        db.add(desc)
+        db.commit()
+        entity_cache.set("story_description", story.id, sch.StoryDescriptionOut.model_validate(desc))
+
+        desc.description = "v2"
+        db.add(desc)
+        db.commit()
+
+        assert entity_cache.get("story_description", story.id, sch.StoryDescriptionOut) is None
+
+    def test_rollback_keeps_entry(self, db: Session, story: Story):
+        entity_cache.set("story", story.id, _story_out(story))
+
+        story.title = "Jamais commité"
+        db.add(story)
+        db.flush()
+        db.rollback()
+
+        assert entity_cache.get("story", story.id, sch.StoryOut) is not None
+
+
+class TestRestCache:
+    def test_get_is_cached_and_patch_invalidates(self, client: TestClient):
+        resp = client.post("/v1/projects", json={"name": "CacheProj"})
+        project_id = resp.json()["id"]
+        resp = client.post("/v1/epics", json={"project_id": project_id, "title": "v1"})
+        epic_id = resp.json()["id"]
+
+        client.get(f"/v1/epics/{epic_id}")
+        client.get(f"/v1/epics/{epic_id}")
+        stats = client.get("/cache/stats").json()
+        assert stats["by_kind"]["epic"] == {"hits": 1, "misses": 1}
+
+        client.patch(f"/v1/epics/{epic_id}", json={"title": "v2"})
+        assert client.get(f"/v1/epics/{epic_id}").json()["title"] == "v2"
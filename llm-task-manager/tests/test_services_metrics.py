@@ -0,0 +1,80 @@
+"""
+Tests des métriques Prometheus (app/services/metrics.py et ``GET /metrics``).
+
+Couvre :
+- Histogramme : buckets cumulés, somme, total
+- Compteur par labels, échappement des valeurs
+- Saturation d'un pool borné
+- Exposition HTTP : latence par gabarit de route, erreurs métier par code,
+  hits / misses du cache d'entités par type
+"""
+
+from __future__ import annotations
+
+from uuid import uuid4
+
+from fastapi.testclient import TestClient
+from sqlalchemy.pool import QueuePool
+from sqlmodel import create_engine
+
+from app.models.domain import Story
+from app.services import metrics
+
+
+class TestHistogram:
+    def test_buckets_are_cumulative(self):
+        histogram = metrics.Histogram("t_seconds", "Test.", ("route",), buckets=(0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 3.0):
+            histogram.observe(value, "/a")
+
+        lines = histogram.render()
+        assert 't_seconds_bucket{route="/a",le="0.1"} 2' in lines
+        assert 't_seconds_bucket{route="/a",le="1"} 3' in lines
+        assert 't_seconds_bucket{route="/a",le="+Inf"} 4' in lines
+        assert 't_seconds_sum{route="/a"} 3.650000' in lines
+        assert 't_seconds_count{route="/a"} 4' in lines
+
+
+class TestCounter:
+    def test_labels_escaped(self):
+        counter = metrics.Counter("t_total", "Test.", ("code",))
+        counter.inc('A"B')
+        counter.inc('A"B')
+        assert 't_total{code="A\\"B"} 2' in counter.render()
+
+
+class TestPoolWatch:
+    def test_exhausted_checkouts_counted(self, tmp_path):
+        engine = create_engine(
+            f"sqlite:///{tmp_path / 'pool.db'}", poolclass=QueuePool, pool_size=1, max_overflow=1
+        )
+        metrics.watch_pool(engine, "test")
+        before = metrics.POOL_EXHAUSTED.value("test")
+        with engine.connect(), engine.connect():
+            body = metrics.render({"test": engine.pool})
+        assert metrics.POOL_EXHAUSTED.value("test") == before + 1
+        assert 'db_pool_checked_out{pool="test"} 2' in body
+        engine.dispose()
+
+
+class TestMetricsEndpoint:
+    def test_route_latency_and_domain_errors(self, client: TestClient):
+        client.patch(f"/v1/stories/{uuid4()}", json={"title": "Nope"})
+        resp = client.get("/metrics")
+        assert resp.status_code == 200
+        assert resp.headers["content-type"].startswith("text/plain")
+        body = resp.text
+        assert (
+            'http_request_duration_seconds_count{method="PATCH",route="/v1/stories/{story_id}",status="404"}'
+            in body
+        )
+        assert 'domain_errors_total{code="STORY_NOT_FOUND"}' in body
+
+    def test_entity_cache_counters(self, client: TestClient, story: Story):
+        client.get(f"/v1/stories/{story.id}")
+        client.get(f"/v1/stories/{story.id}")
+        body = client.get("/metrics").text
+        assert "# TYPE entity_cache_hits_total counter" in body
+        assert 'entity_cache_hits_total{kind="story"} 1' in body
+        assert 'entity_cache_misses_total{kind="story"} 1' in body
+
@@ -0,0 +1,97 @@
+"""
+Tests unitaires pour la pagination par curseur (app/services/pagination.py).
+
+Couvre :
+- Aller-retour encodage / décodage du curseur
+- Curseur malformé
+- Parcours complet sans doublon ni trou, y compris à ``created_at`` égal
+- Bornage de ``limit``
+- Tri keyset servi par un index composite (pas de tri en mémoire)
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+import pytest
+from sqlalchemy import text
+from sqlmodel import Session, select
+
+from app.models.domain import Project, Story, StoryStatus
+from app.services.errors import DomainError
+from app.services.pagination import (
+    MAX_PAGE_SIZE,
+    clamp_limit,
+    decode_cursor,
+    apply_cursor,
+    encode_cursor,
+    paginate,
+)
+
+
+class TestCursorEncoding:
+    def test_round_trip(self, story: Story):
+        cursor = encode_cursor(story.created_at, story.id)
+        assert decode_cursor(cursor) == (story.created_at, story.id)
+
+    @pytest.mark.parametrize("cursor", ["???", "bm90LWpzb24", "WzFd"])
+    def test_malformed_cursor(self, cursor: str):
+        with pytest.raises(DomainError) as exc_info:
+            decode_cursor(cursor)
+        assert exc_info.value.code == "INVALID_CURSOR"
+        assert exc_info.value.http_status == 400
+
+
+class TestPaginate:
+    def test_walk_with_identical_timestamps(self, db: Session, project: Project):
+        """Les ex aequo sur ``created_at`` sont départagés par ``id``."""
+        same_instant = datetime(2026, 1, 1, 12, 0, 0)
+        stories = [
+            Story(project_id=project.id, title=f"S{i}", story_points=1, created_at=same_instant)
+            for i in range(7)
+        ]
+        db.add_all(stories)
+        db.commit()
+
+        seen = []
+        cursor = None
+        pages = 0
+        while True:
+            page = paginate(db, select(Story), Story, cursor, limit=3)
+            seen.extend(s.id for s in page.items)
+            pages += 1
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+
+        assert pages == 3
+        assert len(seen) == len(set(seen)) == 7
+
+    def test_last_page_has_no_cursor(self, db: Session, story: Story):
+        page = paginate(db, select(Story), Story, limit=1)
+        assert [s.id for s in page.items] == [story.id]
+        assert page.next_cursor is None
+
+    def test_clamp_limit(self):
+        assert clamp_limit(None) > 0
+        assert clamp_limit(0) == 1
+        assert clamp_limit(10_000) == MAX_PAGE_SIZE
+
+
+class TestKeysetIndexes:
+    @pytest.mark.parametrize(
+        ("where", "index"),
+        [
+            (None, "ix_stories_created_at"),
+            (Story.status == StoryStatus.TODO, "ix_stories_status_created_at"),
+            (Story.assignee == "ann", "ix_stories_assignee_created_at"),
+        ],
+    )
+    def test_page_query_uses_composite_index(self, db: Session, where, index: str):
+        stmt = select(Story) if where is None else select(Story).where(where)
+        sql = apply_cursor(stmt, Story, None, 10).compile(
+            db.get_bind(), compile_kwargs={"literal_binds": True}
+        )
+        plan = " ".join(row[-1] for row in db.exec(text(f"EXPLAIN QUERY PLAN {sql}")))
+        assert index in plan
+        assert "TEMP B-TREE" not in plan
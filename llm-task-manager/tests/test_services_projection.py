@@ -0,0 +1,61 @@
+"""
+Tests unitaires de la projection des réponses (app/services/projection.py).
+
+Couvre :
+- Résolution ``view`` / ``fields`` (ordre du schéma, ``id`` toujours inclus)
+- Champs ou vue inconnus
+- ``SELECT`` restreint aux colonnes demandées (plus la clé de pagination)
+- Sérialisation identique à la vue complète sur les champs retenus
+"""
+
+from __future__ import annotations
+
+import pytest
+from sqlmodel import Session, select
+
+from app.models import schemas as sch
+from app.models.domain import Project, Story
+from app.services import projection
+from app.services.errors import DomainError
+from app.services.pagination import paginate
+
+
+class TestResolveFields:
+    def test_full_view_is_unprojected(self):
+        assert projection.resolve_fields(sch.StoryOut) is None
+        assert projection.resolve_fields(sch.StoryOut, "full") is None
+
+    def test_compact_view(self):
+        fields = projection.resolve_fields(sch.StoryOut, sch.ResponseView.COMPACT)
+        assert fields == projection.COMPACT_FIELDS[sch.StoryOut]
+        assert "created_at" not in fields
+
+    def test_explicit_fields_in_schema_order_with_id(self):
+        fields = projection.resolve_fields(sch.StoryOut, "compact", ["status", " title", "status"])
+        assert fields == ("id", "title", "status")
+
+    @pytest.mark.parametrize(("view", "fields"), [("tiny", None), ("full", ["title", "password"])])
+    def test_invalid(self, view: str, fields):
+        with pytest.raises(DomainError) as exc_info:
+            projection.resolve_fields(sch.StoryOut, view, fields)
+        assert exc_info.value.code == "INVALID_FIELDS"
+        assert exc_info.value.http_status == 400
+
+
+class TestLoadFields:
+    def test_select_only_requested_columns(self, db: Session, story: Story, capture_sql):
+        fields = ("id", "title", "status")
+        db.expunge_all()
+        with capture_sql() as statements:
+            page = paginate(db, projection.load_fields(select(Story), Story, fields), Story)
+
+        columns = statements[0].split(" FROM ")[0]
+        assert "stories.title" in columns and "stories.created_at" in columns
+        assert "stories.assignee" not in columns and "stories.project_id" not in columns
+        assert projection.dump_fields(page.items, fields) == [
+            sch.StoryOut.model_validate(story).model_dump(include=set(fields))
+        ]
+
+    def test_full_view_keeps_statement(self, project: Project):
+        stmt = select(Project)
+        assert projection.load_fields(stmt, Project, None) is stmt
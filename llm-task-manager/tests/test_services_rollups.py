@@ -0,0 +1,149 @@
+"""
+Tests unitaires pour les rollups de progression (app/services/rollups.py).
+
+Couvre :
+- Mise à jour incrémentale par create_story / update_story
+- Affectation, déplacement et retrait d'une story de sprint
+- Cohérence avec un recalcul complet (rebuild_rollups) et réparation d'une dérive
+- Atomicité : rollback de l'écriture = rollback du rollup
+- Lecture : 404 sur epic / sprint inconnu
+"""
+
+from __future__ import annotations
+
+from uuid import uuid4
+
+import pytest
+from sqlmodel import Session, delete, select
+
+from app.models import ProgressRollup
+from app.models import schemas as sch
+from app.models.domain import Epic, Project, RollupScope, Sprint, StoryStatus
+from app.services import rollups
+from app.services.errors import DomainError
+from app.services.sprints import add_story_to_sprint, remove_story_from_sprint
+from app.services.stories import create_story, update_story
+
+
+def _counts(db: Session, scope: RollupScope, scope_id) -> dict[str, tuple[int, int]]:
+    progress = rollups.get_progress(db, scope, scope_id)
+    return {b.key: (b.count, b.points) for b in progress.by_status if b.count or b.points}
+
+
+def _snapshot(db: Session) -> set[tuple]:
+    return {
+        (r.scope_type, r.scope_id, r.status, r.story_count, r.story_points)
+        for r in db.exec(select(ProgressRollup)).all()
+        if r.story_count or r.story_points
+    }
+
+
+def _new_story(db: Session, project: Project, epic: Epic | None = None, points: int = 3):
+    return create_story(
+        db,
+        sch.StoryCreate(
+            project_id=project.id,
+            epic_id=epic.id if epic else None,
+            title="Rollup",
+            story_points=points,
+        ),
+    )
+
+
+class TestIncrementalMaintenance:
+    def test_create_and_update_story(self, db: Session, project: Project, epic: Epic):
+        story = _new_story(db, project, epic, points=3)
+        _new_story(db, project, epic, points=5)
+        assert _counts(db, RollupScope.EPIC, epic.id) == {"backlog": (2, 8)}
+
+        update_story(db, story.id, sch.StoryUpdate(status=StoryStatus.TODO, story_points=8))
+        assert _counts(db, RollupScope.EPIC, epic.id) == {"backlog": (1, 5), "todo": (1, 8)}
+
+        progress = rollups.get_progress(db, RollupScope.EPIC, epic.id)
+        assert (progress.story_count, progress.story_points) == (2, 13)
+        assert (progress.done_count, progress.done_points) == (0, 0)
+
+    def test_move_story_between_epics(self, db: Session, project: Project, epic: Epic):
+        other = Epic(project_id=project.id, title="Other")
+        db.add(other)
+        db.commit()
+        story = _new_story(db, project, epic)
+
+        update_story(db, story.id, sch.StoryUpdate(epic_id=other.id))
+
+        assert _counts(db, RollupScope.EPIC, epic.id) == {}
+        assert _counts(db, RollupScope.EPIC, other.id) == {"backlog": (1, 3)}
+
+    def test_sprint_membership(self, db: Session, project: Project, sprint: Sprint):
+        sprint2 = Sprint(project_id=project.id, name="Sprint 2")
+        db.add(sprint2)
+        db.commit()
+        story = _new_story(db, project, points=5)
+
+        add_story_to_sprint(db, sprint.id, story.id)
+        assert _counts(db, RollupScope.SPRINT, sprint.id) == {"backlog": (1, 5)}
+
+        # Un changement de statut suit la story dans son sprint actif
+        update_story(db, story.id, sch.StoryUpdate(status=StoryStatus.TODO))
+        assert _counts(db, RollupScope.SPRINT, sprint.id) == {"todo": (1, 5)}
+
+        # Déplacement : le lien actif précédent est désactivé
+        add_story_to_sprint(db, sprint2.id, story.id)
+        assert _counts(db, RollupScope.SPRINT, sprint.id) == {}
+        assert _counts(db, RollupScope.SPRINT, sprint2.id) == {"todo": (1, 5)}
+
+        remove_story_from_sprint(db, sprint2.id, story.id)
+        assert _counts(db, RollupScope.SPRINT, sprint2.id) == {}
+
+    def test_readding_to_same_sprint_is_idempotent(self, db: Session, project: Project, sprint: Sprint):
+        story = _new_story(db, project)
+        add_story_to_sprint(db, sprint.id, story.id)
+        add_story_to_sprint(db, sprint.id, story.id)
+        assert _counts(db, RollupScope.SPRINT, sprint.id) == {"backlog": (1, 3)}
+
+    def test_failed_write_leaves_rollups_untouched(self, db: Session, project: Project, epic: Epic):
+        story = _new_story(db, project, epic)
+        before = _snapshot(db)
+
+        with pytest.raises(DomainError):
+            update_story(db, story.id, sch.StoryUpdate(status=StoryStatus.DONE))
+        db.rollback()
+
+        assert _snapshot(db) == before
+
+
+class TestRebuild:
+    def test_incremental_matches_rebuild(self, db: Session, project: Project, epic: Epic, sprint: Sprint):
+        stories = [_new_story(db, project, epic, points=p) for p in (1, 2, 3)]
+        _new_story(db, project, points=8)
+        add_story_to_sprint(db, sprint.id, stories[0].id)
+        add_story_to_sprint(db, sprint.id, stories[1].id)
+        update_story(db, stories[1].id, sch.StoryUpdate(status=StoryStatus.TODO))
+        remove_story_from_sprint(db, sprint.id, stories[0].id)
+
+        incremental = _snapshot(db)
+        rollups.rebuild_rollups(db.connection())
+        db.commit()
+        assert _snapshot(db) == incremental
+
+    def test_rebuild_repairs_drift(self, db: Session, project: Project, epic: Epic):
+        _new_story(db, project, epic, points=5)
+        db.exec(delete(ProgressRollup))
+        db.commit()
+        assert _counts(db, RollupScope.EPIC, epic.id) == {}
+
+        rollups.rebuild_rollups(db.connection())
+        db.commit()
+        assert _counts(db, RollupScope.EPIC, epic.id) == {"backlog": (1, 5)}
+
+
+class TestGetProgress:
+    @pytest.mark.parametrize(
+        ("scope", "code"),
+        [(RollupScope.EPIC, "EPIC_NOT_FOUND"), (RollupScope.SPRINT, "SPRINT_NOT_FOUND")],
+    )
+    def test_unknown_scope(self, db: Session, scope: RollupScope, code: str):
+        with pytest.raises(DomainError) as exc_info:
+            rollups.get_progress(db, scope, uuid4())
+        assert exc_info.value.code == code
+        assert exc_info.value.http_status == 404
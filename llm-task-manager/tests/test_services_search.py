@@ -0,0 +1,137 @@
+"""
+Tests unitaires pour la recherche plein texte (app/services/search.py).
+
+Couvre :
+- Synchronisation de l'index par triggers (création, modification, suppression)
+- Indexation des descriptions de stories et du contenu des documents
+- Classement (un titre pèse plus qu'un corps) et extraits
+- Filtres par type d'entité et par projet
+- Plafond de résultats par type (recherche unifiée)
+- Requêtes vides ou contenant de la syntaxe FTS
+"""
+
+from __future__ import annotations
+
+from sqlmodel import Session, text
+
+from app.models.domain import (
+    Document,
+    Epic,
+    Project,
+    SearchEntityType,
+    Story,
+    StoryDescription,
+)
+from app.models.search_index import rebuild_search_index
+from app.services.search import search
+
+
+def _ids(hits) -> list:
+    return [h.id for h in hits]
+
+
+class TestIndexSync:
+    def test_insert_update_delete(self, db: Session, story: Story):
+        assert _ids(search(db, "story test")) == [story.id]
+
+        story.title = "Capteur vibration"
+        db.add(story)
+        db.commit()
+        assert search(db, "story") == []
+        assert _ids(search(db, "vibration")) == [story.id]
+
+        db.delete(story)
+        db.commit()
+        assert search(db, "vibration") == []
+
+    def test_story_description_is_indexed(self, db: Session, story: Story):
+        desc = StoryDescription(
+            story_id=story.id,
+            description="Notifier l'opérateur",
+            acceptance_criteria="Seuil critique dépassé",
+        )
+        db.add(desc)
+        db.commit()
+
+        hits = search(db, "seuil critique")
+        assert _ids(hits) == [story.id]
+        assert "[Seuil]" in hits[0].snippet
+
+        desc.acceptance_criteria = "Alarme sonore"
+        db.add(desc)
+        db.commit()
+        assert search(db, "seuil") == []
+        assert _ids(search(db, "alarme")) == [story.id]
+
+    def test_document_content_is_indexed(self, db: Session, project: Project):
+        doc = Document(project_id=project.id, title="Vision", content="Maintenance prédictive")
+        db.add(doc)
+        db.commit()
+        # Recherche insensible aux accents et par préfixe
+        assert _ids(search(db, "predict")) == [doc.id]
+
+    def test_rebuild_repairs_drift(self, db: Session, story: Story):
+        db.exec(text("DELETE FROM search_entries"))
+        db.commit()
+        assert search(db, "story") == []
+
+        rebuild_search_index(db.connection())
+        db.commit()
+        assert _ids(search(db, "story")) == [story.id]
+
+
+class TestSearchQuery:
+    def test_title_ranks_above_body(self, db: Session, project: Project):
+        in_body = Document(project_id=project.id, title="Notes", content="rotation des shifts")
+        in_title = Document(project_id=project.id, title="Rotation", content="planning")
+        db.add_all([in_body, in_title])
+        db.commit()
+
+        hits = search(db, "rotation")
+        assert _ids(hits) == [in_title.id, in_body.id]
+        assert hits[0].rank > hits[1].rank
+
+    def test_filters(self, db: Session, project: Project):
+        other = Project(name="Autre")
+        db.add(other)
+        db.commit()
+        epic = Epic(project_id=project.id, title="Dashboard usine")
+        story = Story(project_id=project.id, title="Dashboard shift", story_points=1)
+        foreign = Story(project_id=other.id, title="Dashboard ailleurs", story_points=1)
+        db.add_all([epic, story, foreign])
+        db.commit()
+
+        assert len(search(db, "dashboard")) == 3
+        assert _ids(search(db, "dashboard", entity_types=[SearchEntityType.EPIC])) == [epic.id]
+        hits = search(
+            db, "dashboard", entity_types=[SearchEntityType.STORY], project_id=project.id,
+        )
+        assert _ids(hits) == [story.id]
+
+    def test_query_syntax_is_neutralised(self, db: Session, story: Story):
+        assert search(db, '   "*') == []
+        assert _ids(search(db, 'story: "test")*')) == [story.id]
+
+    def test_limit(self, db: Session, project: Project):
+        db.add_all(
+            [Story(project_id=project.id, title=f"Alerte {i}", story_points=1) for i in range(5)]
+        )
+        db.commit()
+        assert len(search(db, "alerte", limit=2)) == 2
+
+    def test_per_type_limit(self, db: Session, project: Project):
+        db.add_all(
+            [Story(project_id=project.id, title=f"Usine {i}", story_points=1) for i in range(4)]
+            + [Epic(project_id=project.id, title=f"Usine epic {i}") for i in range(3)]
+            + [Document(project_id=project.id, title="Usine", content="")]
+        )
+        db.commit()
+
+        hits = search(db, "usine", per_type_limit=2)
+        by_type = {t: sum(h.entity_type == t for h in hits) for t in SearchEntityType}
+        assert by_type == {
+            SearchEntityType.STORY: 2,
+            SearchEntityType.EPIC: 2,
+            SearchEntityType.DOCUMENT: 1,
+        }
+        assert [h.rank for h in hits] == sorted((h.rank for h in hits), reverse=True)
@@ -6,30 +6,38 @@ Couvre :
 - Clôture d'un sprint (bloquée si stories non done)
 - Affectation story ↔ sprint (StorySprintHistory)
 - Retrait de story du sprint
-- Une story ne peut être active que dans un seul sprint
+- Une story ne peut être active que dans un seul sprint (index unique partiel)
+- Ajout / retrait par lot (un UPDATE, un INSERT, un commit)
 """
 
 from __future__ import annotations
 
+import re
 from uuid import uuid4
 
 import pytest
-from sqlmodel import Session
+from sqlalchemy import update
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session, select
 
 from app.models.domain import (
     Project,
+    RollupScope,
     Sprint,
     SprintStatus,
     Story,
     StorySprintHistory,
     StoryStatus,
 )
+from app.services import rollups
+from app.services import sprints as sprint_service
 from app.services.errors import DomainError
 from app.services.sprints import (
     add_story_to_sprint,
     close_sprint,
     remove_story_from_sprint,
     start_sprint,
+    update_sprint_stories,
 )
 
 
@@ -121,6 +129,35 @@ class TestCloseSprint:
         assert exc_info.value.code == "SPRINT_CLOSE_BLOCKED"
         assert exc_info.value.http_status == 409
 
+    def test_close_sprint_ignores_inactive_links(
+        self, db: Session, project: Project, sprint: Sprint,
+    ):
+        """Une story retirée du sprint (lien inactif) ne bloque pas la clôture."""
+        story = Story(project_id=project.id, title="Moved", status=StoryStatus.TODO)
+        db.add(story)
+        db.commit()
+        db.add(StorySprintHistory(story_id=story.id, sprint_id=sprint.id, is_active=False))
+        db.commit()
+
+        assert close_sprint(db, sprint.id).status == SprintStatus.CLOSED
+
+    def test_close_sprint_does_not_load_stories(
+        self, db: Session, project: Project, sprint: Sprint, capture_sql,
+    ):
+        """La vérification est une seule requête EXISTS, sans charger les stories."""
+        for i in range(20):
+            story = Story(project_id=project.id, title=f"S{i}", status=StoryStatus.DONE)
+            db.add(story)
+            db.add(StorySprintHistory(story_id=story.id, sprint_id=sprint.id, is_active=True))
+        db.commit()
+
+        with capture_sql() as statements:
+            close_sprint(db, sprint.id)
+
+        reads = [s for s in statements if re.search(r"\b(stories|story_sprint_history)\b", s)]
+        assert len(reads) == 1
+        assert reads[0].upper().startswith("SELECT EXISTS")
+
     def test_close_sprint_not_found(self, db: Session):
         with pytest.raises(DomainError) as exc_info:
             close_sprint(db, uuid4())
@@ -214,6 +251,38 @@ class TestAddStoryToSprint:
         ).first()
         assert new_link is not None
 
+    def test_add_story_without_reading_links(
+        self, db: Session, project: Project, sprint: Sprint, story: Story, capture_sql,
+    ):
+        """Désactivation puis insertion, sans SELECT préalable des liens actifs."""
+        other = Sprint(project_id=project.id, name="Other", status=SprintStatus.ACTIVE)
+        db.add(other)
+        db.commit()
+        add_story_to_sprint(db, other.id, story.id)
+
+        with capture_sql() as statements:
+            add_story_to_sprint(db, sprint.id, story.id)
+
+        links = [s.split()[0] for s in statements if "story_sprint_history" in s]
+        assert links == ["UPDATE", "INSERT"]
+
+    def test_second_active_link_rejected_by_index(
+        self, db: Session, project: Project, sprint: Sprint, story: Story,
+    ):
+        other = Sprint(project_id=project.id, name="Other", status=SprintStatus.ACTIVE)
+        db.add(other)
+        db.commit()
+        add_story_to_sprint(db, sprint.id, story.id)
+
+        db.add(StorySprintHistory(story_id=story.id, sprint_id=other.id, is_active=True))
+        with pytest.raises(IntegrityError):
+            db.commit()
+        db.rollback()
+
+        # Les liens inactifs, eux, peuvent s'accumuler
+        db.add(StorySprintHistory(story_id=story.id, sprint_id=other.id, is_active=False))
+        db.commit()
+
     def test_add_nonexistent_story(self, db: Session, sprint: Sprint):
         with pytest.raises(DomainError) as exc_info:
             add_story_to_sprint(db, sprint.id, uuid4())
@@ -251,3 +320,111 @@ class TestRemoveStoryFromSprint:
         with pytest.raises(DomainError) as exc_info:
             remove_story_from_sprint(db, sprint.id, story.id)
         assert exc_info.value.code == "ACTIVE_LINK_NOT_FOUND"
+
+
+# ---------------------------------------------------------------------------
+# update_sprint_stories
+# ---------------------------------------------------------------------------
+
+
+class TestUpdateSprintStories:
+    def _stories(self, db: Session, project: Project, count: int) -> list[Story]:
+        stories = [Story(project_id=project.id, title=f"S{i}", story_points=2) for i in range(count)]
+        db.add_all(stories)
+        db.commit()
+        return stories
+
+    def test_batch_add_and_remove(self, db: Session, project: Project, sprint: Sprint, capture_sql):
+        other = Sprint(project_id=project.id, name="Other", status=SprintStatus.PLANNED)
+        db.add(other)
+        db.commit()
+        fresh, moved, kept, leaving = (s.id for s in self._stories(db, project, 4))
+        add_story_to_sprint(db, other.id, moved)
+        add_story_to_sprint(db, sprint.id, kept)
+        add_story_to_sprint(db, sprint.id, leaving)
+        missing, unknown = uuid4(), uuid4()
+
+        with capture_sql() as statements:
+            result = update_sprint_stories(
+                db, sprint.id, add=[fresh, moved, kept, missing], remove=[leaving, unknown]
+            )
+
+        assert result.added == [fresh, moved]
+        assert result.removed == [leaving]
+        assert result.unchanged == [kept]
+        assert {(r.id, r.code) for r in result.rejected} == {
+            (missing, "STORY_NOT_FOUND"),
+            (unknown, "STORY_NOT_FOUND"),
+        }
+        writes = [s for s in statements if re.match(r"(UPDATE|INSERT INTO) story_sprint_history", s)]
+        assert [w.split()[0] for w in writes] == ["UPDATE", "INSERT"]
+
+        active = set(
+            db.exec(
+                select(StorySprintHistory.story_id).where(
+                    StorySprintHistory.sprint_id == sprint.id,
+                    StorySprintHistory.is_active.is_(True),
+                )
+            ).all()
+        )
+        assert active == {fresh, moved, kept}
+        assert db.exec(
+            select(StorySprintHistory).where(
+                StorySprintHistory.story_id == moved,
+                StorySprintHistory.is_active.is_(True),
+            )
+        ).one().sprint_id == sprint.id
+
+        assert rollups.get_progress(db, RollupScope.SPRINT, sprint.id).story_count == 3
+        assert rollups.get_progress(db, RollupScope.SPRINT, other.id).story_count == 0
+
+    def test_rollups_follow_deactivated_links(
+        self, db: Session, project: Project, sprint: Sprint, monkeypatch: pytest.MonkeyPatch
+    ):
+        first = Sprint(project_id=project.id, name="First", status=SprintStatus.PLANNED)
+        second = Sprint(project_id=project.id, name="Second", status=SprintStatus.PLANNED)
+        db.add_all([first, second])
+        db.commit()
+        (story,) = self._stories(db, project, 1)
+        add_story_to_sprint(db, first.id, story.id)
+
+        deactivate = sprint_service._deactivate_links
+
+        def _moved_concurrently(session: Session, *criteria):  # noqa: ANN202
+            # Le lien change de sprint entre la lecture et l'``UPDATE``
+            session.exec(
+                update(StorySprintHistory)
+                .where(StorySprintHistory.story_id == story.id)
+                .values(sprint_id=second.id)
+            )
+            state = rollups.story_state(story, sprint_id=None)
+            rollups.record_story_change(
+                session, state._replace(sprint_id=first.id), state._replace(sprint_id=second.id)
+            )
+            return deactivate(session, *criteria)
+
+        monkeypatch.setattr(sprint_service, "_deactivate_links", _moved_concurrently)
+        result = update_sprint_stories(db, sprint.id, add=[story.id])
+
+        assert result.added == [story.id]
+        counts = {
+            s.id: rollups.get_progress(db, RollupScope.SPRINT, s.id).story_count
+            for s in (first, second, sprint)
+        }
+        assert counts == {first.id: 0, second.id: 0, sprint.id: 1}
+
+    def test_remove_requires_active_link(self, db: Session, project: Project, sprint: Sprint):
+        (story,) = self._stories(db, project, 1)
+        result = update_sprint_stories(db, sprint.id, remove=[story.id])
+        assert result.removed == []
+        assert [r.code for r in result.rejected] == ["ACTIVE_LINK_NOT_FOUND"]
+
+    def test_sprint_not_found(self, db: Session):
+        with pytest.raises(DomainError) as exc_info:
+            update_sprint_stories(db, uuid4(), add=[uuid4()])
+        assert exc_info.value.code == "SPRINT_NOT_FOUND"
+
+    def test_add_and_remove_same_story(self, db: Session, sprint: Sprint, story: Story):
+        with pytest.raises(DomainError) as exc_info:
+            update_sprint_stories(db, sprint.id, add=[story.id], remove=[story.id])
+        assert exc_info.value.code == "INVALID_SELECTION"
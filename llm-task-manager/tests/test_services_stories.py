@@ -6,6 +6,8 @@ Couvre :
 - Workflow strict des statuts (backlog → todo → in_progress → in_review → done)
 - Impossibilité de quitter l'état done
 - Création et mise à jour de stories
+- Création par lot (un seul INSERT, erreurs par élément)
+- Transitions de statut en masse (un seul UPDATE, rejets motivés)
 """
 
 from __future__ import annotations
@@ -13,17 +15,30 @@ from __future__ import annotations
 from uuid import uuid4
 
 import pytest
-from sqlmodel import Session
-
-from app.models.domain import Project, Story, StoryPriority, StoryStatus
-from app.models.schemas import StoryCreate, StoryUpdate
+from sqlmodel import Session, select
+
+from app.models.domain import (
+    Project,
+    RollupScope,
+    Sprint,
+    Story,
+    StoryPriority,
+    StoryStatus,
+)
+from app.models.schemas import StoryCreate, StoryFilter, StoryOut, StoryUpdate
+from app.services import rollups
+from app.services.cache import entity_cache
 from app.services.errors import DomainError
+from app.services.sprints import add_story_to_sprint
 from app.services.stories import (
     ALLOWED_TRANSITIONS,
     FIBONACCI_STORY_POINTS,
+    MAX_BATCH_SIZE,
     _validate_status_transition,
     _validate_story_points,
+    create_stories,
     create_story,
+    transition_stories,
     update_story,
 )
 
@@ -202,3 +217,128 @@ class TestUpdateStory:
         with pytest.raises(DomainError) as exc_info:
             update_story(db, story.id, StoryUpdate(status=StoryStatus.IN_REVIEW))
         assert exc_info.value.code == "INVALID_STATUS_TRANSITION"
+
+
+# ---------------------------------------------------------------------------
+# create_stories
+# ---------------------------------------------------------------------------
+
+
+class TestCreateStories:
+    def test_single_insert_and_per_item_errors(self, db: Session, project: Project, capture_sql):
+        payloads = [
+            StoryCreate(project_id=project.id, title="A", story_points=3),
+            StoryCreate(project_id=project.id, title="Bad points", story_points=4),
+            StoryCreate(project_id=uuid4(), title="No project"),
+            StoryCreate(project_id=project.id, title="No epic", epic_id=uuid4()),
+            StoryCreate(project_id=project.id, title="B", assignee="bob"),
+        ]
+        with capture_sql() as statements:
+            result = create_stories(db, payloads)
+
+        inserts = [s for s in statements if s.startswith("INSERT INTO stories")]
+        assert len(inserts) == 1
+        assert "RETURNING" in inserts[0]
+        assert [s.title for s in result.created] == ["A", "B"]
+        assert [(e.index, e.code) for e in result.errors] == [
+            (1, "INVALID_STORY_POINTS"),
+            (2, "PROJECT_NOT_FOUND"),
+            (3, "EPIC_NOT_FOUND"),
+        ]
+        stored = db.exec(select(Story).where(Story.project_id == project.id)).all()
+        assert sorted(s.title for s in stored) == ["A", "B"]
+
+    def test_all_invalid_writes_nothing(self, db: Session, project: Project):
+        result = create_stories(db, [StoryCreate(project_id=project.id, title="X", story_points=7)])
+        assert result.created == []
+        assert len(result.errors) == 1
+        assert db.exec(select(Story)).all() == []
+
+    def test_batch_too_large(self, db: Session, project: Project):
+        payloads = [StoryCreate(project_id=project.id, title="X")] * (MAX_BATCH_SIZE + 1)
+        with pytest.raises(DomainError) as exc_info:
+            create_stories(db, payloads)
+        assert exc_info.value.code == "BATCH_TOO_LARGE"
+
+
+# ---------------------------------------------------------------------------
+# transition_stories
+# ---------------------------------------------------------------------------
+
+
+def _make(db: Session, project: Project, status: StoryStatus, points: int = 1) -> Story:
+    story = create_story(db, StoryCreate(project_id=project.id, title=status.value, story_points=points))
+    if status != StoryStatus.BACKLOG:
+        # Passage direct (hors workflow) pour préparer le scénario
+        story.status = status
+        db.add(story)
+        db.commit()
+        rollups.rebuild_rollups(db.connection())
+        db.commit()
+    return story
+
+
+class TestTransitionStories:
+    def test_by_ids_single_update_and_rejections(self, db: Session, project: Project, capture_sql):
+        todo = _make(db, project, StoryStatus.TODO)
+        todo_2 = _make(db, project, StoryStatus.TODO)
+        done = _make(db, project, StoryStatus.DONE)
+        backlog = _make(db, project, StoryStatus.BACKLOG)
+        already = _make(db, project, StoryStatus.IN_PROGRESS)
+        missing = uuid4()
+        old_updated_at = todo.updated_at
+        entity_cache.set("story", todo.id, StoryOut.model_validate(todo))
+
+        with capture_sql() as statements:
+            result = transition_stories(
+                db,
+                StoryStatus.IN_PROGRESS,
+                story_ids=[todo.id, todo_2.id, done.id, backlog.id, already.id, missing],
+            )
+
+        updates = [s for s in statements if s.startswith("UPDATE stories")]
+        assert len(updates) == 1
+        assert set(result.updated) == {todo.id, todo_2.id}
+        assert result.unchanged == [already.id]
+        rejected = {r.id: (r.status, r.code) for r in result.rejected}
+        assert rejected == {
+            done.id: (StoryStatus.DONE, "INVALID_STATUS_TRANSITION"),
+            backlog.id: (StoryStatus.BACKLOG, "INVALID_STATUS_TRANSITION"),
+            missing: (None, "STORY_NOT_FOUND"),
+        }
+
+        db.expire_all()
+        refreshed = db.get(Story, todo.id)
+        assert refreshed.status == StoryStatus.IN_PROGRESS
+        assert refreshed.updated_at > old_updated_at
+        assert db.get(Story, backlog.id).status == StoryStatus.BACKLOG
+        assert entity_cache.get("story", todo.id, StoryOut) is None
+
+    def test_by_filter_moves_sprint_column(self, db: Session, project: Project, sprint: Sprint):
+        in_review = [_make(db, project, StoryStatus.IN_REVIEW, points=3) for _ in range(3)]
+        outside = _make(db, project, StoryStatus.IN_REVIEW)
+        wip = _make(db, project, StoryStatus.IN_PROGRESS)
+        for story in (*in_review, wip):
+            add_story_to_sprint(db, sprint.id, story.id)
+
+        result = transition_stories(
+            db,
+            StoryStatus.DONE,
+            story_filter=StoryFilter(sprint_id=sprint.id, status=StoryStatus.IN_REVIEW),
+        )
+
+        assert set(result.updated) == {s.id for s in in_review}
+        assert result.rejected == []
+        assert db.get(Story, outside.id).status == StoryStatus.IN_REVIEW
+        progress = rollups.get_progress(db, RollupScope.SPRINT, sprint.id)
+        assert (progress.done_count, progress.done_points) == (3, 9)
+
+    @pytest.mark.parametrize(
+        ("story_ids", "story_filter"),
+        [(None, None), (None, StoryFilter()), ([uuid4()], StoryFilter(status=StoryStatus.TODO))],
+    )
+    def test_invalid_selection(self, db: Session, story_ids, story_filter):
+        with pytest.raises(DomainError) as exc_info:
+            transition_stories(db, StoryStatus.TODO, story_ids=story_ids, story_filter=story_filter)
+        assert exc_info.value.code == "INVALID_SELECTION"
+